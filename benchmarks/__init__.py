@@ -0,0 +1,16 @@
+"""
+Benchmark suite of elegant-json.
+
+Synthetic documents of different shapes are generated by ``benchmarks._generate``
+and the hot paths are measured by ``benchmarks._suite``. Run the whole suite
+from the repository root and save the results as JSON:
+
+>>> python -m benchmarks -o results.json
+
+Compare with the results of another run:
+
+>>> python -m benchmarks --compare results.json
+
+The ``bench_*.py`` scripts in this directory are standalone benchmarks of single
+features and are not part of the suite.
+"""
@@ -0,0 +1,82 @@
+"""
+Run the benchmark suite.
+
+>>> python -m benchmarks -o results.json
+>>> python -m benchmarks -k validation --compare results.json
+"""
+
+from __future__ import annotations
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+from typing import Any
+import elegant_json
+from elegant_json._json_backend import get_backend
+from ._suite import result_key, run
+
+
+def _metadata() -> dict[str, Any]:
+    return {
+        "elegant_json": elegant_json.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "backend": get_backend().name,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def _format_time(t: float) -> str:
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if t >= scale:
+            return f"{t / scale:8.2f} {unit}"
+    return f"{t / 1e-9:8.2f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run the benchmark suite."
+    )
+    parser.add_argument("-o", "--output", help="Save the results as a JSON file.")
+    parser.add_argument("-k", "--filter", help="Only run the cases matching this name.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeats of each case.")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="Minimum seconds of a repeat."
+    )
+    parser.add_argument("--quick", action="store_true", help="Run smaller grids.")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare with.")
+    args = parser.parse_args(argv)
+
+    baseline: dict[tuple[str, str], float] = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = {result_key(r): r["best"] for r in json.load(f)["results"]}
+
+    def _print(result: dict[str, Any]) -> None:
+        name, params = result_key(result)
+        line = f"{name:<20} {params:<52} {_format_time(result['best'])}"
+        old = baseline.get((name, params))
+        if old is not None:
+            line += f"  x{old / result['best']:5.2f}"
+        print(line, flush=True)
+
+    results = run(
+        filter=args.filter,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        quick=args.quick,
+        callback=_print,
+    )
+    if args.output:
+        with open(args.output, mode="w", encoding="utf-8") as f:
+            json.dump({"metadata": _metadata(), "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
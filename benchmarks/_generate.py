@@ -0,0 +1,97 @@
+"""Generators of synthetic templates and documents."""
+
+from __future__ import annotations
+from typing import Any
+from elegant_json import Attr, JsonClass
+from elegant_json._json_class import JsonClassMeta
+
+
+def _attr_name(prefix: str, j: int) -> str:
+    return f"{prefix}a{j}"
+
+
+def make_template(
+    depth: int = 0,
+    width: int = 0,
+    n_attrs: int = 4,
+    annotation: Any = None,
+    prefix: str = "",
+) -> dict[str, Any]:
+    """
+    Make a template of nested dicts.
+
+    Every dict has ``n_attrs`` attributes and, except for the deepest ones,
+    ``width`` child dicts. The template has ``n_attrs * (1 + width + ... +
+    width ** depth)`` attributes in total.
+    """
+    template: dict[str, Any] = {}
+    for j in range(n_attrs):
+        template[f"a{j}"] = Attr(_attr_name(prefix, j), annotation=annotation)
+    if depth > 0:
+        for i in range(width):
+            template[f"c{i}"] = make_template(
+                depth - 1, width, n_attrs, annotation, prefix=f"{prefix}c{i}_"
+            )
+    return template
+
+
+def make_document(
+    depth: int = 0,
+    width: int = 0,
+    n_attrs: int = 4,
+    list_length: int | None = None,
+) -> dict[str, Any]:
+    """
+    Make a document that matches ``make_template`` with the same shape.
+
+    Values are integers, or lists of ``list_length`` integers if given.
+    """
+    doc: dict[str, Any] = {}
+    for j in range(n_attrs):
+        doc[f"a{j}"] = j if list_length is None else list(range(list_length))
+    if depth > 0:
+        for i in range(width):
+            doc[f"c{i}"] = make_document(depth - 1, width, n_attrs, list_length)
+    return doc
+
+
+def attr_names(depth: int = 0, width: int = 0, n_attrs: int = 4) -> list[str]:
+    """Names of all the attributes of ``make_template`` with the same shape."""
+    names = [_attr_name("", j) for j in range(n_attrs)]
+    stack = [("", depth)]
+    while stack:
+        prefix, d = stack.pop()
+        if d == 0:
+            continue
+        for i in range(width):
+            child = f"{prefix}c{i}_"
+            names.extend(_attr_name(child, j) for j in range(n_attrs))
+            stack.append((child, d - 1))
+    return names
+
+
+def make_class(
+    depth: int = 0,
+    width: int = 0,
+    n_attrs: int = 4,
+    annotation: Any = None,
+    name: str = "Generated",
+    **flags: Any,
+) -> JsonClassMeta:
+    """
+    Define a new json class of ``make_template``.
+
+    Keyword arguments such as ``codegen=True`` are set as the class flags, such
+    as ``__json_codegen__``.
+    """
+    ns: dict[str, Any] = {
+        "__json_template__": make_template(depth, width, n_attrs, annotation)
+    }
+    for key, value in flags.items():
+        ns[f"__json_{key}__"] = value
+    return JsonClassMeta(name, (JsonClass,), ns)
+
+
+def make_records(n: int, n_attrs: int = 4) -> list[dict[str, Any]]:
+    """Make a list of flat documents, used as sub-documents of a list."""
+    return [make_document(0, 0, n_attrs) for _ in range(n)]
@@ -0,0 +1,260 @@
+"""Benchmark cases and the runner of the suite."""
+
+from __future__ import annotations
+import atexit
+import itertools
+import os
+import tempfile
+import time
+from typing import Any, Callable, Iterator, NamedTuple
+from elegant_json import Attr, JsonClass, available_backends, isformatted, validate
+from elegant_json._json_class import JsonClassMeta
+from ._generate import (
+    attr_names, make_class, make_document, make_records, make_template
+)
+
+# number of calls is chosen so that a repeat takes at least this long
+_MIN_TIME = 0.2
+
+
+class Case(NamedTuple):
+    """A benchmark case and the parameter grid it is run with."""
+
+    name: str
+    setup: Callable[..., tuple[Callable[[], Any], int | None]]
+    grid: dict[str, list[Any]]
+    quick: dict[str, list[Any]]
+
+    def iter_params(self, quick: bool = False) -> Iterator[dict[str, Any]]:
+        grid = {**self.grid, **self.quick} if quick else self.grid
+        keys = list(grid)
+        for values in itertools.product(*(grid[k] for k in keys)):
+            yield dict(zip(keys, values))
+
+
+CASES: list[Case] = []
+
+
+def case(name: str, quick: dict[str, list[Any]] | None = None, **grid: list[Any]):
+    """
+    Register a benchmark case.
+
+    The decorated function is called with the parameters and ``repeat``, and
+    returns the function to be timed and the number of calls in each repeat. If
+    the number is None, it is determined from the time of a call.
+    """
+    def _register(setup):
+        CASES.append(Case(name, setup, grid, quick or {}))
+        return setup
+    return _register
+
+
+@case(
+    "class_creation",
+    quick={"shape": [(0, 0, 8), (2, 4, 4)]},
+    shape=[(0, 0, 8), (0, 0, 64), (2, 4, 4), (3, 4, 4)],
+    codegen=[False, True],
+)
+def _class_creation(shape, codegen, repeat):
+    number = 20
+    # Attr objects are bound to a class, so a template is used only once
+    templates = [make_template(*shape) for _ in range(number * repeat)]
+    ns = {"__json_codegen__": codegen}
+
+    def func():
+        JsonClassMeta("C", (JsonClass,), {"__json_template__": templates.pop(), **ns})
+    return func, number
+
+
+@case(
+    "attribute_read",
+    quick={"shape": [(0, 0, 16)]},
+    shape=[(0, 0, 16), (3, 4, 4)],
+    codegen=[False, True],
+    cache=[False, True],
+)
+def _attribute_read(shape, codegen, cache, repeat):
+    cls = make_class(*shape, codegen=codegen, cache=cache)
+    c = cls(make_document(*shape))
+    names = attr_names(*shape)
+
+    def func():
+        for name in names:
+            getattr(c, name)
+    return func, None
+
+
+@case(
+    "nested_conversion",
+    quick={"length": [100]},
+    annotation=["list[D]", "dict[str, D]"],
+    length=[10, 1000],
+)
+def _nested_conversion(annotation, length, repeat):
+    D = make_class(0, 0, 4, name="D")
+    records = make_records(length)
+    if annotation.startswith("list"):
+        value = records
+    else:
+        value = {str(i): r for i, r in enumerate(records)}
+    cls = JsonClassMeta(
+        "C",
+        (JsonClass,),
+        {"__json_template__": {"a": Attr(annotation=eval(annotation, {"D": D}))}},
+    )
+    c = cls({"a": value})
+    return (lambda: c.a), None
+
+
+@case(
+    "generic_conversion",
+    quick={"length": [100]},
+    annotation=["list[int]", "tuple[int, ...]", "dict[str, list[int]]"],
+    length=[10, 1000],
+)
+def _generic_conversion(annotation, length, repeat):
+    if annotation.startswith("dict"):
+        value = {str(i): [i] for i in range(length)}
+    else:
+        value = list(range(length))
+    cls = JsonClassMeta(
+        "C", (JsonClass,), {"__json_template__": {"a": Attr(annotation=eval(annotation))}}
+    )
+    c = cls({"a": value})
+    return (lambda: c.a), None
+
+
+@case(
+    "validation",
+    quick={"shape": [(2, 4, 4)]},
+    check=["isformatted", "validate"],
+    shape=[(2, 4, 4), (3, 4, 4)],
+    list_length=[None, 100],
+)
+def _validation(check, shape, list_length, repeat):
+    annotation = int if list_length is None else list[int]
+    cls = make_class(*shape, annotation=annotation)
+    doc = make_document(*shape, list_length=list_length)
+    if check == "isformatted":
+        return (lambda: isformatted(doc, cls)), None
+    return (lambda: validate(doc, cls)), None
+
+
+@case(
+    "create",
+    quick={"shape": [(2, 4, 4)]},
+    shape=[(0, 0, 16), (2, 4, 4), (3, 4, 4)],
+    use_default=[False, True],
+)
+def _create(shape, use_default, repeat):
+    cls = make_class(*shape)
+    return (lambda: cls.create(use_default=use_default)), None
+
+
+@case(
+    "file_roundtrip",
+    quick={"n_records": [1000]},
+    operation=["load", "dump"],
+    n_records=[1000, 100_000],
+    backend=available_backends(),
+)
+def _file_roundtrip(operation, n_records, backend, repeat):
+    cls = JsonClassMeta(
+        "C",
+        (JsonClass,),
+        {"__json_template__": {"records": Attr()}, "__json_backend__": backend},
+    )
+    c = cls({"records": make_records(n_records)})
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    atexit.register(os.remove, path)
+    c.dump(path)
+    if operation == "load":
+        return (lambda: cls.load(path)), None
+    return (lambda: c.dump(path)), None
+
+
+def _measure(func: Callable[[], Any], number: int, repeat: int) -> list[float]:
+    """Return the time per call of each repeat."""
+    times: list[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - t0) / number)
+    return times
+
+
+def _autorange(func: Callable[[], Any], min_time: float) -> int:
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - t0 >= min_time:
+            return number
+        number *= 10
+
+
+def run(
+    filter: str | None = None,
+    repeat: int = 5,
+    min_time: float = _MIN_TIME,
+    quick: bool = False,
+    callback: Callable[[dict[str, Any]], Any] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Run the benchmark cases.
+
+    Parameters
+    ----------
+    filter : str, optional
+        Only run the cases whose names contain this string.
+    repeat : int, default is 5
+        Number of repeats of each measurement.
+    min_time : float, default is 0.2
+        Minimum time in seconds of a repeat.
+    quick : bool, default is False
+        If true, run the cases with smaller parameter grids.
+    callback : callable, optional
+        Called with each result when it is measured.
+
+    Returns
+    -------
+    list of dict
+        Results with the case names, parameters and times per call in seconds.
+    """
+    results: list[dict[str, Any]] = []
+    for c in CASES:
+        if filter is not None and filter not in c.name:
+            continue
+        for params in c.iter_params(quick):
+            func, number = c.setup(repeat=repeat, **params)
+            if number is None:
+                number = _autorange(func, min_time)
+            times = _measure(func, number, repeat)
+            result = {
+                "name": c.name,
+                "params": {k: _to_json(v) for k, v in params.items()},
+                "number": number,
+                "repeat": repeat,
+                "times": times,
+                "best": min(times),
+                "median": sorted(times)[len(times) // 2],
+            }
+            results.append(result)
+            if callback is not None:
+                callback(result)
+    return results
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def result_key(result: dict[str, Any]) -> tuple[str, str]:
+    """A key that identifies a measurement across runs."""
+    params = ", ".join(f"{k}={v}" for k, v in result["params"].items())
+    return result["name"], params
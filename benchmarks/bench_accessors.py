@@ -0,0 +1,46 @@
+"""
+Benchmark of attribute reads and writes with and without generated accessors.
+
+>>> python -m benchmarks.bench_accessors
+"""
+
+import timeit
+from elegant_json import JsonClass, Attr
+
+DOC = {"title": "t", "data": {"meta": {"id": 1}, "values": [0, 1, 2]}}
+
+
+def make_class(codegen: bool):
+    class C(JsonClass):
+        __json_template__ = {
+            "title": Attr(),
+            "data": {"meta": {"id": Attr()}, "values": Attr()},
+        }
+        __json_codegen__ = codegen
+        __json_mutable__ = True
+        title: str
+        id: int
+    return C
+
+
+def main(number: int = 200000, repeat: int = 5):
+    for codegen in [False, True]:
+        c = make_class(codegen)(DOC)
+        label = "generated" if codegen else "closures"
+        cases = [
+            ("title (str, depth 1)", lambda: c.title),
+            ("id (int, depth 3)", lambda: c.id),
+            ("values (no annotation)", lambda: c.values),
+        ]
+        print(label)
+        for name, func in cases:
+            t = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+            print(f"  read {name:<24} {1 / t / 1e6:6.2f} M reads/s")
+        def write():
+            c.id = 1
+        t = min(timeit.repeat(write, number=number, repeat=repeat)) / number
+        print(f"  write {'id (depth 3)':<23} {1 / t / 1e6:6.2f} M writes/s")
+
+
+if __name__ == "__main__":
+    main()
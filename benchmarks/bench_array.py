@@ -0,0 +1,46 @@
+"""
+Benchmark of array attributes.
+
+A list of 1M numbers is read as ``list[float]`` (element-wise conversion), as
+``list[float]`` followed by ``np.asarray``, and as an array attribute. Nested
+lists of 1000 x 1000 numbers and writing arrays back are also measured.
+
+>>> python -m benchmarks.bench_array
+"""
+
+import timeit
+import numpy as np
+from elegant_json import JsonClass, Attr
+
+
+class C(JsonClass):
+    __json_template__ = {
+        "values": Attr(),
+        "array": Attr(annotation=np.float64, mutable=True),
+        "matrix": Attr(annotation=list[list[float]], array=True),
+        "nested": Attr("nested_list"),
+    }
+    values: list[float]
+    nested_list: list[list[float]]
+
+
+def main(n: int = 1_000_000, repeat: int = 5):
+    data = [float(i) for i in range(n)]
+    matrix = [data[i:i + 1000] for i in range(0, n, 1000)]
+    c = C({"values": data, "array": data, "matrix": matrix, "nested": matrix})
+    arr = c.array
+    cases = [
+        ("list[float]", lambda: c.values),
+        ("list[float] + np.asarray", lambda: np.asarray(c.values, dtype=np.float64)),
+        ("array attribute", lambda: c.array),
+        ("list[list[float]]", lambda: c.nested_list),
+        ("2D array attribute", lambda: c.matrix),
+        ("write array", lambda: setattr(c, "array", arr)),
+    ]
+    for label, func in cases:
+        t = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{label:<26} {t * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
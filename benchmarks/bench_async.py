@@ -0,0 +1,114 @@
+"""
+Benchmark of event-loop latency during loading of large files.
+
+A ticker task measures how late it wakes up from ``asyncio.sleep`` while large
+json files are loaded by the blocking ``JsonClass.load`` and by
+``JsonClass.aload`` with a thread pool and a process pool, and while a large
+record stream is loaded by ``JsonClass.iter_load`` and ``JsonClass.aiter_load``.
+
+The C parsers hold the GIL, so the lag of ``aload`` is bounded by the time to
+materialize one document, while the lag of ``aiter_load`` is bounded by the time
+to decode one batch of records.
+
+>>> python -m benchmarks.bench_async
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import elegant_json as ej
+from elegant_json import JsonClass, Attr
+
+
+class C(JsonClass):
+    __json_template__ = {"title": Attr(), "records": Attr()}
+
+
+class Record(JsonClass):
+    __json_template__ = {"id": Attr(), "label": Attr(), "values": Attr()}
+
+
+def make_document(n: int) -> dict:
+    return {
+        "title": "benchmark",
+        "records": [
+            {"id": i, "label": f"item-{i}", "values": [i, i * 2, i * 3]}
+            for i in range(n)
+        ],
+    }
+
+
+async def ticker(lags: list, stop: asyncio.Event, interval: float = 0.001):
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - t0 - interval)
+
+
+async def run(load, paths: list) -> tuple:
+    lags: list = []
+    stop = asyncio.Event()
+    task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0.01)
+    t0 = time.perf_counter()
+    await load(paths)
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    await task
+    return elapsed, max(lags), sorted(lags)[len(lags) * 99 // 100]
+
+
+async def blocking(paths):
+    for path in paths:
+        C.load(path)
+
+
+async def non_blocking(paths):
+    await asyncio.gather(*(C.aload(path) for path in paths))
+
+
+async def blocking_stream(paths):
+    for _ in Record.iter_load(paths[0]):
+        pass
+
+
+async def non_blocking_stream(paths):
+    async for _ in Record.aiter_load(paths[0]):
+        pass
+
+
+def main(n_files: int = 4, n: int = 100000):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = []
+        for i in range(n_files):
+            path = os.path.join(tmpdir, f"{i}.json")
+            with open(path, "w") as f:
+                json.dump(make_document(n), f)
+            paths.append(path)
+        stream = [os.path.join(tmpdir, "records.jsonl")]
+        Record.iter_dump(
+            stream[0], (Record(r) for r in make_document(n * n_files)["records"])
+        )
+        print(f"{n_files} files of {os.path.getsize(paths[0]) / 1e6:.1f} MB")
+        with ThreadPoolExecutor(4) as threads, ProcessPoolExecutor(2) as procs:
+            cases = [
+                ("load (blocking)", blocking, None, paths),
+                ("aload (threads)", non_blocking, threads, paths),
+                ("aload (processes)", non_blocking, procs, paths),
+                ("iter_load", blocking_stream, None, stream),
+                ("aiter_load", non_blocking_stream, threads, stream),
+            ]
+            for label, load, executor, inputs in cases:
+                ej.configure_async(executor)
+                elapsed, worst, p99 = asyncio.run(run(load, inputs))
+                print(
+                    f"{label:<18} total {elapsed * 1e3:7.1f} ms  max lag "
+                    f"{worst * 1e3:7.1f} ms  p99 lag {p99 * 1e3:7.1f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark of bulk materialization of properties.
+
+``attr_asdict`` and ``attr_astuple`` are compared with reading every property by
+``getattr``, and ``from_records`` with creating objects from full dictionaries.
+
+>>> python -m benchmarks.bench_attr_asdict
+"""
+
+import timeit
+from elegant_json import JsonClass, Attr
+
+
+class C(JsonClass):
+    __json_template__ = {
+        "title": Attr(),
+        "data": {"id": Attr(), "score": Attr(), "values": Attr()},
+        "meta": {"created": Attr(), "author": {"name": Attr(), "email": Attr()}},
+    }
+    title: str
+    id: int
+    score: float
+    values: list[int]
+    created: str
+    name: str
+    email: str
+
+
+def make_record(i: int) -> dict:
+    return {
+        "title": f"record-{i}",
+        "data": {"id": i, "score": i * 0.5, "values": [i, i + 1]},
+        "meta": {
+            "created": "2022-06-01",
+            "author": {"name": f"user{i}", "email": f"user{i}@example.com"},
+        },
+    }
+
+
+def by_getattr(objs: list) -> list:
+    names = C._json_attr_names
+    return [{name: getattr(c, name) for name in names} for c in objs]
+
+
+def main(n: int = 100000, repeat: int = 3):
+    objs = [C(make_record(i)) for i in range(n)]
+    records = C.to_records(objs)
+    cases = [
+        ("getattr loop", lambda: by_getattr(objs)),
+        ("attr_asdict", lambda: [c.attr_asdict() for c in objs]),
+        ("attr_astuple", lambda: [c.attr_astuple() for c in objs]),
+        ("to_records", lambda: C.to_records(objs)),
+        ("from_records", lambda: C.from_records(records)),
+        ("create from dicts", lambda: [C(make_record(i)) for i in range(n)]),
+    ]
+    for label, func in cases:
+        t = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{label:<20} {t * 1e3:8.1f} ms  ({t / n * 1e9:6.0f} ns/object)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark of JSON backends.
+
+Throughput of ``loads`` and ``dumps`` of each available backend is measured on the
+same document, together with ``JsonClass.load`` and ``JsonClass.dump``.
+
+>>> python -m benchmarks.bench_backends
+"""
+
+import os
+import tempfile
+import timeit
+import elegant_json as ej
+from elegant_json import JsonClass, Attr
+from elegant_json._json_backend import get_backend
+
+
+class C(JsonClass):
+    __json_template__ = {"title": Attr(), "records": Attr()}
+    title: str
+    records: list
+
+
+def make_document(n: int) -> dict:
+    return {
+        "title": "benchmark",
+        "records": [
+            {
+                "id": i,
+                "name": f"item-{i}",
+                "score": i * 0.25,
+                "ok": i % 3 == 0,
+                "tags": ["a", "b", "c"],
+                "nested": {"x": i, "y": [i, i + 1, None]},
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def main(n: int = 20000, repeat: int = 5):
+    doc = make_document(n)
+    text = get_backend("json").dumps(doc)
+    data = text.encode()
+    size = len(data) / 1e6
+    print(f"document size: {size:.1f} MB")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "doc.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        for name in ej.available_backends():
+            backend = get_backend(name)
+
+            class D(C):
+                __json_backend__ = name
+
+            obj = D.load(path, "utf-8")
+            cases = [
+                ("loads(str)", lambda: backend.loads(text)),
+                ("loads(bytes)", lambda: backend.loads(data)),
+                ("dumps", lambda: backend.dumps(doc)),
+                ("JsonClass.load", lambda: D.load(path, "utf-8")),
+                ("JsonClass.dump", lambda: obj.dump(path, "utf-8")),
+            ]
+            for label, func in cases:
+                t = min(timeit.repeat(func, number=1, repeat=repeat))
+                print(f"{name:<8} {label:<16} {t * 1e3:8.1f} ms  {size / t:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
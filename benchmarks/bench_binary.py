@@ -0,0 +1,67 @@
+"""
+Benchmark of the compact binary format.
+
+10k records are serialized by ``dumps_binary_many`` and by ``json.dumps`` of the
+list of the json dictionaries, and deserialized by ``loads_binary_many`` and by
+``json.loads`` followed by wrapping. Sizes of the outputs are also shown. The
+msgpack library is used if installed. The pure Python fallback gives the same
+size (about 35% of the JSON text) but is slower than json, for example:
+
+    msgpack library: False
+    json size          1715022 bytes
+    binary size         607377 bytes (35%)
+    json.dumps             39.3 ms     254.4 k records/s
+    dumps_binary_many      77.8 ms     128.5 k records/s
+    json.loads             34.1 ms     293.4 k records/s
+    loads_binary_many     110.8 ms      90.2 k records/s
+
+>>> python -m benchmarks.bench_binary
+"""
+
+import json
+import timeit
+from elegant_json import JsonClass, Attr
+from elegant_json._json_binary import packb, _packb_py
+
+
+class Record(JsonClass):
+    __json_template__ = {
+        "id": Attr(),
+        "header": {"source": Attr(), "timestamp": Attr(), "tags": Attr()},
+        "body": {"title": Attr(), "score": Attr(), "values": Attr()},
+    }
+
+
+def make_record(i: int) -> dict:
+    return {
+        "id": i,
+        "header": {
+            "source": "sensor", "timestamp": 1700000000 + i, "tags": ["a", "b"]
+        },
+        "body": {
+            "title": f"record-{i}", "score": i * 0.25, "values": [i, i + 1, i + 2]
+        },
+    }
+
+
+def main(n: int = 10_000, repeat: int = 5):
+    objs = [Record(make_record(i)) for i in range(n)]
+    jsons = [obj.json for obj in objs]
+    text = json.dumps(jsons)
+    data = Record.dumps_binary_many(objs)
+    print(f"msgpack library: {packb is not _packb_py}")
+    print(f"json size    {len(text.encode()):10d} bytes")
+    print(f"binary size  {len(data):10d} bytes ({len(data) / len(text.encode()):.0%})")
+    cases = [
+        ("json.dumps", lambda: json.dumps(jsons)),
+        ("dumps_binary_many", lambda: Record.dumps_binary_many(objs)),
+        ("json.loads", lambda: [Record(js) for js in json.loads(text)]),
+        ("loads_binary_many", lambda: Record.loads_binary_many(data)),
+    ]
+    for label, func in cases:
+        t = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{label:<18} {t * 1e3:8.1f} ms  {n / t / 1e3:8.1f} k records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark of indexed lookups of json class collections.
+
+Equality and range queries over 1M objects are compared with list
+comprehensions, and the time to build the indexes is shown.
+
+>>> python -m benchmarks.bench_collection
+"""
+
+import time
+import timeit
+from elegant_json import JsonClass, JsonCollection, Attr
+
+
+class Doc(JsonClass):
+    __json_template__ = {"title": Attr(), "info": {"year": Attr()}}
+    __json_mutable__ = True
+    title: str
+    year: int
+
+
+def main(n: int = 1_000_000, repeat: int = 5):
+    docs = [
+        Doc({"title": f"title-{i % 100_000}", "info": {"year": i % 5000}})
+        for i in range(n)
+    ]
+    coll = JsonCollection(Doc, docs)
+    for name, kind in [("title", "hash"), ("year", "sorted")]:
+        t0 = time.perf_counter()
+        coll.create_index(name, kind)
+        print(f"build {kind} index   {time.perf_counter() - t0:10.3f} s")
+
+    cases = [
+        ("comprehension ==", lambda: [c for c in docs if c.title == "title-5"], 1),
+        ("hash index ==", lambda: coll.find("title", "title-5"), 1000),
+        (
+            "comprehension range",
+            lambda: [c for c in docs if 100 <= c.year <= 101],
+            1,
+        ),
+        ("sorted index range", lambda: coll.find_range("year", 100, 101), 100),
+        ("set with index", lambda: coll.set(docs[10], "title", "title-7"), 1000),
+    ]
+    for label, func, number in cases:
+        t = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+        print(f"{label:<20} {t * 1e3:10.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
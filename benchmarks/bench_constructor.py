@@ -0,0 +1,51 @@
+"""
+Benchmark of dynamic class creation.
+
+``create_constructor`` is called with a new but structurally equal template for
+every request, with and without the class cache.
+
+>>> python -m benchmarks.bench_constructor
+"""
+
+import timeit
+from elegant_json import Attr, create_constructor
+from elegant_json import core
+
+
+def make_template(width: int = 10, depth: int = 3) -> dict:
+    if depth == 0:
+        return {f"k{i}": Attr(annotation=list[int], mutable=True) for i in range(width)}
+    template = {f"s{i}": make_template(width, depth - 1) for i in range(3)}
+    return template
+
+
+def _rename(template: dict, prefix: str = "") -> dict:
+    # attribute names must be unique, so name them after the key paths
+    out = {}
+    for k, v in template.items():
+        if isinstance(v, dict):
+            out[k] = _rename(v, f"{prefix}{k}_")
+        else:
+            out[k] = Attr(f"{prefix}{k}", v.annotation, mutable=v.mutable)
+    return out
+
+
+def main(number: int = 200):
+    def request():
+        return create_constructor(_rename(make_template()))
+
+    n_attrs = len(create_constructor(_rename(make_template()))._json_attr_names)
+    print(f"template with {n_attrs} attributes")
+    t_template = min(timeit.repeat(lambda: _rename(make_template()), number=number, repeat=3))
+
+    def uncached():
+        core._CLASS_CACHE.clear()
+        return request()
+
+    for label, func in [("no cache", uncached), ("cached", request)]:
+        t = min(timeit.repeat(func, number=number, repeat=3)) - t_template
+        print(f"{label:<10} {t / number * 1e6:10.1f} us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark of the compiled Attr converters.
+
+The cost per converted leaf value should not depend on how deeply the element
+annotation is nested, because every converter is compiled once at class creation.
+
+>>> python -m benchmarks.bench_converter
+"""
+
+from __future__ import annotations
+import timeit
+from elegant_json import JsonClass, Attr
+
+N = 20000
+
+CASES = [
+    ("list[int]", list[int], lambda i: str(i), 1),
+    ("list[tuple[int, str]]", list[tuple[int, str]], lambda i: [str(i), "a"], 2),
+    (
+        "list[tuple[tuple[int, str], str]]",
+        list[tuple[tuple[int, str], str]],
+        lambda i: [[str(i), "a"], "b"],
+        3,
+    ),
+    (
+        "list[tuple[tuple[tuple[int, str], str], str]]",
+        list[tuple[tuple[tuple[int, str], str], str]],
+        lambda i: [[[str(i), "a"], "b"], "c"],
+        4,
+    ),
+]
+
+
+def main(n: int = N, repeat: int = 5):
+    for label, annotation, make, nleaves in CASES:
+        class C(JsonClass):
+            __json_template__ = {"a": Attr(annotation=annotation)}
+        
+        c = C({"a": [make(i) for i in range(n)]})
+        t = min(timeit.repeat(lambda: c.a, number=1, repeat=repeat))
+        print(
+            f"{label:<48} {t / n * 1e9:8.1f} ns/element "
+            f"{t / n / nleaves * 1e9:8.1f} ns/leaf"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark of creating blank objects from a template.
+
+``JsonClass.create`` and ``JsonClass.create_many`` are compared with the
+recursive copy of the template that ``create`` used before.
+
+>>> python -m benchmarks.bench_create
+"""
+
+import timeit
+from elegant_json import JsonClass, Attr
+
+
+def make_template(width: int = 8, depth: int = 3, prefix: str = "") -> dict:
+    if depth == 0:
+        return {
+            "name": Attr(f"{prefix}name", default=""),
+            "values": Attr(f"{prefix}values", default=[]),
+            "unit": "px",
+            "range": [0, 100],
+        }
+    return {
+        f"k{i}": make_template(width, depth - 1, f"{prefix}k{i}_") for i in range(width)
+    }
+
+
+class C(JsonClass):
+    __json_template__ = make_template()
+
+
+def recursive_copy(x, value=None):
+    if isinstance(x, (list, tuple)):
+        return type(x)(recursive_copy(a, value) for a in x)
+    elif isinstance(x, dict):
+        return {k: recursive_copy(v, value) for k, v in x.items()}
+    elif isinstance(x, Attr):
+        return value
+    return x
+
+
+def main(n: int = 200, repeat: int = 3):
+    print(f"template with {len(C._json_attr_names)} attributes")
+    cases = [
+        ("recursive copy", lambda: [C(recursive_copy(C.__json_template__)) for _ in range(n)]),
+        ("create", lambda: [C.create() for _ in range(n)]),
+        ("create_many", lambda: C.create_many(n)),
+        ("create(use_default)", lambda: [C.create(use_default=True) for _ in range(n)]),
+        ("create_many(use_default)", lambda: C.create_many(n, use_default=True)),
+    ]
+    for label, func in cases:
+        t = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{label:<26} {t / n * 1e6:8.1f} us/object")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark of comparing json class objects.
+
+``diff`` only compares the template key paths, while ``a.json == b.json`` compares
+the whole documents. Setting properties is also measured with change tracking.
+
+>>> python -m benchmarks.bench_diff
+"""
+
+import copy
+import timeit
+from elegant_json import JsonClass, Attr, diff
+
+
+class C(JsonClass):
+    __json_template__ = {
+        "version": Attr(),
+        "settings": {"threshold": Attr(), "name": Attr(), "flags": Attr()},
+        "records": ...,
+    }
+    __json_mutable__ = True
+
+
+def make_document(n: int) -> dict:
+    return {
+        "version": 1,
+        "settings": {"threshold": 0.5, "name": "default", "flags": [1, 2, 3]},
+        "records": [
+            {"id": i, "label": f"item-{i}", "values": [i, i * 2, i * 3]}
+            for i in range(n)
+        ],
+    }
+
+
+def main(n: int = 100000, number: int = 20):
+    a = C(make_document(n))
+    b = C(copy.deepcopy(a.json))
+    # the worst case of the full comparison is that the documents are equal
+    cases = [
+        ("a.json == b.json", lambda: a.json == b.json),
+        ("diff(a, b)", lambda: diff(a, b)),
+    ]
+    for label, func in cases:
+        t = min(timeit.repeat(func, number=number, repeat=3)) / number
+        print(f"{label:<20} {t * 1e6:10.1f} us")
+
+    c = C(make_document(10))
+
+    def set_values():
+        c.version = 2
+        c.name = "x"
+
+    t = min(timeit.repeat(set_values, number=100000, repeat=3)) / 100000 / 2
+    print(f"{'set property':<20} {t * 1e9:10.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
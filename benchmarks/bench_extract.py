@@ -0,0 +1,54 @@
+"""
+Benchmark of columnar extraction.
+
+``JsonClass.extract`` is compared with building the same columns by reading the
+properties of an instance created for every record.
+
+>>> python -m benchmarks.bench_extract
+"""
+
+import timeit
+from elegant_json import JsonClass, Attr
+
+
+class C(JsonClass):
+    __json_template__ = {
+        "title": Attr(),
+        "data": {"id": Attr(), "score": Attr(), "values": Attr()},
+        "meta": {"created": Attr(), "tags": ...},
+    }
+    title: str
+    id: int
+    score: float
+    values: list[int]
+    created: str
+
+
+def make_record(i: int) -> dict:
+    return {
+        "title": f"record-{i}",
+        "data": {"id": i, "score": i * 0.5, "values": [i, i + 1]},
+        "meta": {"created": "2022-06-01", "tags": ["a", "b"]},
+    }
+
+
+def per_instance(records: list, fields: list[str]) -> dict:
+    instances = [C(r) for r in records]
+    return {name: [getattr(c, name) for c in instances] for name in fields}
+
+
+def main(n: int = 100000, repeat: int = 3):
+    records = [make_record(i) for i in range(n)]
+    fields = ["title", "id", "score", "values", "created"]
+    cases = [
+        ("per-instance loop", lambda: per_instance(records, fields)),
+        ("extract (lists)", lambda: C.extract(records, fields, asarray=False)),
+        ("extract (arrays)", lambda: C.extract(records, fields)),
+    ]
+    for label, func in cases:
+        t = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{label:<20} {t * 1e3:8.1f} ms  ({t / n * 1e9:6.0f} ns/record)")
+
+
+if __name__ == "__main__":
+    main()
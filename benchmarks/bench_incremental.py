@@ -0,0 +1,83 @@
+"""
+Benchmark of incremental dumping.
+
+A large json file is updated after a small edit by ``JsonClass.dump`` and by
+``JsonClass.dump_incremental``, with values of the same length (in-place update)
+and of a different length (spliced into a new file).
+
+>>> python -m benchmarks.bench_incremental
+"""
+
+import json
+import os
+import tempfile
+import time
+from elegant_json import JsonClass, Attr
+
+
+class Config(JsonClass):
+    __json_template__ = {
+        "version": Attr(),
+        "settings": {"threshold": Attr(), "name": Attr()},
+        "records": Attr(),
+    }
+    __json_mutable__ = True
+    version: int
+    threshold: float
+    name: str
+
+
+def make_document(n: int) -> dict:
+    return {
+        "version": 1000,
+        "settings": {"threshold": 0.5, "name": "default"},
+        "records": [
+            {"id": i, "label": f"item-{i}", "values": [i, i * 2, i * 3]}
+            for i in range(n)
+        ],
+    }
+
+
+def measure(func, repeat: int) -> float:
+    times = []
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        func(i)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main(n: int = 200000, repeat: int = 5):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "config.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(make_document(n), f)
+        print(f"file size: {os.path.getsize(path) / 1e6:.1f} MB")
+        obj = Config.load(path, "utf-8")
+
+        def full(i):
+            obj.version = 1000 + i
+            obj.dump(path, "utf-8")
+
+        def same_length(i):
+            obj.version = 1000 + i
+            obj.dump_incremental(path, "utf-8")
+
+        def resized(i):
+            obj.name = "x" * (i + 10)
+            obj.dump_incremental(path, "utf-8")
+
+        cases = [
+            ("dump", full),
+            ("dump_incremental (in place)", same_length),
+            ("dump_incremental (resized)", resized),
+        ]
+        for label, func in cases:
+            t = measure(func, repeat)
+            print(f"{label:<30} {t * 1e3:8.1f} ms")
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == obj.json
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark of instrumentation.
+
+Property reads are measured before instrumenting, while instrumented with an
+``AccessStats`` sink, and after uninstrumenting, which must be as fast as before.
+
+>>> python -m benchmarks.bench_instrument
+"""
+
+import timeit
+from elegant_json import JsonClass, Attr, AccessStats, instrument, uninstrument
+
+
+class C(JsonClass):
+    __json_template__ = {"a": Attr(), "b": {"c": Attr()}, "d": Attr()}
+    __json_codegen__ = True
+    a: int
+    c: str
+    d: list[int]
+
+
+def main(number: int = 100_000, repeat: int = 5):
+    c = C({"a": 1, "b": {"c": "x"}, "d": [1, 2, 3]})
+
+    def read():
+        c.a
+        c.c
+        c.d
+
+    def measure(label: str):
+        t = min(timeit.repeat(read, number=number, repeat=repeat)) / number
+        print(f"{label:<16} {t * 1e9:8.1f} ns")
+
+    measure("before")
+    stats = AccessStats()
+    instrument(C, stats)
+    measure("instrumented")
+    uninstrument(C)
+    measure("uninstrumented")
+    for key, value in stats.report().items():
+        print(key, value)
+
+
+if __name__ == "__main__":
+    main()
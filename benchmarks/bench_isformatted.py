@@ -0,0 +1,66 @@
+"""
+Benchmark of format checking.
+
+The prefix-tree based ``isformatted`` and ``isformatted_many`` are compared with
+the previous implementation that walked the full key path of every property from
+the root.
+
+>>> python -m benchmarks.bench_isformatted
+"""
+
+from __future__ import annotations
+import timeit
+from typing import Any
+import elegant_json as ej
+from elegant_json import Attr
+
+
+def isformatted_per_path(obj, json_class) -> bool:
+    # the previous implementation
+    if not isinstance(obj, dict):
+        return False
+    for name in json_class._json_properties:
+        prop = getattr(json_class, name)
+        try:
+            out: Any = obj
+            for k in prop.keys():
+                out = out[k]
+        except (KeyError, IndexError):
+            return False
+    return True
+
+
+def make_template(n_groups: int, n_attrs: int, depth: int) -> dict:
+    template: dict = {}
+    for g in range(n_groups):
+        node = template.setdefault(f"group{g}", {})
+        for d in range(depth):
+            node = node.setdefault(f"level{d}", {})
+        for a in range(n_attrs):
+            node[f"key{a}"] = Attr(f"attr_{g}_{a}")
+    return template
+
+
+def make_document(template: dict) -> dict:
+    return {
+        k: make_document(v) if isinstance(v, dict) else 0 for k, v in template.items()
+    }
+
+
+def main(n_docs: int = 1000, repeat: int = 5):
+    for n_groups, n_attrs, depth in [(1, 10, 2), (5, 20, 3), (10, 50, 5)]:
+        cls = ej.create_constructor(make_template(n_groups, n_attrs, depth))
+        docs = [make_document(cls.__json_template__) for _ in range(n_docs)]
+        cases = [
+            ("per-path", lambda: [isformatted_per_path(d, cls) for d in docs]),
+            ("isformatted", lambda: [ej.isformatted(d, cls) for d in docs]),
+            ("isformatted_many", lambda: ej.isformatted_many(docs, cls)),
+        ]
+        print(f"groups={n_groups}, attributes/group={n_attrs}, depth={depth}")
+        for label, func in cases:
+            t = min(timeit.repeat(func, number=1, repeat=repeat))
+            print(f"  {label:<18} {t / n_docs * 1e6:8.2f} us/document")
+
+
+if __name__ == "__main__":
+    main()
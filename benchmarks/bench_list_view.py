@@ -0,0 +1,45 @@
+"""
+Benchmark of list views.
+
+A list of 100k sub-documents is read as ``list[D]`` (all the items are wrapped)
+and as ``ListView[D]`` (items are wrapped on access). Reading a single item,
+slicing and iterating over all the items are measured.
+
+>>> python -m benchmarks.bench_list_view
+"""
+
+import timeit
+from elegant_json import JsonClass, Attr, ListView
+
+
+class D(JsonClass):
+    __json_template__ = {"name": Attr(), "value": Attr()}
+    name: str
+    value: int
+
+
+class C(JsonClass):
+    __json_template__ = {"items": Attr(), "view": Attr()}
+    items: list[D]
+    view: ListView[D]
+
+
+def main(n: int = 100_000, repeat: int = 5):
+    data = [{"name": f"n{i}", "value": i} for i in range(n)]
+    c = C({"items": data, "view": data})
+    i = n // 2
+    cases = [
+        ("list[D] item", lambda: c.items[i].name, 10),
+        ("ListView[D] item", lambda: c.view[i].name, 10),
+        ("list[D] slice", lambda: c.items[i:i + 100], 10),
+        ("ListView[D] slice", lambda: c.view[i:i + 100], 10),
+        ("list[D] iterate", lambda: [d.value for d in c.items], 1),
+        ("ListView[D] iterate", lambda: [d.value for d in c.view], 1),
+    ]
+    for label, func, number in cases:
+        t = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+        print(f"{label:<22} {t * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark of batch loading of many small files.
+
+A sequential loop over the loader function of ``create_loader`` is compared with
+``JsonClass.load_many`` using thread and process pools.
+
+>>> python -m benchmarks.bench_load_many
+"""
+
+from __future__ import annotations
+import json
+import tempfile
+import time
+from pathlib import Path
+import elegant_json as ej
+from elegant_json import Attr
+
+TEMPLATE = {"id": Attr(), "data": {"name": Attr(), "values": Attr()}}
+
+
+def make_document(i: int) -> dict:
+    return {
+        "id": i,
+        "data": {"name": f"doc-{i}", "values": list(range(200))},
+        "meta": {str(k): k for k in range(50)},
+    }
+
+
+def main(n: int = 5000, workers: int = 4):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(n):
+            path = Path(tmp) / f"{i}.json"
+            path.write_text(json.dumps(make_document(i)), encoding="utf-8")
+            paths.append(path)
+        cls = ej.create_constructor(TEMPLATE)
+        loader = ej.create_loader(TEMPLATE)
+        cases = [
+            ("sequential loader", lambda: [loader(p, encoding="utf-8") for p in paths]),
+            (
+                f"load_many (thread, {workers})",
+                lambda: cls.load_many(paths, workers, "thread", encoding="utf-8"),
+            ),
+            (
+                f"load_many (process, {workers})",
+                lambda: cls.load_many(paths, workers, "process", encoding="utf-8"),
+            ),
+        ]
+        for label, func in cases:
+            t0 = time.perf_counter()
+            func()
+            t = time.perf_counter() - t0
+            print(f"{label:<28} {n / t:10,.0f} files/s")
+
+
+if __name__ == "__main__":
+    main()
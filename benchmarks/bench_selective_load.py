@@ -0,0 +1,76 @@
+"""
+Benchmark of selective and memory-mapped loading against eager loading.
+
+A document with large sibling subtrees that the template does not refer to is
+loaded with every combination of ``selective`` and ``memory_map``. Parse time and
+the peak memory allocated during loading are reported.
+
+>>> python -m benchmarks.bench_selective_load
+"""
+
+from __future__ import annotations
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from elegant_json import JsonClass, Attr
+
+
+class C(JsonClass):
+    __json_template__ = {
+        "title": Attr(),
+        "data": {"values": Attr()},
+        "payload": ...,
+    }
+    title: str
+    values: list[int]
+
+
+def make_document(n_records: int) -> dict:
+    return {
+        "title": "benchmark",
+        "data": {"values": list(range(100))},
+        "payload": [
+            {"id": i, "name": f"record-{i}", "tags": ["a", "b"], "score": i * 0.5}
+            for i in range(n_records)
+        ],
+        "extra": {str(i): {"nested": [i, i + 1]} for i in range(n_records // 10)},
+    }
+
+
+def measure(path: Path, repeat: int = 3, **kwargs) -> tuple[float, int]:
+    t = min(_time_load(path, **kwargs) for _ in range(repeat))
+    tracemalloc.start()
+    C.load(path, encoding="utf-8", **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return t, peak
+
+
+def _time_load(path: Path, **kwargs) -> float:
+    t0 = time.perf_counter()
+    C.load(path, encoding="utf-8", **kwargs)
+    return time.perf_counter() - t0
+
+
+def main(n_records: int = 200000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "doc.json"
+        path.write_text(json.dumps(make_document(n_records)), encoding="utf-8")
+        size = path.stat().st_size
+        print(f"file size: {size / 1e6:.1f} MB")
+        for memory_map in [False, True]:
+            for selective in [False, True]:
+                t, peak = measure(path, selective=selective, memory_map=memory_map)
+                label = "selective" if selective else "eager"
+                if memory_map:
+                    label += " (mmap)"
+                print(
+                    f"{label:<18} time: {t * 1e3:8.1f} ms  "
+                    f"peak memory: {peak / 1e6:8.1f} MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
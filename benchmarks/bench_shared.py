@@ -0,0 +1,59 @@
+"""
+Benchmark of sending json class objects to worker processes.
+
+100k objects are sent to each of 4 tasks of a process pool, either as pickled
+json dictionaries or as a handle of the objects in shared memory. Each task
+reads one attribute of every object. Pickled sizes of the payloads are shown.
+
+>>> python -m benchmarks.bench_shared
+"""
+
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from elegant_json import JsonClass, Attr
+
+
+class Record(JsonClass):
+    __json_template__ = {
+        "id": Attr(),
+        "body": {"title": Attr(), "values": Attr()},
+    }
+    id: int
+
+
+def sum_pickled(jsons: list) -> int:
+    return sum(Record(js).id for js in jsons)
+
+
+def sum_shared(shared) -> int:
+    try:
+        return sum(r.id for r in shared)
+    finally:
+        shared.close()
+
+
+def main(n: int = 100_000, ntasks: int = 4):
+    objs = [
+        Record({"id": i, "body": {"title": f"record-{i}", "values": [i, i + 1]}})
+        for i in range(n)
+    ]
+    jsons = [obj.json for obj in objs]
+    with Record.to_shared(objs) as shared:
+        print(f"pickled dicts   {len(pickle.dumps(jsons)):10d} bytes per task")
+        print(f"pickled handle  {len(pickle.dumps(shared)):10d} bytes per task")
+        print(f"shared memory   {shared.nbytes:10d} bytes in total")
+        with ProcessPoolExecutor(max_workers=ntasks) as executor:
+            # start the workers
+            list(executor.map(abs, range(ntasks)))
+            for label, func, arg in [
+                ("pickled dicts", sum_pickled, jsons),
+                ("shared memory", sum_shared, shared),
+            ]:
+                t0 = time.perf_counter()
+                list(executor.map(func, [arg] * ntasks))
+                print(f"{label:<15} {(time.perf_counter() - t0) * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
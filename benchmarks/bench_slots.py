@@ -0,0 +1,45 @@
+"""
+Benchmark of memory usage of json class instances.
+
+One million instances wrapping the same small dictionary are created for a class
+with ``__dict__`` and for a slotted class (``__json_slots__ = True``), and the
+memory allocated for the instances is reported.
+
+>>> python -m benchmarks.bench_slots
+"""
+
+import gc
+import tracemalloc
+from elegant_json import JsonClass, Attr
+
+
+class Regular(JsonClass):
+    __json_template__ = {"id": Attr(), "name": Attr()}
+
+
+class Slotted(JsonClass):
+    __json_template__ = {"id": Attr(), "name": Attr()}
+    __json_slots__ = True
+
+
+def measure(cls, n: int) -> int:
+    d = {"id": 0, "name": "x"}
+    gc.collect()
+    tracemalloc.start()
+    objs = [cls(d) for _ in range(n)]
+    for obj in objs[:1000]:
+        obj.id  # read some attributes
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+    return current
+
+
+def main(n: int = 1_000_000):
+    for cls in [Regular, Slotted]:
+        size = measure(cls, n)
+        print(f"{cls.__name__:<8} {size / 1e6:8.1f} MB  ({size / n:5.1f} bytes/instance)")
+
+
+if __name__ == "__main__":
+    main()
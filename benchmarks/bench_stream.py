@@ -0,0 +1,60 @@
+"""
+Benchmark of record-stream loading.
+
+``JsonClass.iter_load`` is compared with reading all the lines at once by
+``[cls(json.loads(l)) for l in f]``. Throughput is reported in records per second.
+
+>>> python -m benchmarks.bench_stream
+"""
+
+from __future__ import annotations
+import json
+import tempfile
+import time
+from pathlib import Path
+from elegant_json import JsonClass, Attr
+
+
+class C(JsonClass):
+    __json_template__ = {"id": Attr(), "data": {"name": Attr(), "values": Attr()}}
+    id: int
+    name: str
+    values: list[int]
+
+
+def make_record(i: int) -> dict:
+    return {"id": i, "data": {"name": f"record-{i}", "values": [i, i + 1, i + 2]}}
+
+
+def _list_comprehension(path: Path):
+    with open(path, encoding="utf-8") as f:
+        return [C(json.loads(l)) for l in f]
+
+
+def _iter_load(path: Path, format: str):
+    for _ in C.iter_load(path, encoding="utf-8", format=format):
+        pass
+
+
+def main(n: int = 200000):
+    with tempfile.TemporaryDirectory() as tmp:
+        lines = Path(tmp) / "records.jsonl"
+        array = Path(tmp) / "records.json"
+        C.iter_dump(lines, (C(make_record(i)) for i in range(n)), encoding="utf-8")
+        C.iter_dump(
+            array, (C(make_record(i)) for i in range(n)), encoding="utf-8", format="array"
+        )
+        cases = [
+            ("list comprehension (lines)", lambda: _list_comprehension(lines)),
+            ("iter_load (lines)", lambda: _iter_load(lines, "lines")),
+            ("iter_load (array)", lambda: _iter_load(array, "array")),
+        ]
+        for label, func in cases:
+            t0 = time.perf_counter()
+            func()
+            t = time.perf_counter() - t0
+            print(f"{label:<28} {n / t:12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark of validation with type checking.
+
+``validate`` is compared with the presence-only ``isformatted`` on valid messages
+of different sizes.
+
+>>> python -m benchmarks.bench_validate
+"""
+
+import timeit
+import elegant_json as ej
+from elegant_json import JsonClass, Attr
+
+
+class Item(JsonClass):
+    __json_template__ = {"id": Attr(), "name": Attr(), "score": Attr()}
+    id: int
+    name: str
+    score: float
+
+
+class Message(JsonClass):
+    __json_template__ = {
+        "header": {"id": Attr("message_id"), "source": Attr(), "tags": Attr()},
+        "body": {"values": Attr(), "items": Attr()},
+    }
+    message_id: int
+    source: str
+    tags: list[str]
+    values: list[float]
+    items: list[Item]
+
+
+def make_message(n: int) -> dict:
+    return {
+        "header": {"id": 1, "source": "bench", "tags": ["a", "b"]},
+        "body": {
+            "values": [i * 0.5 for i in range(n)],
+            "items": [{"id": i, "name": str(i), "score": 1.0} for i in range(n)],
+        },
+    }
+
+
+def main(repeat: int = 5, number: int = 200):
+    for n in [0, 10, 100]:
+        msg = make_message(n)
+        cases = [
+            ("isformatted", lambda: ej.isformatted(msg, Message)),
+            ("validate", lambda: ej.validate(msg, Message)),
+            ("validate (fail_fast)", lambda: ej.validate(msg, Message, fail_fast=True)),
+        ]
+        print(f"list length={n}")
+        for label, func in cases:
+            t = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+            print(f"  {label:<22} {t * 1e6:8.2f} us/message")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,52 @@ __version__ = "0.1.1.dev0"
 from .core import (
     jsonclass,
     create_loader,
+    create_iter_loader,
     create_constructor,
+    diff,
     isformatted,
+    isformatted_many,
+    validate,
 )
 
 from ._json_class import JsonClass, Attr
+from ._json_async import configure_async
+from ._json_backend import (
+    JsonBackend,
+    available_backends,
+    register_backend,
+    set_backend,
+)
+from ._json_batch import LoadManyError
+from ._json_collection import JsonCollection
+from ._json_instrument import AccessEvent, AccessStats, instrument, uninstrument
+from ._json_shared import SharedDocuments
+from ._json_validation import Violation
+from ._json_view import ListView
 
 __all__ = [
+    "AccessEvent",
+    "AccessStats",
     "Attr",
+    "JsonBackend",
     "JsonClass",
+    "JsonCollection",
+    "ListView",
+    "LoadManyError",
+    "SharedDocuments",
     "jsonclass",
     "create_loader",
+    "create_iter_loader",
     "create_constructor",
+    "diff",
     "isformatted",
+    "isformatted_many",
+    "validate",
+    "available_backends",
+    "configure_async",
+    "register_backend",
+    "set_backend",
+    "instrument",
+    "uninstrument",
+    "Violation",
 ]
\ No newline at end of file
@@ -0,0 +1,103 @@
+from __future__ import annotations
+import asyncio
+import os
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterator, TypeVar
+
+_T = TypeVar("_T")
+
+# same as the default number of workers of ThreadPoolExecutor
+_DEFAULT_CONCURRENCY = min(32, (os.cpu_count() or 1) + 4)
+
+
+class _AsyncConfig:
+    """Executor and concurrency limit used by the async API."""
+
+    def __init__(self):
+        self.executor: Executor | None = None
+        self.max_concurrency = _DEFAULT_CONCURRENCY
+        # asyncio.Semaphore cannot be shared between event loops
+        self.semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        sem = self.semaphores.get(loop)
+        if sem is None:
+            sem = self.semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return sem
+
+
+_CONFIG = _AsyncConfig()
+
+
+def configure_async(
+    executor: Executor | None = None,
+    max_concurrency: int | None = None,
+) -> None:
+    """
+    Configure the async API of json classes.
+
+    Parameters
+    ----------
+    executor : Executor, optional
+        Executor that runs file I/O and parsing. The default executor of the event
+        loop is used if not given. Parsers of the standard library and orjson do
+        not release the GIL, so a ``ProcessPoolExecutor`` keeps the event loop more
+        responsive while large files are parsed.
+    max_concurrency : int, optional
+        Maximum number of files loaded or dumped at the same time in each event
+        loop. Same as the default number of workers of ``ThreadPoolExecutor`` if
+        not given.
+    """
+    if max_concurrency is None:
+        max_concurrency = _DEFAULT_CONCURRENCY
+    elif max_concurrency < 1:
+        raise ValueError(f"`max_concurrency` must be positive, got {max_concurrency}.")
+    _CONFIG.executor = executor
+    _CONFIG.max_concurrency = max_concurrency
+    _CONFIG.semaphores = weakref.WeakKeyDictionary()
+    return None
+
+
+async def run_bounded(func: Callable[[], _T]) -> _T:
+    """Run a function in the configured executor, bounded by the semaphore."""
+    loop = asyncio.get_running_loop()
+    async with _CONFIG.semaphore(loop):
+        return await loop.run_in_executor(_CONFIG.executor, func)
+
+
+async def aiter_bounded(
+    factory: Callable[[], Iterator[_T]],
+    batch_size: int,
+) -> AsyncIterator[_T]:
+    """
+    Iterate over an iterator created and advanced in the executor.
+
+    Items are fetched in batches to reduce the overhead of switching threads. The
+    iterator is kept in the worker, so that a process pool cannot be used. The
+    default executor of the event loop is used instead in that case.
+    """
+    loop = asyncio.get_running_loop()
+    executor = _CONFIG.executor
+    if isinstance(executor, ProcessPoolExecutor):
+        executor = None
+    sem = _CONFIG.semaphore(loop)
+    async with sem:
+        it = await loop.run_in_executor(executor, factory)
+    try:
+        while True:
+            async with sem:
+                batch = await loop.run_in_executor(
+                    executor, lambda: list(islice(it, batch_size))
+                )
+            for item in batch:
+                yield item
+            if len(batch) < batch_size:
+                break
+    finally:
+        close: Callable[[], Any] | None = getattr(it, "close", None)
+        if close is not None:
+            await loop.run_in_executor(executor, close)
@@ -1,34 +1,55 @@
 from __future__ import annotations
+import sys
 from types import GenericAlias
-from typing import Any, TYPE_CHECKING, ForwardRef, get_args, get_origin
+from functools import partial
+from typing import Any, Callable, TYPE_CHECKING, ForwardRef, get_args, get_origin
 from typing import _eval_type  # type: ignore
 
+from ._json_tree import key_repr
+from ._json_update import _identity, _invalidate_cache, _mark_dirty
+from ._json_view import ListView
+
 if TYPE_CHECKING:
     from ._json_class import JsonClass
 
 
 def _define_converter(annotation: type | GenericAlias | ForwardRef | None):
+    """
+    Compile a type annotation into a converter function.
+
+    The annotation is walked only once. Converters of nested generic aliases,
+    JsonClass types and forward references are all resolved here, so that the
+    returned function does not re-evaluate the annotation for every element.
+    """
     if annotation is None:
-        converter = lambda x: x
+        converter = _identity
     elif isinstance(annotation, GenericAlias):
         origin = get_origin(annotation)
         args = get_args(annotation)
         if origin is list:
-            arg = args[0]
-            if isinstance(arg, type):
-                converter = lambda x: list(_define_converter(arg)(a) for a in x)
+            conv = _define_item_converter(args[0], annotation)
+            if conv is _identity:
+                converter = list
             else:
-                raise ValueError(f"Wrong type annotation: {annotation!r}.")
+                converter = lambda x: [conv(a) for a in x]
         elif origin is dict:
             if args[0] is not str:
                 raise TypeError("Only dict[str, ...] is supported.")
-            val = args[1]
-            if isinstance(val, type):
-                converter = lambda x: {k: _define_converter(val)(v) for k, v in x.items()}
+            conv = _define_item_converter(args[1], annotation)
+            if conv is _identity:
+                converter = dict
             else:
-                raise ValueError(f"Wrong type annotation: {annotation!r}.")
+                converter = lambda x: {k: conv(v) for k, v in x.items()}
         elif origin is tuple:
-            converter = lambda x: tuple(_define_converter(arg)(a) for arg, a in zip(args, x))
+            if len(args) == 2 and args[1] is Ellipsis:
+                conv = _define_item_converter(args[0], annotation)
+                converter = lambda x: tuple([conv(a) for a in x])
+            else:
+                convs = tuple(_define_item_converter(arg, annotation) for arg in args)
+                converter = lambda x: tuple([c(a) for c, a in zip(convs, x)])
+        elif origin is ListView:
+            conv = _define_item_converter(args[0], annotation)
+            converter = partial(ListView, converter=conv)
         else:
             raise ValueError(f"Wrong type annotation: {annotation!r}.")
     elif isinstance(annotation, (str, ForwardRef)):
@@ -36,11 +57,219 @@ def _define_converter(annotation: type | GenericAlias | ForwardRef | None):
             annotation = ForwardRef(annotation)
         converter = _define_converter(_eval_type(annotation, None, None))
     elif type(annotation) is type or hasattr(annotation, "__json_template__"):
-        converter = lambda x: annotation(x)
+        converter = annotation
     else:
-        converter = lambda x: x
+        converter = _identity
     return converter
 
+
+def _is_array_annotation(annotation: Any) -> bool:
+    """True if the annotation is a numpy dtype, scalar type or array type."""
+    np = sys.modules.get("numpy")
+    if np is None:
+        # numpy objects cannot be given without importing numpy
+        return False
+    if isinstance(annotation, np.dtype) or annotation is np.ndarray:
+        return True
+    if isinstance(annotation, type):
+        return issubclass(annotation, np.generic)
+    return get_origin(annotation) is np.ndarray
+
+
+def _array_dtype(annotation: Any):
+    """Get the dtype of the array converted from a type annotation."""
+    import numpy as np
+    
+    if annotation is None or annotation is np.ndarray:
+        return None
+    if isinstance(annotation, (str, ForwardRef)):
+        if isinstance(annotation, str):
+            try:
+                return np.dtype(annotation)
+            except TypeError:
+                annotation = ForwardRef(annotation)
+        return _array_dtype(_eval_type(annotation, None, None))
+    origin = get_origin(annotation)
+    if origin is np.ndarray:
+        # such as numpy.typing.NDArray[np.float32]
+        dtype_args = get_args(get_args(annotation)[1])
+        return _array_dtype(dtype_args[0]) if dtype_args else None
+    if origin in (list, tuple):
+        # element type of nested lists such as list[list[float]]
+        return _array_dtype(get_args(annotation)[0])
+    if annotation is Any:
+        return None
+    return np.dtype(annotation)
+
+
+def _define_array_converter(annotation: Any) -> Callable[[Any], Any]:
+    """Compile a type annotation into a converter to a numpy array."""
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for array attributes.") from None
+    
+    dtype = _array_dtype(annotation)
+    return partial(np.asarray, dtype=dtype)
+
+
+def _define_item_converter(arg, annotation: GenericAlias):
+    """Compile the converter of an argument of a generic alias."""
+    if not isinstance(arg, (type, GenericAlias, ForwardRef, str)):
+        raise ValueError(f"Wrong type annotation: {annotation!r}.")
+    return _define_converter(arg)
+
+
+def _link_nested(value: Any, owner: JsonClass, path: tuple[str | int, ...]) -> None:
+    """Set the owner of the json class objects and list views in a converted value."""
+    if hasattr(value, "__json_template__"):
+        value._json_parent = (owner, path)
+    elif isinstance(value, ListView):
+        value._parent = (owner, path)
+    elif isinstance(value, (list, tuple)):
+        for i, v in enumerate(value):
+            _link_nested(v, owner, path + (i,))
+    elif isinstance(value, dict):
+        for k, v in value.items():
+            _link_nested(v, owner, path + (k,))
+    return None
+
+
+def _has_links(annotation: Any) -> bool:
+    """
+    True if the values converted by the annotation may have json class objects or
+    list views, which report their updates to the owner.
+    """
+    if isinstance(annotation, GenericAlias):
+        if get_origin(annotation) is ListView:
+            return True
+        return any(_has_links(arg) for arg in get_args(annotation))
+    if isinstance(annotation, (str, ForwardRef)):
+        if isinstance(annotation, str):
+            annotation = ForwardRef(annotation)
+        return _has_links(_eval_type(annotation, None, None))
+    return hasattr(annotation, "__json_template__")
+
+
+_GETTER_TEMPLATE = """
+def fget(self):
+{cache_lookup}    try:
+        value = self._json{path}
+    except (KeyError, IndexError):
+        value = _attr.default
+{convert}{cache_store}    return value
+"""
+
+_SETTER_TEMPLATE = """
+def fset(self, value):
+{to_list}    parent = self._json{parent_path}
+    existed = {existed}
+    parent[{key}] = value
+    cache = getattr(self, "_json_cache", None)
+    if cache:
+        _invalidate_cache(cache, _path)
+    _mark_dirty(self, _path, existed)
+"""
+
+# arrays and list views are saved as lists
+_TO_LIST = """\
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+"""
+
+_CACHE_LOOKUP = """\
+    cache = getattr(self, "_json_cache", None)
+    if cache is None:
+        cache = self._json_cache = {}
+    elif _path in cache:
+        return cache[_path]
+"""
+
+_CACHE_STORE = """\
+    cache[_path] = value
+"""
+
+_CONVERT = """\
+    else:
+        value = _conv(value)
+"""
+
+# reuse the nested json class object as long as it wraps the same dict
+_CONVERT_NESTED = """\
+    else:
+        cache = getattr(self, "_json_cache", None)
+        if cache is None:
+            cache = self._json_cache = {}
+        else:
+            obj = cache.get(_path)
+            if obj is not None and obj._json is value:
+                return obj
+        value = cache[_path] = _conv(value)
+        value._json_parent = (self, _path)
+"""
+
+# json class objects in the converted value report their updates to self
+_CONVERT_LINKED = """\
+    else:
+        value = _conv(value)
+        _link_nested(value, self, _path)
+"""
+
+
+def _generate_accessors(
+    attr: Attr,
+    path: tuple[str | int, ...],
+    converter: Callable[[Any], Any],
+    to_list: bool = False,
+    linked: bool = False,
+) -> tuple[Callable[[Any], Any], Callable[[Any, Any], None] | None]:
+    """Generate a getter and a setter specialized for a key path."""
+    # generated functions and globals have fixed names, so that any attribute
+    # name, even "path" or a keyword, can be used
+    ns: dict[str, Any] = {
+        "_attr": attr,
+        "_conv": converter,
+        "_path": path,
+        "_invalidate_cache": _invalidate_cache,
+        "_mark_dirty": _mark_dirty,
+        "_link_nested": _link_nested,
+    }
+    path_code = "".join(f"[{key_repr(k, ns)}]" for k in path)
+    if attr.cache:
+        cache_lookup, cache_store = _CACHE_LOOKUP, _CACHE_STORE
+    else:
+        cache_lookup = cache_store = ""
+    if converter is _identity:
+        convert = ""
+    elif hasattr(converter, "__json_template__") and not attr.cache:
+        convert = _CONVERT_NESTED
+    elif linked:
+        convert = _CONVERT_LINKED
+    else:
+        convert = _CONVERT
+    src = _GETTER_TEMPLATE.format(
+        path=path_code,
+        cache_lookup=cache_lookup,
+        convert=convert,
+        cache_store=cache_store,
+    )
+    if attr.mutable:
+        key = key_repr(path[-1], ns)
+        src += _SETTER_TEMPLATE.format(
+            to_list=_TO_LIST if to_list else "",
+            parent_path="".join(f"[{key_repr(k, ns)}]" for k in path[:-1]),
+            key=key,
+            # list items always exist, otherwise assignment fails
+            existed="True" if isinstance(path[-1], int) else f"{key} in parent",
+        )
+    exec(src, ns)
+    fget, fset = ns["fget"], ns.get("fset")
+    for func in (fget, fset):
+        if func is not None:
+            func.__name__ = func.__qualname__ = attr.name
+    return fget, fset
+
+
 class JsonProperty(property):
     def keys(self) -> list[str | int]:
         return self._keys
@@ -48,6 +277,18 @@ class JsonProperty(property):
     def set_keys(self, keys):
         self._keys = keys
     
+    def attr(self) -> Attr:
+        return self._attr
+    
+    def set_attr(self, attr: Attr):
+        self._attr = attr
+    
+    def converter(self) -> Callable[[Any], Any]:
+        return self._converter
+    
+    def set_converter(self, converter: Callable[[Any], Any]):
+        self._converter = converter
+    
     def getter(self, fget) -> JsonProperty:
         return self.__class__(fget, self.fset, self.fdel, self.__doc__)
     
@@ -56,7 +297,13 @@ class JsonProperty(property):
 
 
 class Attr:
-    """Attribute class for JsonClass."""
+    """
+    Attribute class for JsonClass.
+    
+    If ``array=True``, or the annotation is a numpy dtype or array type, the value
+    is converted into a numpy array of the dtype given by the annotation, such as
+    ``float`` or ``list[list[float]]``. Arrays are saved as lists.
+    """
     
     def __init__(
         self,
@@ -65,12 +312,17 @@ class Attr:
         *,
         default = None,
         mutable: bool | None = None,
+        cache: bool | None = None,
+        array: bool = False,
     ):
         self.name = name
         self.default = default
         self.mutable = mutable or False
         self.mutability_given = mutable is not None
+        self.cache = cache or False
+        self.cache_given = cache is not None
         self.annotation = annotation
+        self.array = array
         
     @property
     def name(self) -> str | None:
@@ -82,8 +334,29 @@ class Attr:
             raise ValueError(f"{value!r} is not an identifier.")
         self._name = value
     
-    def to_property(self, keys: list[str | int]) -> JsonProperty:
-        converter = _define_converter(self.annotation)
+    def to_property(self, keys: list[str | int], codegen: bool = False) -> JsonProperty:
+        """
+        Convert the attribute into a json property at the given key path.
+        
+        If ``codegen`` is true, the getter and the setter are compiled from
+        generated source code specialized for the key path.
+        """
+        array = self.array or _is_array_annotation(self.annotation)
+        if array:
+            converter = _define_array_converter(self.annotation)
+        else:
+            converter = _define_converter(self.annotation)
+        to_list = array or get_origin(self.annotation) is ListView
+        linked = not array and _has_links(self.annotation)
+        path = tuple(keys)
+        if codegen:
+            fget, fset = _generate_accessors(self, path, converter, to_list, linked)
+            prop = JsonProperty(fget, fset)
+            prop.set_keys(keys)
+            prop.set_attr(self)
+            prop.set_converter(converter)
+            return prop
+        
         def fget(jself: JsonClass):
             out: Any = jself._json
             try:
@@ -95,22 +368,77 @@ class Attr:
                 out = converter(out)
             return out
         
+        if linked:
+            # nested json class objects report their updates to this object
+            _fget_unlinked = fget
+            def fget(jself: JsonClass):
+                out = _fget_unlinked(jself)
+                _link_nested(out, jself, path)
+                return out
+        
+        if hasattr(converter, "__json_template__") and not self.cache:
+            # Reuse the nested json class object as long as it wraps the same dict.
+            def fget(jself: JsonClass):
+                out: Any = jself._json
+                try:
+                    for k in keys:
+                        out = out[k]
+                except (KeyError, IndexError):
+                    return self.default
+                cache = getattr(jself, "_json_cache", None)
+                if cache is None:
+                    cache = jself._json_cache = {}
+                else:
+                    obj = cache.get(path)
+                    if obj is not None and obj._json is out:
+                        return obj
+                obj = cache[path] = converter(out)
+                obj._json_parent = (jself, path)
+                return obj
+        
+        elif self.cache:
+            _fget = fget
+            def fget(jself: JsonClass):
+                cache = getattr(jself, "_json_cache", None)
+                if cache is None:
+                    cache = jself._json_cache = {}
+                elif path in cache:
+                    return cache[path]
+                out = cache[path] = _fget(jself)
+                return out
+        
         prop = JsonProperty(fget)
         
         if self.mutable:
             def fset(jself: JsonClass, value):
+                if to_list and hasattr(value, "tolist"):
+                    # arrays and list views are saved as lists
+                    value = value.tolist()
                 out: Any = jself._json
                 for k in keys[:-1]:
                     out = out[k]
-                out[keys[-1]] = value
+                key = keys[-1]
+                existed = isinstance(key, int) or key in out
+                out[key] = value
+                cache = getattr(jself, "_json_cache", None)
+                if cache:
+                    _invalidate_cache(cache, path)
+                _mark_dirty(jself, path, existed)
                 return None
         
             prop = prop.setter(fset)
         
         prop.set_keys(keys)
+        prop.set_attr(self)
+        prop.set_converter(converter)
         return prop
     
     def __copy__(self) -> Attr:
         return self.__class__(
-            self.name, self.annotation, default=self.default, mutable=self.mutable
+            self.name,
+            self.annotation,
+            default=self.default,
+            mutable=self.mutable,
+            cache=self.cache,
+            array=self.array,
         )
\ No newline at end of file
@@ -0,0 +1,293 @@
+from __future__ import annotations
+import json
+import math
+from typing import Any, Callable, TextIO
+
+_AUTO = "auto"
+
+# orjson and ujson parse integers with more than 19 digits as floats or fail
+_DIGITS_TABLE = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGITS = b"0" * 20
+_CHUNK = 1 << 20
+
+
+def _may_have_big_int(s: str | bytes | memoryview) -> bool:
+    """
+    Check if the input has an integer token of 20 or more digits.
+
+    The input is scanned in chunks, so that only a chunk is copied at a time.
+    Digits in strings are ignored unless they look like a number after ":", "["
+    or ",".
+    """
+    n = len(s)
+    for start in range(0, n, _CHUNK):
+        # overlap the chunks so that a run of digits is not split
+        chunk = s[start:start + _CHUNK + len(_LONG_DIGITS) - 1]
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8", "surrogatepass")
+        elif not isinstance(chunk, bytes):
+            chunk = bytes(chunk)
+        # translate + find is much faster than searching with a regular expression
+        digits = chunk.translate(_DIGITS_TABLE)
+        pos = digits.find(_LONG_DIGITS)
+        while pos >= 0:
+            if _is_number_token(digits, pos):
+                return True
+            pos = digits.find(_LONG_DIGITS, pos + len(_LONG_DIGITS))
+    return False
+
+
+def _is_number_token(digits: bytes, pos: int) -> bool:
+    """Check if the run of digits at ``pos`` starts a number, not a part of a string."""
+    i = pos - 1
+    if i >= 0 and digits[i] == 0x2d:  # "-"
+        i -= 1
+    while i >= 0 and digits[i] in b" \t\n\r":
+        i -= 1
+    # the start of a chunk is ambiguous
+    return i < 0 or digits[i] in b":[,"
+
+
+def _stdlib_format(out: bytes) -> str | None:
+    """
+    Format the indented output of an accelerated serializer as ``json.dumps``.
+
+    Structural commas are the only ones followed by a newline, and strings never
+    contain raw newlines, so removing the indentation gives the ``", "`` and
+    ``": "`` separators. None is returned if the output has characters that
+    ``json.dumps`` escapes, or floats that may be formatted differently.
+    """
+    if (
+        not out.isascii()
+        or b"\x7f" in out
+        or b"0.0000" in out
+        or b"0e" in out.translate(_DIGITS_TABLE)
+    ):
+        return None
+    out = out.replace(b",\n", b", \n")
+    while b"\n  " in out:
+        out = out.replace(b"\n  ", b"\n")
+    return out.replace(b"\n", b"").decode()
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    """Check if the object has NaN or infinity."""
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, dict):
+            stack.extend(x.values())
+        elif isinstance(x, (list, tuple)):
+            stack.extend(x)
+        elif isinstance(x, float) and not math.isfinite(x):
+            return True
+    return False
+
+
+class JsonBackend:
+    """
+    A pair of a JSON parser and a serializer.
+
+    ``loads`` must accept both str and bytes, and ``dumps`` must return a str
+    formatted as ``json.dumps`` with the default arguments.
+    If ``buffer`` is true, ``loads`` also accepts a memoryview of UTF-8 bytes, so
+    that memory-mapped files are decoded without copying. Backends are pickled by
+    their names.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[str | bytes], Any],
+        dumps: Callable[[Any], str],
+        buffer: bool = False,
+    ):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.buffer = buffer
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r})"
+
+    def __reduce__(self):
+        return get_backend, (self.name,)
+
+
+def _stdlib_backend() -> JsonBackend:
+    return JsonBackend("json", json.loads, json.dumps)
+
+
+def _orjson_backend() -> JsonBackend:
+    import orjson
+
+    _loads, _dumps = orjson.loads, orjson.dumps
+
+    def loads(s: str | bytes | memoryview) -> Any:
+        if not _may_have_big_int(s):
+            try:
+                return _loads(s)
+            except orjson.JSONDecodeError:
+                pass
+        # NaN, big integers or other encodings than UTF-8
+        if isinstance(s, memoryview):
+            s = s.tobytes()
+        return json.loads(s)
+
+    def dumps(obj: Any) -> str:
+        try:
+            out = _dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # non-str keys, big integers etc.
+            return json.dumps(obj)
+        if b"null" in out and _has_nonfinite(obj):
+            # orjson serializes NaN and infinity as null
+            return json.dumps(obj)
+        s = _stdlib_format(out)
+        return json.dumps(obj) if s is None else s
+
+    return JsonBackend("orjson", loads, dumps, buffer=True)
+
+
+def _ujson_backend() -> JsonBackend:
+    import ujson
+
+    _loads, _dumps = ujson.loads, ujson.dumps
+
+    def loads(s: str | bytes) -> Any:
+        if not _may_have_big_int(s):
+            try:
+                return _loads(s)
+            except ValueError:
+                pass
+        return json.loads(s)
+
+    def dumps(obj: Any) -> str:
+        try:
+            out = _dumps(obj, ensure_ascii=False, escape_forward_slashes=False, indent=2)
+        except (TypeError, OverflowError):
+            return json.dumps(obj)
+        s = _stdlib_format(out.encode("utf-8", "surrogatepass"))
+        return json.dumps(obj) if s is None else s
+
+    return JsonBackend("ujson", loads, dumps)
+
+
+# built-in backends are created on demand to import the libraries lazily
+_BUILTIN_BACKENDS: dict[str, Callable[[], JsonBackend]] = {
+    "json": _stdlib_backend,
+    "orjson": _orjson_backend,
+    "ujson": _ujson_backend,
+}
+
+# order of preference for "auto"
+_PREFERENCE = ("orjson", "ujson", "json")
+
+_BACKENDS: dict[str, JsonBackend] = {}
+_default = _AUTO
+
+
+def register_backend(
+    name: str,
+    loads: Callable[[str | bytes], Any],
+    dumps: Callable[[Any], str],
+    buffer: bool = False,
+) -> JsonBackend:
+    """
+    Register a JSON backend.
+
+    Parameters
+    ----------
+    name : str
+        Name of the backend.
+    loads : callable
+        Function that deserializes a str or bytes object.
+    dumps : callable
+        Function that serializes an object into a str.
+    buffer : bool, default is False
+        If true, ``loads`` also accepts a memoryview of UTF-8 bytes.
+
+    Returns
+    -------
+    JsonBackend
+        The registered backend.
+    """
+    if name == _AUTO:
+        raise ValueError(f"{_AUTO!r} is reserved.")
+    backend = _BACKENDS[name] = JsonBackend(name, loads, dumps, buffer)
+    return backend
+
+
+def get_backend(name: str | None = None) -> JsonBackend:
+    """
+    Get a JSON backend by its name.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name of the backend. If not given, the default backend is returned. If
+        "auto", the fastest installed one of "orjson", "ujson" and "json" is
+        returned.
+
+    Returns
+    -------
+    JsonBackend
+        The backend.
+    """
+    if name is None:
+        name = _default
+    if name == _AUTO:
+        for name in _PREFERENCE:
+            try:
+                return get_backend(name)
+            except ImportError:
+                pass
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        factory = _BUILTIN_BACKENDS.get(name)
+        if factory is None:
+            raise ValueError(f"Unknown JSON backend: {name!r}.")
+        backend = _BACKENDS[name] = factory()
+    return backend
+
+
+def set_backend(name: str) -> None:
+    """
+    Set the default JSON backend.
+
+    The default backend is used by all the json classes that do not define
+    ``__json_backend__``. It is "auto" unless changed. All the built-in backends
+    give the same values and the same outputs of ``dumps``.
+
+    Parameters
+    ----------
+    name : str
+        Name of the backend, such as "json", "orjson", "ujson" or "auto".
+    """
+    global _default
+    get_backend(name)  # check if available
+    _default = name
+    return None
+
+
+def available_backends() -> list[str]:
+    """Return the names of the backends that can be used in this environment."""
+    names: list[str] = []
+    for name in {**_BUILTIN_BACKENDS, **_BACKENDS}:
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def write_json(f: TextIO, obj: Any, dumps: Callable[[Any], str]) -> None:
+    """Write a serialized object to a text file."""
+    s = dumps(obj)
+    try:
+        f.write(s)
+    except UnicodeEncodeError:
+        # the file encoding cannot represent some characters; escape them
+        f.write(json.dumps(obj))
+    return None
@@ -0,0 +1,96 @@
+from __future__ import annotations
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Literal, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._json_class import JsonClass
+
+ExecutorType = Literal["process", "thread"]
+
+
+class LoadManyError(Exception):
+    """
+    Exception raised after a batch loading if some of the files failed.
+    
+    Attributes
+    ----------
+    results : list
+        Loaded objects in the input order. Failed paths are filled with None.
+    errors : dict
+        Exception raised for each failed path.
+    """
+    
+    def __init__(
+        self,
+        results: list[JsonClass | None],
+        errors: dict[str | Path | bytes, BaseException],
+    ):
+        self.results = results
+        self.errors = errors
+        super().__init__(
+            f"Failed to load {len(errors)} of {len(results)} files: "
+            f"{list(errors.keys())!r}"
+        )
+
+
+def _try_call(func: Callable[[Any], Any], path) -> tuple[Any, BaseException | None]:
+    try:
+        return func(path), None
+    except Exception as e:
+        return None, e
+
+
+def load_many(
+    cls: type[JsonClass],
+    paths: Sequence[str | Path | bytes],
+    load_func: Callable[[str | Path | bytes], dict[str, Any]],
+    workers: int | None = None,
+    executor: ExecutorType | Executor = "process",
+) -> list[JsonClass]:
+    """
+    Parse files in parallel and create json class objects in the input order.
+    
+    ``load_func`` must be picklable if a process pool is used. Files are parsed in
+    workers and only the decoded dictionaries are sent back, so that ``cls`` itself
+    is not needed in the workers.
+    """
+    paths = list(paths)
+    if isinstance(executor, Executor):
+        outputs = _map(executor, load_func, paths, workers)
+    elif executor == "process":
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outputs = _map(pool, load_func, paths, workers or os.cpu_count())
+    elif executor == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outputs = _map(pool, load_func, paths, workers)
+    else:
+        raise ValueError(f"`executor` must be 'process' or 'thread', got {executor!r}.")
+    
+    results: list[JsonClass | None] = []
+    errors: dict[str | Path | bytes, BaseException] = {}
+    for path, (js, err) in zip(paths, outputs):
+        if err is None:
+            try:
+                results.append(cls(js))
+                continue
+            except Exception as e:
+                err = e
+        results.append(None)
+        errors[path] = err
+    if errors:
+        raise LoadManyError(results, errors)
+    return results  # type: ignore
+
+
+def _map(
+    pool: Executor,
+    load_func: Callable[[str | Path | bytes], dict[str, Any]],
+    paths: list[str | Path | bytes],
+    workers: int | None,
+) -> list[tuple[Any, BaseException | None]]:
+    # send paths in chunks to reduce the inter-process overhead
+    chunksize = max(1, len(paths) // ((workers or 1) * 4))
+    return list(pool.map(partial(_try_call, load_func), paths, chunksize=chunksize))
@@ -0,0 +1,533 @@
+from __future__ import annotations
+import struct
+import zlib
+from typing import Any, Callable, Iterable, Sequence
+
+from ._json_tree import MISSING, key_repr
+
+# The values are encoded in the MessagePack format. The msgpack library is used
+# if installed, otherwise the pure Python implementation below. The fallback
+# gives the same output, but is about 2x slower than json.dumps to encode and
+# 3x slower than json.loads to decode; it only saves space.
+
+_MAGIC = b"EJB"
+_VERSION = 2
+_SINGLE = 0
+_BATCH = 1
+
+# MessagePack extension type of integers that do not fit in 64 bits
+_EXT_BIGINT = 0
+
+_HEADER = struct.Struct("<3sBBI")  # magic, version, kind, schema id
+_COUNT = struct.Struct("<Q")
+
+_pack_d = struct.Struct(">d").pack
+_unpack_d = struct.Struct(">d").unpack_from
+_pack_b = struct.Struct(">b").pack
+_pack_h = struct.Struct(">h").pack
+_pack_i = struct.Struct(">i").pack
+_pack_q = struct.Struct(">q").pack
+_pack_B = struct.Struct(">B").pack
+_pack_H = struct.Struct(">H").pack
+_pack_I = struct.Struct(">I").pack
+_pack_Q = struct.Struct(">Q").pack
+
+
+def _pack(obj: Any, buf: bytearray) -> None:
+    """Append the MessagePack encoding of a json value to ``buf``."""
+    t = type(obj)
+    if t is str:
+        b = obj.encode("utf-8", "surrogatepass")
+        n = len(b)
+        if n < 32:
+            buf.append(0xa0 | n)
+        elif n < 0x100:
+            buf += b"\xd9" + _pack_B(n)
+        elif n < 0x10000:
+            buf += b"\xda" + _pack_H(n)
+        else:
+            buf += b"\xdb" + _pack_I(n)
+        buf += b
+    elif t is int:
+        if 0 <= obj < 0x80:
+            buf.append(obj)
+        elif -32 <= obj < 0:
+            buf.append(obj & 0xff)
+        elif 0 <= obj:
+            if obj < 0x100:
+                buf += b"\xcc" + _pack_B(obj)
+            elif obj < 0x10000:
+                buf += b"\xcd" + _pack_H(obj)
+            elif obj < 0x100000000:
+                buf += b"\xce" + _pack_I(obj)
+            elif obj < 0x10000000000000000:
+                buf += b"\xcf" + _pack_Q(obj)
+            else:
+                _pack_bigint(obj, buf)
+        elif obj >= -0x80:
+            buf += b"\xd0" + _pack_b(obj)
+        elif obj >= -0x8000:
+            buf += b"\xd1" + _pack_h(obj)
+        elif obj >= -0x80000000:
+            buf += b"\xd2" + _pack_i(obj)
+        elif obj >= -0x8000000000000000:
+            buf += b"\xd3" + _pack_q(obj)
+        else:
+            _pack_bigint(obj, buf)
+    elif t is float:
+        buf += b"\xcb" + _pack_d(obj)
+    elif obj is None:
+        buf.append(0xc0)
+    elif obj is True:
+        buf.append(0xc3)
+    elif obj is False:
+        buf.append(0xc2)
+    elif t is list or t is tuple:
+        n = len(obj)
+        if n < 16:
+            buf.append(0x90 | n)
+        elif n < 0x10000:
+            buf += b"\xdc" + _pack_H(n)
+        else:
+            buf += b"\xdd" + _pack_I(n)
+        for item in obj:
+            _pack(item, buf)
+    elif t is dict:
+        n = len(obj)
+        if n < 16:
+            buf.append(0x80 | n)
+        elif n < 0x10000:
+            buf += b"\xde" + _pack_H(n)
+        else:
+            buf += b"\xdf" + _pack_I(n)
+        for k, v in obj.items():
+            _pack(k, buf)
+            _pack(v, buf)
+    elif isinstance(obj, (str, int, float, list, tuple, dict)):
+        # subclasses such as IntEnum
+        for base in (bool, str, int, float, list, dict):
+            if isinstance(obj, base):
+                return _pack(base(obj), buf)
+        return _pack(list(obj), buf)
+    else:
+        raise TypeError(f"Object of type {t.__name__} is not JSON serializable")
+    return None
+
+
+def _pack_bigint(obj: int, buf: bytearray) -> None:
+    data = str(obj).encode()
+    n = len(data)
+    if n < 0x100:
+        buf += b"\xc7" + _pack_B(n)
+    elif n < 0x10000:
+        buf += b"\xc8" + _pack_H(n)
+    else:
+        buf += b"\xc9" + _pack_I(n)
+    buf += _pack_b(_EXT_BIGINT) + data
+
+
+def _unpack(data: bytes, pos: int) -> tuple[Any, int]:
+    """Decode a MessagePack value at ``pos``, returning the next position."""
+    b = data[pos]
+    pos += 1
+    if b < 0x80:
+        return b, pos
+    if b >= 0xe0:
+        return b - 0x100, pos
+    if 0xa0 <= b < 0xc0:
+        end = pos + (b & 0x1f)
+        return data[pos:end].decode("utf-8", "surrogatepass"), end
+    if 0x90 <= b < 0xa0:
+        return _unpack_array(data, pos, b & 0x0f)
+    if 0x80 <= b < 0x90:
+        return _unpack_map(data, pos, b & 0x0f)
+    if b == 0xc0:
+        return None, pos
+    if b == 0xc2:
+        return False, pos
+    if b == 0xc3:
+        return True, pos
+    if b == 0xcb:
+        return _unpack_d(data, pos)[0], pos + 8
+    if b == 0xca:
+        return struct.unpack_from(">f", data, pos)[0], pos + 4
+    if 0xcc <= b <= 0xcf:
+        n = 1 << (b - 0xcc)
+        return int.from_bytes(data[pos:pos + n], "big"), pos + n
+    if 0xd0 <= b <= 0xd3:
+        n = 1 << (b - 0xd0)
+        return int.from_bytes(data[pos:pos + n], "big", signed=True), pos + n
+    if 0xd9 <= b <= 0xdb:
+        n = 1 << (b - 0xd9)
+        size = int.from_bytes(data[pos:pos + n], "big")
+        start = pos + n
+        return data[start:start + size].decode("utf-8", "surrogatepass"), start + size
+    if b == 0xdc or b == 0xdd:
+        n = 2 if b == 0xdc else 4
+        return _unpack_array(data, pos + n, int.from_bytes(data[pos:pos + n], "big"))
+    if b == 0xde or b == 0xdf:
+        n = 2 if b == 0xde else 4
+        return _unpack_map(data, pos + n, int.from_bytes(data[pos:pos + n], "big"))
+    if 0xc7 <= b <= 0xc9:
+        n = 1 << (b - 0xc7)
+        size = int.from_bytes(data[pos:pos + n], "big")
+        code = struct.unpack_from(">b", data, pos + n)[0]
+        start = pos + n + 1
+        return _ext_hook(code, data[start:start + size]), start + size
+    raise ValueError(f"Unsupported MessagePack type 0x{b:02x} at {pos - 1}.")
+
+
+def _unpack_array(data: bytes, pos: int, n: int) -> tuple[list[Any], int]:
+    out = []
+    append = out.append
+    for _ in range(n):
+        b = data[pos]
+        if b < 0x80:
+            # positive fixint is the most frequent item
+            append(b)
+            pos += 1
+        else:
+            item, pos = _unpack(data, pos)
+            append(item)
+    return out, pos
+
+
+def _unpack_map(data: bytes, pos: int, n: int) -> tuple[dict[Any, Any], int]:
+    out = {}
+    for _ in range(n):
+        b = data[pos]
+        if 0xa0 <= b < 0xc0:
+            # keys are mostly short strings
+            end = pos + 1 + (b & 0x1f)
+            key = data[pos + 1:end].decode("utf-8", "surrogatepass")
+            pos = end
+        else:
+            key, pos = _unpack(data, pos)
+        out[key], pos = _unpack(data, pos)
+    return out, pos
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_BIGINT:
+        return int(data)
+    raise ValueError(f"Unknown MessagePack extension type {code}.")
+
+
+def _packb_py(obj: Any) -> bytes:
+    buf = bytearray()
+    _pack(obj, buf)
+    return bytes(buf)
+
+
+def _unpackb_py(data: bytes) -> Any:
+    obj, pos = _unpack(data, 0)
+    if pos != len(data):
+        raise ValueError("Extra data after a MessagePack value.")
+    return obj
+
+
+def _msgpack_functions() -> tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    try:
+        import msgpack
+    except ImportError:
+        return _packb_py, _unpackb_py
+
+    def packb(obj: Any) -> bytes:
+        try:
+            return msgpack.packb(obj, use_bin_type=True)
+        except (OverflowError, TypeError, UnicodeEncodeError):
+            # big integers, lone surrogates or subclasses of json types
+            return _packb_py(obj)
+
+    def unpackb(data: bytes) -> Any:
+        return msgpack.unpackb(
+            data,
+            raw=False,
+            strict_map_key=False,
+            ext_hook=_ext_hook,
+            unicode_errors="surrogatepass",
+        )
+
+    return packb, unpackb
+
+
+packb, unpackb = _msgpack_functions()
+
+
+# placeholder of a value stripped from a document
+_HOLE = None
+
+
+class BinaryCodec:
+    """
+    Encoder and decoder of the documents of a json class.
+
+    A document is encoded as a bitmap of the present attribute values followed by
+    a MessagePack array of the values in the template order. Parts of the
+    document outside the attributes are appended to the array as the residual
+    document, unless they are the same as the template.
+    """
+
+    def __init__(
+        self,
+        build: Callable[..., dict[str, Any]],
+        extract: Callable[[Any], list[Any]],
+        paths: Sequence[tuple[str | int, ...]],
+    ):
+        self.build = build
+        self.extract = extract
+        self.paths = tuple(paths)
+        self.nbytes = (len(self.paths) + 7) // 8
+        self.full = (1 << len(self.paths)) - 1
+        full_template = build(*[MISSING] * len(self.paths))
+        self.skeleton = _strip(full_template, self.paths)
+        self.schema_id = zlib.crc32(repr((self.paths, self.skeleton)).encode())
+        self.matches = _compile_matcher(full_template)
+        # container types along each key path, which must match to strip a value
+        self.path_types = [
+            _container_types(full_template, path) for path in self.paths
+        ]
+        self._indices: dict[int, list[int]] = {}
+        self._skeletons: dict[int, Any] = {}
+
+    def encode(self, obj: dict[str, Any]) -> bytes:
+        """Encode a json dictionary."""
+        values = self.extract(obj)
+        if MISSING not in values and self.matches(obj):
+            return self.full.to_bytes(self.nbytes, "little") + packb(values)
+        bitmap = 0
+        present: list[Any] = []
+        present_paths: list[tuple[str | int, ...]] = []
+        for i, (path, types) in enumerate(zip(self.paths, self.path_types)):
+            # the extractor does not check types, such as indexing a str
+            v = _lookup(obj, path, types)
+            if v is not MISSING:
+                bitmap |= 1 << i
+                present.append(v)
+                present_paths.append(path)
+        residual = _strip(obj, present_paths)
+        if not _same(residual, self.skeleton_of(bitmap)):
+            present.append(residual)
+        return bitmap.to_bytes(self.nbytes, "little") + packb(present)
+
+    def skeleton_of(self, bitmap: int) -> Any:
+        """The template without the missing values, and the present values stripped."""
+        skeleton = self._skeletons.get(bitmap)
+        if skeleton is None:
+            args = [_HOLE if bitmap >> i & 1 else MISSING for i in range(len(self.paths))]
+            skeleton = self._skeletons[bitmap] = self._remove_missing(
+                self.build(*args), args
+            )
+        return skeleton
+
+    def _remove_missing(self, obj: dict[str, Any], args: list[Any]) -> dict[str, Any]:
+        # list items can be missing only at the end, so remove from the last
+        for path, v in zip(reversed(self.paths), reversed(args)):
+            if v is MISSING:
+                parent = obj
+                for k in path[:-1]:
+                    parent = parent[k]
+                del parent[path[-1]]
+        return obj
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        """Decode an encoded json dictionary."""
+        nbytes = self.nbytes
+        bitmap = int.from_bytes(data[:nbytes], "little")
+        present = unpackb(data[nbytes:])
+        if bitmap == self.full and len(present) == len(self.paths):
+            return self.build(*present)
+        indices = self._indices.get(bitmap)
+        if indices is None:
+            indices = self._indices[bitmap] = [
+                i for i in range(len(self.paths)) if bitmap >> i & 1
+            ]
+        if len(present) == len(indices):
+            # the same structure as the template
+            args = [MISSING] * len(self.paths)
+            for i, v in zip(indices, present):
+                args[i] = v
+            obj = self.build(*args)
+            if len(indices) < len(self.paths):
+                self._remove_missing(obj, args)
+            return obj
+        obj = present[-1]
+        for i, v in zip(indices, present):
+            parent = obj
+            path = self.paths[i]
+            for k in path[:-1]:
+                parent = parent[k]
+            parent[path[-1]] = v
+        return obj
+
+    def header(self, kind: int) -> bytes:
+        return _HEADER.pack(_MAGIC, _VERSION, kind, self.schema_id)
+
+    def check_header(self, data: bytes, kind: int) -> int:
+        """Check the header and return its size."""
+        if len(data) < _HEADER.size:
+            raise ValueError("Data is too short to be an encoded json class object.")
+        magic, version, data_kind, schema_id = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Data is not an encoded json class object.")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported version of encoding: {version}.")
+        if data_kind != kind:
+            expected = "a batch" if kind == _BATCH else "a single object"
+            raise ValueError(f"Data is not {expected} of encoded json class objects.")
+        if schema_id != self.schema_id:
+            raise ValueError("Data was encoded with a different template.")
+        return _HEADER.size
+
+    def dumps(self, obj: dict[str, Any]) -> bytes:
+        return self.header(_SINGLE) + self.encode(obj)
+
+    def loads(self, data: bytes) -> dict[str, Any]:
+        start = self.check_header(data, _SINGLE)
+        return self.decode(data[start:])
+
+    def dumps_many(self, objs: Iterable[dict[str, Any]]) -> bytes:
+        """
+        Encode many json dictionaries.
+
+        The encoded objects follow the number of objects and the table of their
+        end offsets, so that each object can be decoded separately.
+        """
+        records = [self.encode(obj) for obj in objs]
+        offsets: list[int] = []
+        pos = 0
+        for rec in records:
+            pos += len(rec)
+            offsets.append(pos)
+        table = struct.pack(f"<{len(offsets)}Q", *offsets)
+        return b"".join(
+            [self.header(_BATCH), _COUNT.pack(len(records)), table, *records]
+        )
+
+    def batch_count(self, data: bytes | memoryview) -> tuple[int, int]:
+        """Return the number of the records and the position of the offset table."""
+        start = self.check_header(data, _BATCH)
+        (n,) = _COUNT.unpack_from(data, start)
+        return n, start + _COUNT.size
+
+    def offsets(self, data: bytes) -> tuple[int, list[int]]:
+        """Return the start position of the records and their end offsets."""
+        n, table = self.batch_count(data)
+        ends = list(struct.unpack_from(f"<{n}Q", data, table))
+        return table + 8 * n, ends
+
+    def decode_at(
+        self, data: bytes | memoryview, n: int, table: int, i: int
+    ) -> dict[str, Any]:
+        """Decode the i-th record of a batch, reading only its offsets."""
+        base = table + 8 * n
+        (end,) = _COUNT.unpack_from(data, table + 8 * i)
+        start = _COUNT.unpack_from(data, table + 8 * (i - 1))[0] if i > 0 else 0
+        return self.decode(bytes(data[base + start:base + end]))
+
+    def loads_many(self, data: bytes) -> list[dict[str, Any]]:
+        base, ends = self.offsets(data)
+        out: list[dict[str, Any]] = []
+        pos = base
+        for end in ends:
+            out.append(self.decode(data[pos:base + end]))
+            pos = base + end
+        return out
+
+
+def _compile_matcher(template: Any) -> Callable[[Any], bool]:
+    """
+    Compile a function that checks if a json dictionary has the same structure
+    and constants as the template, given that all the attribute values exist.
+    """
+    ns: dict[str, Any] = {}
+    conds: list[str] = []
+
+    def _walk(x: Any, expr: str) -> None:
+        if x is MISSING:
+            return
+        typ = f"_t{len(ns)}"
+        ns[typ] = type(x)
+        if isinstance(x, dict):
+            # key order is also checked, because decoding follows the template
+            keys = f"_k{len(ns)}"
+            ns[keys] = list(x)
+            conds.append(f"type({expr}) is {typ} and list({expr}) == {keys}")
+            for k, v in x.items():
+                _walk(v, f"{expr}[{key_repr(k, ns)}]")
+        elif isinstance(x, (list, tuple)):
+            conds.append(f"type({expr}) is {typ} and len({expr}) == {len(x)}")
+            for i, v in enumerate(x):
+                _walk(v, f"{expr}[{i}]")
+        else:
+            # type check distinguishes such as 1, 1.0 and true
+            const = f"_c{len(ns)}"
+            ns[const] = x
+            conds.append(f"type({expr}) is {typ} and {expr} == {const}")
+
+    _walk(template, "obj")
+    exec(f"def matches(obj):\n    return {' and '.join(conds)}\n", ns)
+    return ns["matches"]
+
+
+def _same(a: Any, b: Any) -> bool:
+    """
+    Check if json values are equal, distinguishing such as 1, 1.0 and true, and
+    the orders of the keys.
+    """
+    if type(a) is not type(b):
+        return False
+    if type(a) is dict:
+        return list(a) == list(b) and all(_same(v, b[k]) for k, v in a.items())
+    if type(a) is list or type(a) is tuple:
+        return len(a) == len(b) and all(map(_same, a, b))
+    return a == b
+
+
+def _container_types(template: Any, path: tuple[str | int, ...]) -> list[type]:
+    """JSON container types of the template along a key path."""
+    types: list[type] = []
+    for k in path:
+        types.append(dict if isinstance(template, dict) else list)
+        template = template[k]
+    return types
+
+
+def _lookup(obj: Any, path: tuple[str | int, ...], types: list[type]) -> Any:
+    """Get the value at a key path if the containers have the template types."""
+    for k, t in zip(path, types):
+        if type(obj) is not t:
+            return MISSING
+        if t is dict:
+            if k not in obj:
+                return MISSING
+        elif k >= len(obj):
+            return MISSING
+        obj = obj[k]
+    return obj
+
+
+def _strip(obj: dict[str, Any], paths: Iterable[tuple[str | int, ...]]) -> Any:
+    """
+    Copy a json dictionary replacing the values at the key paths by None.
+
+    The containers along the key paths must have the types of the template, and
+    are copied only along the key paths. Keys are kept in the original order.
+    """
+    root = dict(obj)
+    copied: dict[tuple[str | int, ...], Any] = {(): root}
+    for path in paths:
+        parent = root
+        for depth in range(len(path) - 1):
+            prefix = path[:depth + 1]
+            child = copied.get(prefix)
+            if child is None:
+                child = parent[path[depth]]
+                if type(child) is dict:
+                    child = dict(child)
+                else:
+                    child = list(child)
+                parent[path[depth]] = copied[prefix] = child
+            parent = child
+        parent[path[-1]] = _HOLE
+    return root
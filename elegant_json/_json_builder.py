@@ -0,0 +1,83 @@
+from __future__ import annotations
+from copy import deepcopy
+from typing import Any, Callable, Sequence
+
+from ._json_attribute import Attr
+from ._json_tree import key_repr
+
+
+def compile_builder(template: dict[str, Any]) -> Callable[..., dict[str, Any]]:
+    """
+    Compile a function that builds a new json dictionary from a template.
+    
+    The returned function takes the values of the Attr objects in the template
+    order as positional arguments, and returns a new dictionary in which each Attr
+    object is replaced by the corresponding value. Containers in the template are
+    newly created, and other values are shared with the template.
+    """
+    ns: dict[str, Any] = {}
+    counter = [0]
+    body = _generate(template, ns, counter)
+    args = ", ".join(f"v{i}" for i in range(counter[0]))
+    exec(f"def build({args}):\n    return {body}\n", ns)
+    return ns["build"]
+
+
+def _generate(x: Any, ns: dict[str, Any], counter: list[int]) -> str:
+    if isinstance(x, dict):
+        items = ", ".join(
+            f"{key_repr(k, ns)}: {_generate(v, ns, counter)}" for k, v in x.items()
+        )
+        return "{" + items + "}"
+    elif isinstance(x, (list, tuple)):
+        items = "".join(f"{_generate(v, ns, counter)}, " for v in x)
+        if type(x) is list:
+            return f"[{items}]"
+        elif type(x) is tuple:
+            return f"({items})"
+        name = f"_t{len(ns)}"
+        ns[name] = type(x)
+        return f"{name}([{items}])"
+    elif isinstance(x, Attr):
+        name = f"v{counter[0]}"
+        counter[0] += 1
+        return name
+    elif x is None or type(x) in (bool, int):
+        return repr(x)
+    name = f"_c{len(ns)}"
+    ns[name] = x
+    return name
+
+
+# defaults of these types can be shared between objects
+_IMMUTABLE = (type(None), bool, int, float, complex, str, bytes, frozenset)
+
+
+def compile_defaults(attrs: Sequence[Attr]) -> Callable[[], list[Any]]:
+    """
+    Compile a function that returns the defaults of the Attr objects.
+    
+    Containers in the defaults are newly created on every call, in the same way as
+    the template skeleton, so that objects do not share them. Other mutable
+    defaults are deep-copied.
+    """
+    ns: dict[str, Any] = {"deepcopy": deepcopy}
+    items: list[str] = []
+    for attr in attrs:
+        if _is_plain(attr.default):
+            items.append(_generate(attr.default, ns, [0]))
+        else:
+            name = f"_c{len(ns)}"
+            ns[name] = attr.default
+            items.append(f"deepcopy({name})")
+    exec(f"def get_defaults():\n    return [{', '.join(items)}]\n", ns)
+    return ns["get_defaults"]
+
+
+def _is_plain(x: Any) -> bool:
+    """True if ``x`` consists of dicts, lists, tuples and immutable values."""
+    if type(x) is dict:
+        return all(_is_plain(v) for v in x.values())
+    elif type(x) in (list, tuple):
+        return all(_is_plain(v) for v in x)
+    return type(x) in _IMMUTABLE
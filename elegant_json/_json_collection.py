@@ -0,0 +1,311 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Sequence
+from types import GenericAlias
+from typing import Any, Iterable, Iterator, Literal, TypeVar, TYPE_CHECKING
+
+from ._json_columns import extract_columns
+
+if TYPE_CHECKING:
+    from ._json_class import JsonClass
+
+_C = TypeVar("_C", bound="JsonClass")
+IndexKind = Literal["hash", "sorted"]
+
+# larger than any position, used to bisect to the end of equal values
+_LAST = float("inf")
+# default bounds of range queries, because None is a value to search for
+_UNBOUNDED: Any = object()
+
+
+class _HashIndex:
+    """Positions of the items for each value, in the ascending order."""
+
+    kind = "hash"
+
+    def __init__(self, values: list[Any]):
+        buckets: dict[Any, list[int]] = {}
+        try:
+            for i, v in enumerate(values):
+                bucket = buckets.get(v)
+                if bucket is None:
+                    buckets[v] = [i]
+                else:
+                    bucket.append(i)
+        except TypeError as e:
+            raise TypeError(
+                f"Cannot build a hash index of unhashable values: {e}"
+            ) from None
+        self.buckets = buckets
+
+    def find(self, value: Any) -> list[int]:
+        return self.buckets.get(value, [])
+
+    def add(self, value: Any, pos: int) -> None:
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            self.buckets[value] = [pos]
+        else:
+            insort(bucket, pos)
+
+    def remove(self, value: Any, pos: int) -> None:
+        bucket = self.buckets[value]
+        del bucket[bisect_left(bucket, pos)]
+        if not bucket:
+            del self.buckets[value]
+
+
+class _SortedIndex:
+    """Sorted pairs of values and positions. None values are kept separately."""
+
+    kind = "sorted"
+
+    def __init__(self, values: list[Any]):
+        try:
+            self.entries = sorted(
+                (v, i) for i, v in enumerate(values) if v is not None
+            )
+        except TypeError as e:
+            raise TypeError(
+                f"Cannot build a sorted index of incomparable values: {e}"
+            ) from None
+        self.nones = [i for i, v in enumerate(values) if v is None]
+
+    def find(self, value: Any) -> list[int]:
+        if value is None:
+            return list(self.nones)
+        return self.range(value, value)
+
+    def range(
+        self,
+        lower: Any = _UNBOUNDED,
+        upper: Any = _UNBOUNDED,
+        include_lower: bool = True,
+        include_upper: bool = True,
+    ) -> list[int]:
+        entries = self.entries
+        if lower is _UNBOUNDED:
+            start = 0
+        elif include_lower:
+            start = bisect_left(entries, (lower,))
+        else:
+            start = bisect_right(entries, (lower, _LAST))
+        if upper is _UNBOUNDED:
+            stop = len(entries)
+        elif include_upper:
+            stop = bisect_right(entries, (upper, _LAST))
+        else:
+            stop = bisect_left(entries, (upper,))
+        return [pos for _, pos in entries[start:stop]]
+
+    def add(self, value: Any, pos: int) -> None:
+        if value is None:
+            insort(self.nones, pos)
+        else:
+            insort(self.entries, (value, pos))
+
+    def remove(self, value: Any, pos: int) -> None:
+        if value is None:
+            del self.nones[bisect_left(self.nones, pos)]
+        else:
+            del self.entries[bisect_left(self.entries, (value, pos))]
+
+
+_INDEX_TYPES: dict[str, type[_HashIndex | _SortedIndex]] = {
+    "hash": _HashIndex,
+    "sorted": _SortedIndex,
+}
+
+
+class JsonCollection(Sequence):
+    """
+    A collection of json class objects with indexes of attributes.
+
+    A hash index answers equality queries and a sorted index answers both equality
+    and range queries, without converting the attributes of every object. Indexes
+    are built on the values converted by the annotations. Write attributes with
+    :meth:`set` to keep the indexes up to date.
+
+    Parameters
+    ----------
+    json_class : JsonClass subclass
+        The class of the objects.
+    items : iterable of JsonClass or dict, optional
+        Objects of ``json_class``. Dictionaries are wrapped by ``json_class``.
+
+    Examples
+    --------
+    >>> docs = JsonCollection(C, C.iter_load("records.jsonl"))
+    >>> docs.create_index("title")
+    >>> docs.create_index("year", "sorted")
+    >>> docs.find("title", "A")
+    >>> docs.find_range("year", 2000, 2010)
+    >>> docs.set(docs[0], "title", "B")
+    """
+
+    __class_getitem__ = classmethod(GenericAlias)
+
+    def __init__(self, json_class: type[_C], items: Iterable[_C | dict[str, Any]] = ()):
+        if not hasattr(json_class, "_json_properties"):
+            raise TypeError(f"{json_class!r} is not a json class.")
+        self._json_class = json_class
+        self._items: list[_C] = []
+        self._positions: dict[int, int] = {}
+        self._indexes: dict[str, _HashIndex | _SortedIndex] = {}
+        self.extend(items)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self._json_class.__name__}, "
+            f"n={len(self._items)}, indexes={self.indexes!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, key):
+        return self._items[key]
+
+    def __iter__(self) -> Iterator[_C]:
+        return iter(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return id(item) in self._positions
+
+    @property
+    def json_class(self) -> type[_C]:
+        """The class of the objects."""
+        return self._json_class
+
+    @property
+    def indexes(self) -> dict[str, IndexKind]:
+        """Kinds of the indexes of the attributes."""
+        return {name: index.kind for name, index in self._indexes.items()}
+
+    def _wrap(self, item: _C | dict[str, Any]) -> _C:
+        if isinstance(item, dict):
+            return self._json_class(item)
+        if not isinstance(item, self._json_class):
+            raise TypeError(
+                f"Expected {self._json_class.__name__} or dict, got {type(item)}."
+            )
+        return item
+
+    def _values(self, name: str, items: list[_C]) -> list[Any]:
+        return extract_columns(self._json_class, items, [name], asarray=False)[name]
+
+    def _check_name(self, name: str) -> None:
+        if name not in self._json_class._json_properties:
+            raise ValueError(
+                f"{name!r} is not an attribute of {self._json_class.__name__}."
+            )
+
+    def append(self, item: _C | dict[str, Any]) -> None:
+        """Add an object to the collection."""
+        return self.extend([item])
+
+    def extend(self, items: Iterable[_C | dict[str, Any]]) -> None:
+        """Add objects to the collection."""
+        new = [self._wrap(item) for item in items]
+        ids = [id(item) for item in new]
+        positions = self._positions
+        if len(set(ids)) < len(ids) or any(i in positions for i in ids):
+            raise ValueError("An object cannot be added to a collection twice.")
+        start = len(self._items)
+        positions.update(zip(ids, range(start, start + len(new))))
+        self._items.extend(new)
+        if new:
+            for name, index in self._indexes.items():
+                for i, value in enumerate(self._values(name, new), start):
+                    index.add(value, i)
+        return None
+
+    def create_index(self, name: str, kind: IndexKind = "hash") -> None:
+        """
+        Build an index of an attribute.
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute.
+        kind : "hash" or "sorted", default is "hash"
+            A hash index supports equality queries of hashable values. A sorted
+            index supports equality and range queries of comparable values. None
+            values are only found by equality queries.
+        """
+        self._check_name(name)
+        index_type = _INDEX_TYPES.get(kind)
+        if index_type is None:
+            raise ValueError(f"Index kind must be 'hash' or 'sorted', got {kind!r}.")
+        self._indexes[name] = index_type(self._values(name, self._items))
+        return None
+
+    def drop_index(self, name: str) -> None:
+        """Remove the index of an attribute."""
+        del self._indexes[name]
+        return None
+
+    def find(self, name: str, value: Any) -> list[_C]:
+        """
+        Find the objects whose attribute is equal to the value.
+
+        The objects are in the collection order. All the objects are scanned if
+        the attribute is not indexed.
+        """
+        index = self._indexes.get(name)
+        items = self._items
+        if index is None:
+            self._check_name(name)
+            values = self._values(name, items)
+            return [item for item, v in zip(items, values) if v == value]
+        return [items[i] for i in index.find(value)]
+
+    def find_range(
+        self,
+        name: str,
+        lower: Any = _UNBOUNDED,
+        upper: Any = _UNBOUNDED,
+        *,
+        include_lower: bool = True,
+        include_upper: bool = True,
+    ) -> list[_C]:
+        """
+        Find the objects whose attribute is in a range, using a sorted index.
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute with a sorted index.
+        lower, upper : any, optional
+            Bounds of the range. Not bounded if not given. Objects whose
+            attribute is None are never in a range.
+        include_lower, include_upper : bool, default is True
+            If true, the bounds are included in the range.
+
+        Returns
+        -------
+        list of JsonClass
+            Objects in the ascending order of the attribute.
+        """
+        index = self._indexes.get(name)
+        if not isinstance(index, _SortedIndex):
+            raise ValueError(f"Attribute {name!r} does not have a sorted index.")
+        items = self._items
+        return [
+            items[i] for i in index.range(lower, upper, include_lower, include_upper)
+        ]
+
+    def set(self, item: _C, name: str, value: Any) -> None:
+        """Set an attribute of an object in the collection, updating its index."""
+        pos = self._positions.get(id(item))
+        if pos is None:
+            raise ValueError(f"{item!r} is not in the collection.")
+        index = self._indexes.get(name)
+        if index is None:
+            setattr(item, name, value)
+            return None
+        old = self._values(name, [item])[0]
+        setattr(item, name, value)
+        index.remove(old, pos)
+        index.add(self._values(name, [item])[0], pos)
+        return None
@@ -0,0 +1,118 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Sequence, TYPE_CHECKING
+
+from ._json_attribute import JsonProperty, _identity
+from ._json_tree import MISSING, compile_extractor
+
+if TYPE_CHECKING:
+    from ._json_class import JsonClass, JsonClassMeta
+
+_EXTRACTORS = "_json_extractors"
+_ROW_CONVERTER = "_json_row_converter"
+
+# converters of scalar numeric annotations and the corresponding dtypes
+_NUMERIC_DTYPES: dict[Any, str] = {int: "int64", float: "float64", bool: "bool"}
+
+
+def get_extractor(
+    json_class: JsonClassMeta, names: tuple[str, ...]
+) -> Callable[[Any], list[Any]]:
+    """Get the compiled one-pass extractor of the attributes of a json class."""
+    extractors = json_class.__dict__.get(_EXTRACTORS)
+    if extractors is None:
+        extractors = {}
+        setattr(json_class, _EXTRACTORS, extractors)
+    extract = extractors.get(names)
+    if extract is None:
+        extract = extractors[names] = compile_extractor(json_class._json_key_tree, names)
+    return extract
+
+
+def get_row_converter(json_class: JsonClassMeta) -> Callable[[JsonClass], list[Any]]:
+    """
+    Get the function that converts a json class object into the attribute values.
+    
+    The values are in the template order. Missing values are the defaults.
+    Properties overridden in subclasses are read from the object.
+    """
+    convert_row = json_class.__dict__.get(_ROW_CONVERTER)
+    if convert_row is None:
+        extract = get_extractor(json_class, json_class._json_attr_names)
+        props = [getattr(json_class, name) for name in json_class._json_attr_names]
+        ns: dict[str, Any] = {"extract": extract, "MISSING": MISSING}
+        items: list[str] = []
+        for i, prop in enumerate(props):
+            if not isinstance(prop, JsonProperty):
+                items.append(f"obj.{json_class._json_attr_names[i]}")
+                continue
+            conv = prop.converter()
+            ns[f"c{i}"] = conv
+            ns[f"d{i}"] = prop.attr().default
+            value = f"v{i}" if conv is _identity else f"c{i}(v{i})"
+            items.append(f"d{i} if v{i} is MISSING else {value}")
+        unpack = "".join(f"v{i}, " for i in range(len(props)))
+        src = (
+            f"def convert_row(obj):\n"
+            f"    ({unpack}) = extract(obj._json)\n"
+            f"    return [{', '.join(items)}]\n"
+        )
+        exec(src, ns)
+        convert_row = ns["convert_row"]
+        setattr(json_class, _ROW_CONVERTER, convert_row)
+    return convert_row
+
+
+def extract_columns(
+    json_class: JsonClassMeta,
+    data: Iterable[dict[str, Any] | JsonClass],
+    fields: Sequence[str] | None = None,
+    asarray: bool = True,
+) -> dict[str, Any]:
+    """Extract attributes of many json objects as columns."""
+    if fields is None:
+        names = json_class._json_attr_names
+    else:
+        names = tuple(fields)
+    extract = get_extractor(json_class, names)
+    data = list(data)
+    rows = [extract(d if isinstance(d, dict) else d._json) for d in data]
+    # zip(*rows) is slow for many rows because all of them are passed as arguments
+    columns = [[row[i] for row in rows] for i in range(len(names))]
+    
+    out: dict[str, Any] = {}
+    for name, raw in zip(names, columns):
+        prop = getattr(json_class, name)
+        if not isinstance(prop, JsonProperty):
+            # overridden by a plain property
+            out[name] = [
+                getattr(json_class(d) if isinstance(d, dict) else d, name)
+                for d in data
+            ]
+            continue
+        converter = prop.converter()
+        default = prop.attr().default
+        missing = MISSING in raw
+        dtype = _NUMERIC_DTYPES.get(converter)
+        if asarray and dtype is not None:
+            np = _import_numpy()
+            if missing:
+                values = [default if v is MISSING else converter(v) for v in raw]
+                out[name] = np.array(values, dtype=object)
+            else:
+                out[name] = np.fromiter(map(converter, raw), dtype=dtype, count=len(raw))
+        elif missing:
+            out[name] = [default if v is MISSING else converter(v) for v in raw]
+        else:
+            out[name] = list(map(converter, raw))
+    return out
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "numpy is required to extract numeric columns as arrays. Install numpy "
+            "or use `asarray=False`."
+        ) from None
+    return np
@@ -0,0 +1,216 @@
+from __future__ import annotations
+from time import perf_counter
+from typing import Any, Callable, Literal, NamedTuple, TYPE_CHECKING
+
+from ._json_attribute import JsonProperty, _has_links, _identity, _link_nested
+
+if TYPE_CHECKING:
+    from ._json_class import JsonClass, JsonClassMeta
+
+AccessKind = Literal["get", "set", "default"]
+Sink = Callable[["AccessEvent"], Any]
+
+# original properties of an instrumented class, None if inherited
+_ORIGINALS = "_json_instrumented"
+
+
+class AccessEvent(NamedTuple):
+    """
+    A read or write of a json property reported by an instrumented class.
+
+    ``kind`` is "get" for a read, "default" for a read of a missing key path that
+    returned the default value, and "set" for a write. ``elapsed`` is the time in
+    seconds spent in the converter of the annotation, which is zero if the value
+    is not converted.
+    """
+
+    cls: type
+    name: str
+    kind: AccessKind
+    elapsed: float
+
+
+class AttrStats(NamedTuple):
+    """Aggregated counts of a json property."""
+
+    reads: int
+    writes: int
+    defaults: int
+    convert_time: float
+
+
+class AccessStats:
+    """
+    A sink of instrumentation that aggregates the events of each property.
+
+    Examples
+    --------
+    >>> stats = AccessStats()
+    >>> instrument(C, stats)
+    >>> ...
+    >>> stats.report()
+    {'C.a': AttrStats(reads=10, writes=0, defaults=1, convert_time=2.1e-05)}
+    """
+
+    def __init__(self):
+        # (class, name) -> [reads, writes, defaults, convert_time]
+        self._stats: dict[tuple[type, str], list[Any]] = {}
+
+    def __call__(self, event: AccessEvent) -> None:
+        key = (event.cls, event.name)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = [0, 0, 0, 0.0]
+        if event.kind == "set":
+            stats[1] += 1
+        else:
+            stats[0] += 1
+            if event.kind == "default":
+                stats[2] += 1
+            stats[3] += event.elapsed
+        return None
+
+    def get(self, cls: type, name: str) -> AttrStats:
+        """Return the aggregated counts of a property."""
+        return AttrStats(*self._stats.get((cls, name), (0, 0, 0, 0.0)))
+
+    def report(self) -> dict[str, AttrStats]:
+        """Return the aggregated counts keyed by "ClassName.attr", most read first."""
+        items = sorted(self._stats.items(), key=lambda item: -item[1][0])
+        return {
+            f"{cls.__qualname__}.{name}": AttrStats(*stats)
+            for (cls, name), stats in items
+        }
+
+    def clear(self) -> None:
+        """Clear all the counts."""
+        self._stats.clear()
+        return None
+
+
+def _instrumented_property(name: str, prop: JsonProperty, sink: Sink) -> JsonProperty:
+    """
+    Create a property that reports the accesses of ``prop`` to ``sink``.
+
+    Compiled getters are replaced by a generic one that times the converter, with
+    the same semantics of the cache.
+    """
+    keys = prop.keys()
+    path = tuple(keys)
+    attr = prop.attr()
+    converter = prop.converter()
+    cached = attr.cache
+    nested = hasattr(converter, "__json_template__") and not cached
+    linked = not attr.array and _has_links(attr.annotation)
+
+    def fget(jself: JsonClass):
+        cache = getattr(jself, "_json_cache", None)
+        if cached and cache is not None and path in cache:
+            sink(AccessEvent(jself.__class__, name, "get", 0.0))
+            return cache[path]
+        out: Any = jself._json
+        try:
+            for k in keys:
+                out = out[k]
+        except (KeyError, IndexError):
+            sink(AccessEvent(jself.__class__, name, "default", 0.0))
+            out = attr.default
+            if cached:
+                if cache is None:
+                    cache = jself._json_cache = {}
+                cache[path] = out
+            return out
+        if nested and cache is not None:
+            obj = cache.get(path)
+            if obj is not None and obj._json is out:
+                sink(AccessEvent(jself.__class__, name, "get", 0.0))
+                return obj
+        if converter is _identity:
+            elapsed = 0.0
+        else:
+            t0 = perf_counter()
+            out = converter(out)
+            elapsed = perf_counter() - t0
+        if linked:
+            _link_nested(out, jself, path)
+        if cached or nested:
+            if cache is None:
+                cache = jself._json_cache = {}
+            cache[path] = out
+        sink(AccessEvent(jself.__class__, name, "get", elapsed))
+        return out
+
+    new = JsonProperty(fget)
+    if prop.fset is not None:
+        _fset = prop.fset
+
+        def fset(jself: JsonClass, value):
+            _fset(jself, value)
+            sink(AccessEvent(jself.__class__, name, "set", 0.0))
+            return None
+
+        new = new.setter(fset)
+    new.set_keys(keys)
+    new.set_attr(attr)
+    new.set_converter(converter)
+    return new
+
+
+def _original_property(cls: JsonClassMeta, name: str) -> JsonProperty:
+    """Find the property of ``name`` skipping the instrumented ones of the bases."""
+    for base in cls.__mro__:
+        originals = base.__dict__.get(_ORIGINALS)
+        if originals is not None and name in originals:
+            prop = originals[name]
+            if prop is not None:
+                return prop
+        elif name in base.__dict__:
+            return base.__dict__[name]
+    raise AttributeError(name)
+
+
+def instrument(cls: JsonClassMeta, sink: Sink) -> None:
+    """
+    Report the reads and writes of the json properties of a class.
+
+    The properties of ``cls`` are replaced by instrumented ones that call ``sink``
+    with an :class:`AccessEvent` for each access. Instrumenting an instrumented
+    class replaces the sink. Compiled helpers that do not use the properties,
+    such as ``extract`` and ``attr_asdict``, are not reported.
+
+    Parameters
+    ----------
+    cls : JsonClass subclass
+        The json class to instrument. Its subclasses are also instrumented unless
+        they define their own templates.
+    sink : callable
+        Function called with each event, such as an :class:`AccessStats` object.
+    """
+    if not hasattr(cls, "_json_properties"):
+        raise TypeError(f"{cls!r} is not a json class.")
+    uninstrument(cls)
+    originals: dict[str, JsonProperty | None] = {}
+    for name in cls._json_attr_names:
+        prop = _original_property(cls, name)
+        originals[name] = cls.__dict__.get(name)
+        setattr(cls, name, _instrumented_property(name, prop, sink))
+    setattr(cls, _ORIGINALS, originals)
+    return None
+
+
+def uninstrument(cls: JsonClassMeta) -> None:
+    """
+    Restore the original json properties of an instrumented class.
+
+    Nothing happens if the class is not instrumented.
+    """
+    originals: dict[str, JsonProperty | None] | None = cls.__dict__.get(_ORIGINALS)
+    if originals is None:
+        return None
+    for name, prop in originals.items():
+        if prop is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, prop)
+    delattr(cls, _ORIGINALS)
+    return None
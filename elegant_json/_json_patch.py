@@ -0,0 +1,249 @@
+from __future__ import annotations
+import codecs
+import json
+import locale
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
+
+from ._json_scan import _BYTE_SCANNABLE, locate_spans
+from ._json_tree import MISSING, build_key_tree
+
+
+# real path, size and modification time of a file
+FileStamp = tuple[str, int, int]
+
+
+def file_stamp(path: str | Path | bytes) -> FileStamp | None:
+    """Identify a file and its version, or return None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.realpath(os.fsdecode(path)), st.st_size, st.st_mtime_ns
+
+
+def json_pointer(keys: Iterable[str | int]) -> str:
+    """Convert a key path into a JSON Pointer (RFC 6901)."""
+    return "".join(
+        "/" + str(k).replace("~", "~0").replace("/", "~1") for k in keys
+    )
+
+
+def minimal_paths(paths: Iterable[tuple[str | int, ...]]) -> list[tuple[str | int, ...]]:
+    """Remove the key paths that are under other key paths, keeping the order."""
+    paths = list(paths)
+    pathset = set(paths)
+    return [
+        p for p in paths
+        if not any(p[:i] in pathset for i in range(len(p)))
+    ]
+
+
+def latest_updates(
+    updates: dict[tuple[str | int, ...], str],
+) -> list[tuple[tuple[str | int, ...], str]]:
+    """Remove the updates overwritten by later updates of their parents."""
+    order = {p: i for i, p in enumerate(updates)}
+    return [
+        (p, op) for i, (p, op) in enumerate(updates.items())
+        if not any(order.get(p[:j], -1) > i for j in range(len(p)))
+    ]
+
+
+def get_value(obj: Any, keys: Sequence[str | int]) -> Any:
+    for k in keys:
+        obj = obj[k]
+    return obj
+
+
+def _encode(value: Any, encoding: str, dumps: Callable[[Any], str]) -> bytes:
+    try:
+        return dumps(value).encode(encoding)
+    except UnicodeEncodeError:
+        return json.dumps(value).encode(encoding)
+
+
+def dump_incremental(
+    path: str | Path | bytes,
+    obj: Any,
+    paths: Sequence[tuple[str | int, ...]],
+    encoding: str | None = None,
+    dumps: Callable[[Any], str] = json.dumps,
+) -> bool:
+    """
+    Update the values at the key paths in a json file, keeping the other bytes.
+
+    Only the spans of the values at ``paths`` are replaced by the serialized values
+    in ``obj``. The file is overwritten in place if all the new values have the
+    same sizes as the old ones. Otherwise, the new content is written to a
+    temporary file, which then replaces the original file.
+
+    Returns
+    -------
+    bool
+        False if the file could not be updated incrementally, such as when the
+        file does not exist or a key path is not found in the file. The file is
+        not changed in this case.
+    """
+    if encoding is None:
+        # same as the default encoding of `open`
+        encoding = locale.getpreferredencoding(False)
+    if codecs.lookup(encoding).name not in _BYTE_SCANNABLE:
+        return False
+    try:
+        with open(path, mode="rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return False
+
+    paths = minimal_paths(paths)
+    tree = build_key_tree((json_pointer(p), p) for p in paths)
+    try:
+        spans = locate_spans(data, tree, encoding)
+    except json.JSONDecodeError:
+        return False
+    if len(spans) != len(paths):
+        return False
+
+    edits: list[tuple[int, int, bytes]] = []
+    for keys in paths:
+        try:
+            value = get_value(obj, keys)
+        except (KeyError, IndexError, TypeError):
+            return False
+        start, end = spans[keys]
+        edits.append((start, end, _encode(value, encoding, dumps)))
+    edits.sort(key=lambda e: e[0])
+
+    if all(len(b) == end - start for start, end, b in edits):
+        with open(path, mode="r+b") as f:
+            for start, _, b in edits:
+                f.seek(start)
+                f.write(b)
+        return True
+
+    dirname, basename = os.path.split(os.path.abspath(os.fsdecode(path)))
+    fd, tmp = tempfile.mkstemp(prefix=f".{basename}.", suffix=".tmp", dir=dirname)
+    try:
+        with os.fdopen(fd, mode="wb") as f:
+            pos = 0
+            for start, end, b in edits:
+                f.write(data[pos:start])
+                f.write(b)
+                pos = end
+            f.write(data[pos:])
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return True
+
+
+def diff_values(
+    a: Any,
+    b: Any,
+    paths: Sequence[tuple[str | int, ...]],
+    values_a: Sequence[Any],
+    values_b: Sequence[Any],
+) -> list[dict[str, Any]]:
+    """
+    Make a JSON Patch that updates the values at the key paths from ``a`` to ``b``.
+
+    ``values_a`` and ``values_b`` are the values at ``paths`` in the json objects
+    ``a`` and ``b``, where missing values are ``MISSING``. Missing parent dicts are
+    added as empty ones. List items can only be appended one by one, so a list
+    that needs other items first is replaced by the whole list in ``b``.
+    """
+    ops: list[dict[str, Any]] = []
+    added: set[tuple[str | int, ...]] = set()
+    # lists replaced as a whole, whose items need no more operations
+    covered: set[tuple[str | int, ...]] = set()
+    # lengths of the lists in `a` after the operations
+    lengths: dict[tuple[str | int, ...], int] = {}
+    # removing list items shifts the following ones, so remove from the last
+    removed_items: list[tuple[str | int, ...]] = []
+    for keys, va, vb in zip(paths, values_a, values_b):
+        if any(keys[:i] in covered for i in range(1, len(keys) + 1)):
+            continue
+        if va is MISSING:
+            if vb is MISSING:
+                continue
+            _add_missing(a, b, keys, vb, ops, added, covered, lengths)
+        elif vb is MISSING:
+            if isinstance(keys[-1], int):
+                removed_items.append(keys)
+            else:
+                ops.append({"op": "remove", "path": json_pointer(keys)})
+        elif type(va) is not type(vb) or va != vb:
+            # type check distinguishes such as 1, 1.0 and true
+            ops.append({"op": "replace", "path": json_pointer(keys), "value": vb})
+    for keys in reversed(removed_items):
+        if not any(keys[:i] in covered for i in range(1, len(keys))):
+            ops.append({"op": "remove", "path": json_pointer(keys)})
+    return ops
+
+
+def _add_missing(
+    a: Any,
+    b: Any,
+    keys: tuple[str | int, ...],
+    value: Any,
+    ops: list[dict[str, Any]],
+    added: set[tuple[str | int, ...]],
+    covered: set[tuple[str | int, ...]],
+    lengths: dict[tuple[str | int, ...], int],
+) -> None:
+    """Append the operations that add a value missing in ``a``, with its parents."""
+    depth = _existing_depth(a, keys)
+    for i in range(depth, len(keys)):
+        prefix = keys[:i + 1]
+        if prefix in added:
+            continue
+        if i == len(keys) - 1:
+            new = value
+        elif isinstance(keys[i + 1], int):
+            # a new list is added as a whole, with all its items
+            new = get_value(b, prefix)
+            covered.add(prefix)
+        else:
+            new = {}
+        op = "add"
+        if isinstance(keys[i], int):
+            parent = keys[:i]
+            n = lengths.get(parent)
+            if n is None:
+                n = len(get_value(a, parent))
+            if keys[i] < n:
+                # a scalar item is replaced by a container
+                op = "replace"
+            elif keys[i] == n:
+                lengths[parent] = n + 1
+            else:
+                ops.append(
+                    {"op": "replace", "path": json_pointer(parent),
+                     "value": get_value(b, parent)}
+                )
+                covered.add(parent)
+                return None
+        ops.append({"op": op, "path": json_pointer(prefix), "value": new})
+        if new is value or prefix in covered:
+            return None
+        added.add(prefix)
+    return None
+
+
+def _existing_depth(obj: Any, keys: tuple[str | int, ...]) -> int:
+    """Number of the parent containers of the key path that exist in ``obj``."""
+    for i, k in enumerate(keys[:-1]):
+        try:
+            obj = obj[k]
+        except (KeyError, IndexError, TypeError):
+            return i
+        if not isinstance(obj, (dict, list)):
+            return i
+    return len(keys) - 1
@@ -0,0 +1,289 @@
+from __future__ import annotations
+import codecs
+import json
+import re
+from typing import Any, Callable, Union
+
+from ._json_tree import KeyNode
+
+Buffer = Union[str, bytes, bytearray, memoryview]
+
+# encodings that can be scanned byte-wise because every non-ASCII character is
+# encoded by bytes outside of the ASCII range.
+_BYTE_SCANNABLE = frozenset(["utf-8", "utf-8-sig", "ascii", "iso8859-1"])
+
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_FILLER = r'[^"\[\]{}]*(?:' + _STRING + r'[^"\[\]{}]*)*'
+_WS = r"[ \t\n\r]*"
+_SCALAR = r"[^,\]}\s]+"
+_BRACKET = _FILLER + r"([\[\]{}])"
+
+
+class _Syntax:
+    """Compiled patterns and tokens for either str or bytes input."""
+    
+    def __init__(self, conv):
+        self.string = re.compile(conv(_STRING), re.S)
+        self.bracket = re.compile(conv(_BRACKET), re.S)
+        self.ws = re.compile(conv(_WS))
+        self.scalar = re.compile(conv(_SCALAR))
+        self.open = (conv("{"), conv("["))
+        self.close = (conv("}"), conv("]"))
+        self.obj_open, self.obj_close = conv("{"), conv("}")
+        self.arr_open, self.arr_close = conv("["), conv("]")
+        self.quote, self.colon, self.comma = conv('"'), conv(":"), conv(",")
+        self.backslash = conv("\\")
+
+_STR_SYNTAX = _Syntax(lambda s: s)
+_BYTES_SYNTAX = _Syntax(lambda s: s.encode("ascii"))
+_decoder = json.JSONDecoder()
+
+
+class _AllFound(Exception):
+    """Raised to stop scanning when all the values are located."""
+
+
+class _Scanner:
+    """Scan a json document and materialize only the subtrees in a key tree."""
+    
+    def __init__(
+        self,
+        buf: Buffer,
+        encoding: str | None = None,
+        loads: Callable[[str], Any] | None = None,
+    ):
+        self.buf = buf
+        self.loads = loads
+        self.nleaves = -1  # number of values to locate
+        if isinstance(buf, str):
+            self.syntax = _STR_SYNTAX
+            self.encoding = None
+        else:
+            self.syntax = _BYTES_SYNTAX
+            self.encoding = encoding
+    
+    def error(self, msg: str, pos: int) -> json.JSONDecodeError:
+        if self.encoding is None:
+            return json.JSONDecodeError(msg, self.buf, pos)
+        doc = bytes(self.buf[:pos]).decode(self.encoding, errors="replace")
+        return json.JSONDecodeError(msg, doc, len(doc))
+    
+    def skip_ws(self, idx: int) -> int:
+        return self.syntax.ws.match(self.buf, idx).end()
+    
+    def decode_string(self, token) -> str:
+        if self.encoding is not None:
+            token = bytes(token).decode(self.encoding)
+        if "\\" in token:
+            return json.loads(token)
+        return token[1:-1]
+    
+    def skip_value(self, idx: int) -> int:
+        """Return the index of the end of a json value, without decoding it."""
+        buf, syntax = self.buf, self.syntax
+        c = buf[idx:idx + 1]
+        if c in syntax.open:
+            depth = 0
+            opening = syntax.open
+            for m in syntax.bracket.finditer(buf, idx):
+                if m.group(1) in opening:
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return m.end()
+            raise self.error("Unterminated value", idx)
+        elif c == syntax.quote:
+            m = syntax.string.match(buf, idx)
+        else:
+            m = syntax.scalar.match(buf, idx)
+        if m is None:
+            raise self.error("Expecting value", idx)
+        return m.end()
+    
+    def decode_value(self, idx: int) -> tuple[Any, int]:
+        """Decode a json value and return it with the index of its end."""
+        if self.encoding is None:
+            if self.loads is None:
+                return _decoder.raw_decode(self.buf, idx)
+            end = self.skip_value(idx)
+            return self.loads(self.buf[idx:end]), end
+        loads = self.loads or json.loads
+        end = self.skip_value(idx)
+        return loads(bytes(self.buf[idx:end]).decode(self.encoding)), end
+    
+    def scan_object(self, idx: int, node: KeyNode) -> tuple[dict[str, Any], int]:
+        """Decode an object, keeping only the keys that are found in ``node``."""
+        buf, syntax = self.buf, self.syntax
+        out: dict[str, Any] = {}
+        idx = self.skip_ws(idx + 1)
+        if buf[idx:idx + 1] == syntax.obj_close:
+            return out, idx + 1
+        while True:
+            m = syntax.string.match(buf, idx)
+            if m is None:
+                raise self.error("Expecting property name enclosed in double quotes", idx)
+            key = self.decode_string(m.group())
+            idx = self.skip_ws(m.end())
+            if buf[idx:idx + 1] != syntax.colon:
+                raise self.error("Expecting ':' delimiter", idx)
+            idx = self.skip_ws(idx + 1)
+            
+            child = node.children.get(key)
+            if child is None:
+                idx = self.skip_value(idx)
+            elif child.is_leaf() or buf[idx:idx + 1] != syntax.obj_open:
+                out[key], idx = self.decode_value(idx)
+            else:
+                out[key], idx = self.scan_object(idx, child)
+            
+            idx = self.skip_ws(idx)
+            c = buf[idx:idx + 1]
+            if c == syntax.comma:
+                idx = self.skip_ws(idx + 1)
+            elif c == syntax.obj_close:
+                return out, idx + 1
+            else:
+                raise self.error("Expecting ',' delimiter", idx)
+    
+    def locate(
+        self,
+        idx: int,
+        node: KeyNode,
+        keys: tuple[str | int, ...],
+        spans: dict[tuple[str | int, ...], tuple[int, int]],
+    ) -> int:
+        """Record the spans of the values at the leaves of ``node`` in ``spans``."""
+        buf, syntax = self.buf, self.syntax
+        c = buf[idx:idx + 1]
+        if c == syntax.obj_open:
+            close = syntax.obj_close
+        elif c == syntax.arr_open:
+            close = syntax.arr_close
+        else:
+            return self.skip_value(idx)
+        idx = self.skip_ws(idx + 1)
+        if buf[idx:idx + 1] == close:
+            return idx + 1
+        i = 0
+        while True:
+            if close == syntax.obj_close:
+                m = syntax.string.match(buf, idx)
+                if m is None:
+                    raise self.error("Expecting property name enclosed in double quotes", idx)
+                key: str | int = self.decode_string(m.group())
+                idx = self.skip_ws(m.end())
+                if buf[idx:idx + 1] != syntax.colon:
+                    raise self.error("Expecting ':' delimiter", idx)
+                idx = self.skip_ws(idx + 1)
+            else:
+                key = i
+                i += 1
+            
+            child = node.children.get(key)
+            if child is None:
+                idx = self.skip_value(idx)
+            elif child.is_leaf():
+                end = self.skip_value(idx)
+                spans[keys + (key,)] = (idx, end)
+                if len(spans) == self.nleaves:
+                    raise _AllFound()
+                idx = end
+            else:
+                idx = self.locate(idx, child, keys + (key,), spans)
+            
+            idx = self.skip_ws(idx)
+            c = buf[idx:idx + 1]
+            if c == syntax.comma:
+                idx = self.skip_ws(idx + 1)
+            elif c == close:
+                return idx + 1
+            else:
+                raise self.error("Expecting ',' delimiter", idx)
+
+    def scan(self, tree: KeyNode, start: int = 0) -> dict[str, Any]:
+        idx = self.skip_ws(start)
+        if self.buf[idx:idx + 1] != self.syntax.obj_open:
+            raise self.error("Expecting a json object", idx)
+        out, idx = self.scan_object(idx, tree)
+        idx = self.skip_ws(idx)
+        if idx != len(self.buf):
+            raise self.error("Extra data", idx)
+        return out
+
+
+def scan_json(
+    buf: Buffer,
+    tree: KeyNode,
+    encoding: str | None = None,
+    loads: Callable[[str], Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Selectively decode a json object.
+    
+    Only the subtrees that are reachable by the key paths in ``tree`` are decoded,
+    and all the other values are skipped without being materialized nor
+    validated. Arrays on a key path are decoded as a whole.
+    
+    Parameters
+    ----------
+    buf : str or bytes-like
+        The json document.
+    tree : KeyNode
+        Prefix tree of the key paths.
+    encoding : str, optional
+        Encoding of bytes input. Detected in the same way as ``json.loads`` if not
+        given.
+    loads : callable, optional
+        Function used to decode the subtrees. The standard ``json`` decoder is used
+        if not given.
+    """
+    if isinstance(buf, str):
+        return _Scanner(buf, loads=loads).scan(tree)
+    if encoding is None:
+        encoding = json.detect_encoding(bytes(buf[:4]))
+    encoding = codecs.lookup(encoding).name
+    if encoding not in _BYTE_SCANNABLE:
+        return _Scanner(codecs.decode(buf, encoding), loads=loads).scan(tree)
+    start = 3 if encoding == "utf-8-sig" and buf[:3] == codecs.BOM_UTF8 else 0
+    return _Scanner(buf, encoding, loads).scan(tree, start)
+
+
+def locate_spans(
+    buf: Buffer,
+    tree: KeyNode,
+    encoding: str,
+) -> dict[tuple[str | int, ...], tuple[int, int]]:
+    """
+    Find the positions of the values at the key paths in a json document.
+    
+    Parameters
+    ----------
+    buf : bytes-like
+        The json document.
+    tree : KeyNode
+        Prefix tree of the key paths. Only the spans of the leaves are returned.
+    encoding : str
+        Encoding of the document. Must be one of the byte-scannable encodings.
+    
+    Returns
+    -------
+    dict
+        Mapping from key paths to (start, end) byte offsets. Key paths that are
+        not found in the document are not included. Scanning stops as soon as all
+        the values are found, so that only the first one of duplicated keys is
+        located.
+    """
+    encoding = codecs.lookup(encoding).name
+    if encoding not in _BYTE_SCANNABLE:
+        raise ValueError(f"Cannot locate values in a {encoding} encoded document.")
+    start = 3 if encoding == "utf-8-sig" and buf[:3] == codecs.BOM_UTF8 else 0
+    scanner = _Scanner(buf, encoding)
+    scanner.nleaves = sum(1 for _ in tree.iter_leaves())
+    spans: dict[tuple[str | int, ...], tuple[int, int]] = {}
+    try:
+        scanner.locate(scanner.skip_ws(start), tree, (), spans)
+    except _AllFound:
+        # the rest of the document does not need to be scanned
+        pass
+    return spans
@@ -0,0 +1,175 @@
+from __future__ import annotations
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterable, Iterator, TYPE_CHECKING
+
+from ._json_attribute import JsonProperty
+
+if TYPE_CHECKING:
+    from ._json_binary import BinaryCodec
+    from ._json_class import JsonClass, JsonClassMeta
+
+_FROZEN = "_json_frozen_class"
+_ORIGINAL = "_json_original_class"
+
+
+def _reduce_frozen(self: JsonClass):
+    # frozen classes cannot be found by their names, so pickle as the original
+    return original_class(type(self)), (self._json,)
+
+
+def frozen_class(cls: JsonClassMeta) -> JsonClassMeta:
+    """Get the subclass of a json class whose properties cannot be set."""
+    frozen = cls.__dict__.get(_FROZEN)
+    if frozen is None:
+        ns: dict[str, Any] = {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__reduce__": _reduce_frozen,
+            _ORIGINAL: cls,
+        }
+        for name in cls._json_attr_names:
+            prop: JsonProperty = getattr(cls, name)
+            new = JsonProperty(prop.fget)
+            new.set_keys(prop.keys())
+            new.set_attr(prop.attr())
+            new.set_converter(prop.converter())
+            ns[name] = new
+        frozen = type(cls)(cls.__name__, (cls,), ns)
+        setattr(cls, _FROZEN, frozen)
+    return frozen
+
+
+def original_class(cls: JsonClassMeta) -> JsonClassMeta:
+    """Get the json class of a class made by ``frozen_class``, or itself."""
+    return cls.__dict__.get(_ORIGINAL, cls)
+
+
+class SharedDocuments:
+    """
+    Json class objects stored in shared memory.
+
+    The objects are stored in the batch binary format of
+    :meth:`JsonClass.dumps_binary_many`. The handle is pickled by the class and the
+    name of the shared memory block, so that it can be sent to worker processes
+    cheaply. Objects are decoded from the shared memory only when they are
+    accessed, and their properties cannot be set.
+
+    The process that created the handle must call :meth:`unlink` when the shared
+    memory is no longer needed. Every process should call :meth:`close` when it
+    does not use the handle anymore. A ``with`` block does both.
+
+    Examples
+    --------
+    >>> with C.to_shared(objs) as shared:
+    ...     with multiprocessing.Pool() as pool:
+    ...         pool.map(work, [shared] * 8)
+    """
+
+    def __init__(self, json_class: JsonClassMeta, shm: SharedMemory, owner: bool):
+        from ._json_class import _get_codec
+
+        self._json_class = json_class
+        self._shm = shm
+        self._owner = owner
+        self._buf: memoryview | None = shm.buf.toreadonly()
+        self._codec: BinaryCodec = _get_codec(json_class)
+        self._len, self._table = self._codec.batch_count(self._buf)
+        self._frozen = frozen_class(json_class)
+
+    @classmethod
+    def create(
+        cls, json_class: JsonClassMeta, objs: Iterable[JsonClass]
+    ) -> SharedDocuments:
+        """Encode objects into a new shared memory block."""
+        data = json_class.dumps_binary_many(objs)
+        shm = SharedMemory(create=True, size=len(data))
+        try:
+            shm.buf[:len(data)] = data
+            return cls(json_class, shm, owner=True)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, json_class: JsonClassMeta, name: str) -> SharedDocuments:
+        """Attach to the shared memory block created in another process."""
+        if sys.version_info >= (3, 13):
+            # the block is unlinked by the creator, not by the resource tracker
+            shm = SharedMemory(name=name, track=False)
+        else:
+            shm = SharedMemory(name=name)
+        return cls(json_class, shm, owner=False)
+
+    def __reduce__(self):
+        return SharedDocuments.attach, (self._json_class, self.name)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self._json_class.__name__}, "
+            f"name={self.name!r}, n={self._len})"
+        )
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._shm.name
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the shared memory block."""
+        return self._shm.size
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _get(self, i: int) -> JsonClass:
+        if self._buf is None:
+            raise ValueError("Shared memory is already closed.")
+        js = self._codec.decode_at(self._buf, self._len, self._table, i)
+        return self._frozen(js)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._get(i) for i in range(*key.indices(self._len))]
+        n = self._len
+        if key < 0:
+            key += n
+        if not 0 <= key < n:
+            raise IndexError(f"Index {key} out of range for {n} objects.")
+        return self._get(key)
+
+    def __iter__(self) -> Iterator[JsonClass]:
+        for i in range(self._len):
+            yield self._get(i)
+
+    def close(self) -> None:
+        """Close the shared memory in this process."""
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+            self._shm.close()
+        return None
+
+    def __del__(self):
+        # the view must be released before the shared memory is closed
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block. Call this once in the creator."""
+        self._shm.unlink()
+        return None
+
+    def __enter__(self) -> SharedDocuments:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+        return None
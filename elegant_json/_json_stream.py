@@ -0,0 +1,191 @@
+from __future__ import annotations
+import json
+import re
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Literal, TextIO
+
+from ._json_backend import write_json
+
+RecordFormat = Literal["auto", "lines", "array"]
+
+_CHUNK_SIZE = 1 << 16
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+# tokens to find the end of a value without decoding it. A lone quote is the
+# start of a string that continues in the next chunk.
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_STRUCTURE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}"]')
+_SCALAR = re.compile(r'[^,\]}\s]*')
+
+
+def iter_records(
+    path: str | Path | bytes,
+    encoding: str | None = None,
+    format: RecordFormat = "auto",
+    loads: Callable[[str], Any] = json.loads,
+) -> Iterator[Any]:
+    """
+    Iterate over the records of a JSON Lines file or a file of a JSON array.
+    
+    Records are decoded one by one so that memory usage is bounded by the size of
+    the largest record, not by the size of the file.
+    """
+    with open(path, mode="r", encoding=encoding) as f:
+        if format == "auto":
+            format = _detect_format(f)
+        if format == "lines":
+            yield from _iter_lines(f, loads)
+        elif format == "array":
+            yield from _iter_array(f, loads=loads)
+        else:
+            raise ValueError(f"Unknown record format: {format!r}.")
+
+
+def _detect_format(f: TextIO) -> RecordFormat:
+    pos = f.tell()
+    while True:
+        c = f.read(1)
+        if c == "" or c not in _WHITESPACE:
+            break
+    f.seek(pos)
+    return "array" if c == "[" else "lines"
+
+
+def _iter_lines(f: TextIO, loads: Callable[[str], Any]) -> Iterator[Any]:
+    for line in f:
+        if line.strip():
+            yield loads(line)
+
+
+def _iter_array(
+    f: TextIO,
+    chunk_size: int = _CHUNK_SIZE,
+    loads: Callable[[str], Any] = json.loads,
+) -> Iterator[Any]:
+    buf = ""
+    pos = 0
+    eof = False
+
+    def _fill(size: int) -> bool:
+        # read more data, dropping the consumed part of the buffer
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = f.read(size)
+        if chunk == "":
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def _next_char() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not _fill(chunk_size):
+                return ""
+
+    def _raw_decode() -> tuple[Any, int]:
+        size = chunk_size
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # the value may continue in the next chunk
+                if _fill(size):
+                    size *= 2
+                    continue
+                raise
+            if end == len(buf) and _fill(size):
+                # a number at the end of the buffer may be truncated
+                size *= 2
+                continue
+            return obj, end
+
+    def _backend_decode() -> tuple[Any, int]:
+        # find the end of the value first, and decode only the value
+        size = chunk_size
+        while True:
+            end = _value_end(buf, pos)
+            if end is None:
+                if _fill(size):
+                    size *= 2
+                    continue
+                end = len(buf)
+            return loads(buf[pos:end]), end
+
+    decode = _raw_decode if loads is json.loads else _backend_decode
+    if _next_char() != "[":
+        raise json.JSONDecodeError("Expecting '['", buf, pos)
+    pos += 1
+    if _next_char() == "]":
+        return
+    while True:
+        _next_char()
+        obj, end = decode()
+        yield obj
+        pos = end
+        c = _next_char()
+        if c == ",":
+            pos += 1
+        elif c == "]":
+            return
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+
+
+def _value_end(s: str, pos: int) -> int | None:
+    """Return the end of the JSON value at ``pos``, or None if it may continue."""
+    if pos >= len(s):
+        return None
+    c = s[pos]
+    if c == '"':
+        m = _STRING.match(s, pos)
+        return m.end() if m else None
+    if c not in "[{":
+        end = _SCALAR.match(s, pos).end()  # type: ignore
+        # a number at the end of the buffer may be truncated
+        return end if end < len(s) else None
+    depth = 0
+    for m in _STRUCTURE.finditer(s, pos):
+        token = m.group()
+        if token == '"':
+            return None
+        elif token in "[{":
+            depth += 1
+        elif token in "]}":
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    return None
+
+
+def write_records(
+    path: str | Path | bytes,
+    records: Iterable[Any],
+    encoding: str | None = None,
+    format: Literal["lines", "array"] = "lines",
+    dumps: Callable[[Any], str] = json.dumps,
+) -> None:
+    """Write records one by one as a JSON Lines file or a JSON array."""
+    if format not in ("lines", "array"):
+        raise ValueError(f"Unknown record format: {format!r}.")
+    with open(path, mode="w", encoding=encoding) as f:
+        if format == "lines":
+            for record in records:
+                write_json(f, record, dumps)
+                f.write("\n")
+        else:
+            f.write("[")
+            sep = "\n"
+            for record in records:
+                f.write(sep)
+                write_json(f, record, dumps)
+                sep = ",\n"
+            f.write("\n]\n")
+    return None
@@ -0,0 +1,170 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+
+MISSING = object()
+
+
+class KeyNode:
+    """A node of the prefix tree of key paths in a json template."""
+    
+    __slots__ = ("children", "name", "_leaf_keys", "_branches")
+    
+    def __init__(self):
+        self.children: dict[str | int, KeyNode] = {}
+        self.name: str | None = None
+        self._leaf_keys: frozenset[str | int] = frozenset()
+        self._branches: tuple[tuple[str | int, KeyNode], ...] = ()
+    
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name!r} children={list(self.children)!r}>"
+    
+    def is_leaf(self) -> bool:
+        """True if a json property ends at this node."""
+        return self.name is not None
+    
+    def freeze(self) -> None:
+        """Precompute the lookup tables of this node and its descendants."""
+        self._leaf_keys = frozenset(
+            k for k, child in self.children.items() if not child.children
+        )
+        self._branches = tuple(
+            (k, child) for k, child in self.children.items() if child.children
+        )
+        for _, child in self._branches:
+            child.freeze()
+        return None
+    
+    def contained_in(self, obj: Any) -> bool:
+        """True if all the key paths under this node exist in ``obj``."""
+        if type(obj) is dict:
+            # check all the leaves at once
+            if not self._leaf_keys <= obj.keys():
+                return False
+            for k, child in self._branches:
+                value = obj.get(k, MISSING)
+                if value is MISSING or not child.contained_in(value):
+                    return False
+            return True
+        for k, child in self.children.items():
+            try:
+                value = obj[k]
+            except (KeyError, IndexError, TypeError):
+                return False
+            if child.children and not child.contained_in(value):
+                return False
+        return True
+    
+    def iter_leaves(
+        self, keys: tuple[str | int, ...] = ()
+    ) -> Iterator[tuple[str, tuple[str | int, ...]]]:
+        """Iterate over (attribute name, key path) pairs in the template order."""
+        for k, child in self.children.items():
+            if child.name is not None:
+                yield child.name, keys + (k,)
+            yield from child.iter_leaves(keys + (k,))
+    
+    def iter_missing(
+        self, obj: Any, keys: tuple[str | int, ...] = ()
+    ) -> Iterator[tuple[str | int, ...]]:
+        """Iterate over the shortest key paths under this node missing in ``obj``."""
+        for k, child in self.children.items():
+            try:
+                value = obj[k]
+            except (KeyError, IndexError, TypeError):
+                yield keys + (k,)
+            else:
+                if child.children:
+                    yield from child.iter_missing(value, keys + (k,))
+
+
+def build_key_tree(paths: Iterable[tuple[str, Sequence[str | int]]]) -> KeyNode:
+    """Build a prefix tree from (attribute name, key path) pairs."""
+    root = KeyNode()
+    for name, keys in paths:
+        node = root
+        for k in keys:
+            child = node.children.get(k)
+            if child is None:
+                child = node.children[k] = KeyNode()
+            node = child
+        node.name = name
+    root.freeze()
+    return root
+
+
+def compile_extractor(tree: KeyNode, names: Sequence[str]) -> Callable[[Any], list[Any]]:
+    """
+    Compile a function that collects the raw values of attributes in one pass.
+    
+    The returned function takes a json object and returns a list of the raw values
+    at the key paths of ``names``, in that order. Values of missing key paths are
+    ``MISSING``.
+    """
+    positions = {name: i for i, name in enumerate(names)}
+    if len(positions) != len(names):
+        raise ValueError(f"Duplicated attribute names in {names!r}.")
+    leaves = [(name, keys) for name, keys in tree.iter_leaves() if name in positions]
+    if len(leaves) != len(names):
+        known = {name for name, _ in leaves}
+        unknown = [name for name in names if name not in known]
+        raise ValueError(f"Unknown attribute names: {unknown!r}.")
+    subtree = build_key_tree(leaves)
+    
+    # generate a flat function such as
+    # def extract(o0):
+    #     v0 = v1 = MISSING
+    #     try:
+    #         o1 = o0["data"]
+    #     except _ERRORS:
+    #         pass
+    #     else:
+    #         try:
+    #             v0 = o1["id"]
+    #         ...
+    #     return [v0, v1]
+    ns: dict[str, Any] = {"MISSING": MISSING, "_ERRORS": (KeyError, IndexError, TypeError)}
+    lines = ["def extract(o0):"]
+    if names:
+        lines.append("    " + " = ".join(f"v{i}" for i in range(len(names))) + " = MISSING")
+    _generate_walk(subtree, positions, lines, ns, 0)
+    lines.append("    return [" + ", ".join(f"v{i}" for i in range(len(names))) + "]")
+    exec("\n".join(lines), ns)
+    return ns["extract"]
+
+
+def key_repr(key: Any, ns: dict[str, Any]) -> str:
+    """Representation of a key in generated code, adding constants if needed."""
+    if type(key) in (str, int):
+        return repr(key)
+    name = f"_k{len(ns)}"
+    ns[name] = key
+    return name
+
+
+def _generate_walk(
+    node: KeyNode,
+    positions: dict[str, int],
+    lines: list[str],
+    ns: dict[str, Any],
+    level: int,
+) -> None:
+    indent = "    " * (level + 1)
+    obj = f"o{level}"
+    for k, child in node.children.items():
+        key = key_repr(k, ns)
+        if child.children:
+            sub = f"o{level + 1}"
+            lines.append(f"{indent}try:")
+            lines.append(f"{indent}    {sub} = {obj}[{key}]")
+            lines.append(f"{indent}except _ERRORS:")
+            lines.append(f"{indent}    pass")
+            lines.append(f"{indent}else:")
+            if child.name is not None:
+                lines.append(f"{indent}    v{positions[child.name]} = {sub}")
+            _generate_walk(child, positions, lines, ns, level + 1)
+        else:
+            lines.append(f"{indent}try:")
+            lines.append(f"{indent}    v{positions[child.name]} = {obj}[{key}]")
+            lines.append(f"{indent}except _ERRORS:")
+            lines.append(f"{indent}    pass")
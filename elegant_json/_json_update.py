@@ -0,0 +1,51 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._json_class import JsonClass
+
+
+def _identity(x):
+    return x
+
+
+def _mark_dirty(obj: JsonClass, path: tuple[str | int, ...], existed: bool) -> None:
+    """
+    Record that the value at ``path`` is updated, keeping the order of writes.
+    
+    The JSON Patch operation of the first write is kept, that is, "add" if the
+    key did not exist before and "replace" otherwise. The update is also recorded
+    in the json class objects that ``obj`` is nested in, as long as they still
+    contain the dict of ``obj``.
+    """
+    op = "replace" if existed else "add"
+    while True:
+        dirty = getattr(obj, "_json_dirty", None)
+        if dirty is None:
+            obj._json_dirty = {path: op}
+        else:
+            dirty[path] = dirty.pop(path, None) or op
+        parent = getattr(obj, "_json_parent", None)
+        if parent is None:
+            return None
+        owner, prefix = parent
+        if _get_or_none(owner._json, prefix) is not obj._json:
+            # the dict was replaced in the owner
+            obj._json_parent = None
+            return None
+        obj, path = owner, prefix + path
+
+
+def _get_or_none(obj: Any, keys: tuple[str | int, ...]) -> Any:
+    try:
+        for k in keys:
+            obj = obj[k]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return obj
+
+
+def _invalidate_cache(cache: dict[tuple[str | int, ...], Any], path: tuple[str | int, ...]):
+    """Remove cached values at ``path``, its parents and its children."""
+    for cached_path in [p for p in cache if p[:len(path)] == path or path[:len(p)] == p]:
+        del cache[cached_path]
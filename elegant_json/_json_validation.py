@@ -0,0 +1,266 @@
+from __future__ import annotations
+from types import GenericAlias
+from typing import Any, Callable, ForwardRef, NamedTuple, TYPE_CHECKING, get_args, get_origin
+from typing import _eval_type  # type: ignore
+
+from ._json_attribute import _array_dtype, _is_array_annotation
+from ._json_class import _iter_attrs
+from ._json_tree import KeyNode
+from ._json_view import ListView
+
+if TYPE_CHECKING:
+    from ._json_class import JsonClassMeta
+
+Keys = tuple[Any, ...]
+Report = Callable[[Keys, str], None]
+Checker = Callable[[Any, Keys, Report], None]
+
+_VALIDATOR = "_json_validator"
+_MISSING = object()
+
+
+class Violation(NamedTuple):
+    """A violation of a json class format found by ``validate``."""
+    
+    keys: tuple[str | int, ...]
+    message: str
+
+
+class _FailFast(Exception):
+    """Raised to stop validation at the first violation."""
+
+
+def _type_name(x: Any) -> str:
+    return type(x).__name__
+
+
+def _exact_type_checker(*types: type) -> Checker:
+    name = " or ".join(t.__name__ for t in types)
+    def check(value, keys, report):
+        if type(value) not in types:
+            report(keys, f"expected {name}, got {_type_name(value)}")
+    # used for fast paths of containers
+    check.types = frozenset(types)  # type: ignore
+    return check
+
+
+def _simple_types(check: Checker | None) -> frozenset[type] | None:
+    return getattr(check, "types", None)
+
+
+# annotations of JSON types are checked strictly, e.g. bool is not an int and "1"
+# is not an int although they can be converted to int.
+_SIMPLE_CHECKERS: dict[Any, Checker] = {
+    bool: _exact_type_checker(bool),
+    int: _exact_type_checker(int),
+    float: _exact_type_checker(int, float),
+    str: _exact_type_checker(str),
+    list: _exact_type_checker(list),
+    tuple: _exact_type_checker(list),
+    dict: _exact_type_checker(dict),
+    type(None): _exact_type_checker(type(None)),
+}
+
+
+def _define_checker(annotation: Any) -> Checker | None:
+    """
+    Compile a type annotation into a checker function.
+
+    Annotations are handled in the same way as ``_define_converter``. None is
+    returned if any value is accepted.
+    """
+    if annotation is None:
+        return None
+    elif isinstance(annotation, GenericAlias):
+        origin = get_origin(annotation)
+        args = get_args(annotation)
+        if origin is list or origin is ListView:
+            return _list_checker(_define_checker(args[0]))
+        elif origin is dict:
+            return _dict_checker(_define_checker(args[1]))
+        elif origin is tuple:
+            if len(args) == 2 and args[1] is Ellipsis:
+                return _list_checker(_define_checker(args[0]))
+            return _tuple_checker([_define_checker(arg) for arg in args])
+        return None
+    elif isinstance(annotation, (str, ForwardRef)):
+        if isinstance(annotation, str):
+            annotation = ForwardRef(annotation)
+        return _define_checker(_eval_type(annotation, None, None))
+    elif hasattr(annotation, "__json_template__"):
+        return _json_class_checker(annotation)
+    elif isinstance(annotation, type):
+        return _SIMPLE_CHECKERS.get(annotation)
+    return None
+
+
+def _array_checker(annotation: Any) -> Checker | None:
+    """
+    Compile the annotation of an array attribute into a checker of nested lists.
+
+    None is returned if the dtype is not numeric, because any value can be
+    converted into an array of objects.
+    """
+    dtype = _array_dtype(annotation)
+    if dtype is None:
+        return None
+    if dtype.kind == "b":
+        item_check = _SIMPLE_CHECKERS[bool]
+    elif dtype.kind in "iufc":
+        item_check = _SIMPLE_CHECKERS[float]
+    else:
+        return None
+    types = _simple_types(item_check)
+    def check(value, keys, report):
+        if type(value) is not list:
+            report(keys, f"expected list, got {_type_name(value)}")
+        elif not types.issuperset(map(type, value)):
+            for i, item in enumerate(value):
+                if type(item) is list:
+                    check(item, keys + (i,), report)
+                else:
+                    item_check(item, keys + (i,), report)
+    return check
+
+
+def _list_checker(item_check: Checker | None) -> Checker:
+    types = _simple_types(item_check)
+    def check(value, keys, report):
+        if type(value) is not list:
+            report(keys, f"expected list, got {_type_name(value)}")
+        elif item_check is not None:
+            if types is not None and types.issuperset(map(type, value)):
+                return
+            for i, item in enumerate(value):
+                item_check(item, keys + (i,), report)
+    return check
+
+
+def _dict_checker(value_check: Checker | None) -> Checker:
+    types = _simple_types(value_check)
+    def check(value, keys, report):
+        if type(value) is not dict:
+            report(keys, f"expected dict, got {_type_name(value)}")
+        elif value_check is not None:
+            if types is not None and types.issuperset(map(type, value.values())):
+                return
+            for k, v in value.items():
+                value_check(v, keys + (k,), report)
+    return check
+
+
+def _tuple_checker(item_checks: list[Checker | None]) -> Checker:
+    size = len(item_checks)
+    checks = [(i, c) for i, c in enumerate(item_checks) if c is not None]
+    def check(value, keys, report):
+        if type(value) is not list:
+            report(keys, f"expected list, got {_type_name(value)}")
+        elif len(value) != size:
+            report(keys, f"expected {size} items, got {len(value)}")
+        else:
+            for i, c in checks:
+                c(value[i], keys + (i,), report)
+    return check
+
+
+def _json_class_checker(json_class: JsonClassMeta) -> Checker:
+    validator: Checker | None = None
+    def check(value, keys, report):
+        # the validator of the nested class is compiled on the first call, which
+        # allows recursive json classes.
+        nonlocal validator
+        if validator is None:
+            validator = get_validator(json_class)
+        validator(value, keys, report)
+    return check
+
+
+def _compile_node(node: KeyNode, checkers: dict[str, Checker | None]) -> Checker:
+    entries: list[tuple[str | int, Checker | None, Checker | None]] = []
+    for k, child in node.children.items():
+        leaf = checkers.get(child.name) if child.name is not None else None
+        sub = _compile_node(child, checkers) if child.children else None
+        entries.append((k, leaf, sub))
+    
+    def check_entries(obj, keys, report):
+        for k, leaf, sub in entries:
+            try:
+                value = obj[k]
+            except (KeyError, IndexError, TypeError):
+                report(keys + (k,), "missing")
+                continue
+            if leaf is not None:
+                leaf(value, keys + (k,), report)
+            if sub is not None:
+                sub(value, keys + (k,), report)
+    
+    # For dict input, leaves that only need a type check are checked at once. The
+    # slow path is used once anything is wrong, to report in the template order.
+    simple: list[tuple[str | int, frozenset[type]]] = []
+    others: list[tuple[str | int, Checker | None, Checker | None]] = []
+    for k, leaf, sub in entries:
+        types = _simple_types(leaf)
+        if sub is None and types is not None:
+            simple.append((k, types))
+        else:
+            others.append((k, leaf, sub))
+    others_keys = [k for k, _, _ in others]
+    
+    def check(obj, keys, report):
+        if type(obj) is not dict:
+            return check_entries(obj, keys, report)
+        for k, types in simple:
+            if type(obj.get(k, _MISSING)) not in types:
+                return check_entries(obj, keys, report)
+        for k in others_keys:
+            if k not in obj:
+                return check_entries(obj, keys, report)
+        for k, leaf, sub in others:
+            value = obj[k]
+            if leaf is not None:
+                leaf(value, keys + (k,), report)
+            if sub is not None:
+                sub(value, keys + (k,), report)
+    return check
+
+
+def _compile_validator(json_class: JsonClassMeta) -> Checker:
+    checkers: dict[str, Checker | None] = {}
+    for attr, _ in _iter_attrs(json_class.__json_template__):
+        if attr.array or _is_array_annotation(attr.annotation):
+            checkers[attr.name] = _array_checker(attr.annotation)  # type: ignore
+        else:
+            checkers[attr.name] = _define_checker(attr.annotation)  # type: ignore
+    check_tree = _compile_node(json_class._json_key_tree, checkers)
+    def check(value, keys, report):
+        if type(value) is not dict:
+            report(keys, f"expected dict, got {_type_name(value)}")
+        else:
+            check_tree(value, keys, report)
+    return check
+
+
+def get_validator(json_class: JsonClassMeta) -> Checker:
+    """Get the compiled validator of a json class."""
+    validator = json_class.__dict__.get(_VALIDATOR)
+    if validator is None:
+        validator = _compile_validator(json_class)
+        setattr(json_class, _VALIDATOR, validator)
+    return validator
+
+
+def validate(obj: Any, json_class: JsonClassMeta, fail_fast: bool = False) -> list[Violation]:
+    """Run the validator of ``json_class`` and collect violations."""
+    violations: list[Violation] = []
+    if fail_fast:
+        def report(keys: Keys, message: str):
+            violations.append(Violation(keys, message))
+            raise _FailFast
+    else:
+        def report(keys: Keys, message: str):
+            violations.append(Violation(keys, message))
+    try:
+        get_validator(json_class)(obj, (), report)
+    except _FailFast:
+        pass
+    return violations
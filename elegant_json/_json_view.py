@@ -0,0 +1,126 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from types import GenericAlias
+from typing import Any, Callable, Iterator, TypeVar, overload
+
+from ._json_update import _get_or_none, _identity, _invalidate_cache, _mark_dirty
+
+_T = TypeVar("_T")
+
+class ListView(Sequence):
+    """
+    A lazy sequence view of a json list.
+
+    Used as a type annotation such as ``items: ListView[D]``. Items are converted
+    by the annotation only when they are accessed, so that indexing is O(1)
+    regardless of the list length. Slicing returns a view of the same list
+    without copying. Item assignment writes to the json list directly, and is
+    recorded as an update of the json class object the view was taken from.
+
+    Examples
+    --------
+    >>> class C(JsonClass):
+    >>>     __json_template__ = {"items": Attr()}
+    >>>     items: ListView[D]
+    >>> c.items[5000].name  # only the 5000th item is wrapped
+    """
+
+    __class_getitem__ = classmethod(GenericAlias)
+    __slots__ = ("_data", "_range", "_converter", "_parent")
+
+    def __init__(
+        self,
+        data: list[Any],
+        converter: Callable[[Any], _T] = _identity,
+        indices: range | None = None,
+    ):
+        if not isinstance(data, list):
+            raise TypeError(f"Input of ListView must be a list, got {type(data)}")
+        self._data = data
+        self._range = indices
+        self._converter = converter
+        # the json class object this view is taken from, and the key path in it
+        self._parent: tuple[Any, tuple[str | int, ...]] | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.tolist()!r})"
+
+    def __len__(self) -> int:
+        if self._range is None:
+            return len(self._data)
+        return len(self._range)
+
+    @overload
+    def __getitem__(self, key: int) -> _T: ...
+    @overload
+    def __getitem__(self, key: slice) -> ListView[_T]: ...
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            indices = self._indices()[key]
+            view = self.__class__(self._data, self._converter, indices)
+            view._parent = self._parent
+            return view
+        if self._range is None:
+            if self._parent is None:
+                return self._converter(self._data[key])
+            if key < 0:
+                key += len(self._data)
+        else:
+            key = self._range[key]
+        return self._link(self._converter(self._data[key]), key)
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        if isinstance(key, slice):
+            raise TypeError("ListView does not support slice assignment.")
+        if hasattr(value, "__json_template__"):
+            value = value.json
+        index = self._indices()[key]
+        self._data[index] = value
+        if self._parent is not None:
+            owner, path = self._parent
+            if _get_or_none(owner._json, path) is self._data:
+                keys = path + (index,)
+                cache = getattr(owner, "_json_cache", None)
+                if cache:
+                    _invalidate_cache(cache, keys)
+                _mark_dirty(owner, keys, True)
+        return None
+
+    def __iter__(self) -> Iterator[_T]:
+        if self._parent is not None and self._converter is not _identity:
+            return map(self.__getitem__, range(len(self)))
+        if self._range is None:
+            if self._converter is _identity:
+                return iter(self._data)
+            return map(self._converter, self._data)
+        data = self._data
+        return map(self._converter, (data[i] for i in self._range))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, ListView)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def _link(self, item: Any, index: int) -> Any:
+        """Set the owner of a json class item, to report its updates."""
+        if self._parent is not None and hasattr(item, "__json_template__"):
+            owner, path = self._parent
+            item._json_parent = (owner, path + (index,))
+        return item
+
+    def _indices(self) -> range:
+        if self._range is None:
+            return range(len(self._data))
+        return self._range
+
+    def tolist(self) -> list[Any]:
+        """Return the json values as a list, without conversion."""
+        if self._range is None:
+            return list(self._data)
+        data = self._data
+        return [data[i] for i in self._range]
@@ -1,26 +1,52 @@
 from __future__ import annotations
-import json
+from collections import OrderedDict
+import copyreg
+import weakref
 from pathlib import Path
-from typing import Callable, Literal, TypeVar, overload, Any
-from ._json_class import JsonClass, _JSON_TEMPLATE, _JSON_MUTABLE
-from ._json_attribute import JsonProperty
+from typing import Callable, Iterable, Iterator, Literal, TypeVar, overload, Any
+from ._json_attribute import Attr
+from ._json_class import (
+    JsonClass,
+    JsonClassMeta,
+    _JSON_TEMPLATE,
+    _JSON_MUTABLE,
+    _JSON_CACHE,
+    _JSON_SLOTS,
+    _JSON_CODEGEN,
+    _JSON_BACKEND,
+    _load_json,
+)
+from ._json_backend import get_backend
+from ._json_columns import get_extractor
+from ._json_patch import diff_values
+from ._json_shared import original_class
+from ._json_stream import RecordFormat, iter_records
+from ._json_validation import Violation, validate as _validate
 
 _C = TypeVar("_C")
 
 @overload
-def jsonclass(template_or_class: type[_C], template: dict[str, Any | None], mutable: bool = False) -> type[_C | JsonClass]:
+def jsonclass(template_or_class: type[_C], template: dict[str, Any | None], mutable: bool = False, cache: bool = False, slots: bool = False, codegen: bool = False, backend: str | None = None) -> type[_C | JsonClass]:
     ...
 
 @overload
-def jsonclass(template_or_class: Literal[None], template: dict[str, Any | None], mutable: bool = False) -> Callable[[type[_C]], type[_C | JsonClass]]:
+def jsonclass(template_or_class: Literal[None], template: dict[str, Any | None], mutable: bool = False, cache: bool = False, slots: bool = False, codegen: bool = False, backend: str | None = None) -> Callable[[type[_C]], type[_C | JsonClass]]:
     ...
     
 @overload
-def jsonclass(template_or_class: dict[str, Any | None], template: Literal[None] = None, mutable: bool = False) -> Callable[[type[_C]], type[_C | JsonClass]]:
+def jsonclass(template_or_class: dict[str, Any | None], template: Literal[None] = None, mutable: bool = False, cache: bool = False, slots: bool = False, codegen: bool = False, backend: str | None = None) -> Callable[[type[_C]], type[_C | JsonClass]]:
     ...
 
     
-def jsonclass(template_or_class=None, template=None, mutable=False):
+def jsonclass(
+    template_or_class=None,
+    template=None,
+    mutable=False,
+    cache=False,
+    slots=False,
+    codegen=False,
+    backend=None,
+):
     """
     Create a json class with specified template.
     
@@ -33,6 +59,12 @@ def jsonclass(template_or_class=None, template=None, mutable=False):
     >>> @jsonclass
     >>> class C: 
     >>>     __json_template__ = {...}
+    
+    ``slots=True`` only removes ``__dict__`` from instances if the input class also
+    defines ``__slots__``. A class with non-empty ``__slots__`` is re-created as a
+    subclass of ``JsonClass`` instead of being inherited, in the same way as
+    ``dataclass(slots=True)``. ``backend`` is the name of the JSON backend used by
+    the class, such as "orjson". The default backend is used if not given.
 
     Returns
     -------
@@ -59,23 +91,85 @@ def jsonclass(template_or_class=None, template=None, mutable=False):
         raise TypeError
     
     def _func(cls_):
-        nonlocal template, mutable
-        template = getattr(cls, _JSON_TEMPLATE, template)
-        mutable = getattr(cls, _JSON_MUTABLE, mutable)
+        nonlocal template, mutable, cache, slots, codegen, backend
+        template = getattr(cls_, _JSON_TEMPLATE, template)
+        mutable = getattr(cls_, _JSON_MUTABLE, mutable)
+        cache = getattr(cls_, _JSON_CACHE, cache)
+        slots = getattr(cls_, _JSON_SLOTS, slots)
+        codegen = getattr(cls_, _JSON_CODEGEN, codegen)
+        backend = getattr(cls_, _JSON_BACKEND, backend)
         if not isinstance(template, dict):
             raise TypeError("`template` must be given as a dict.")
-        ns = {_JSON_TEMPLATE: template, _JSON_MUTABLE: mutable}
+        ns = {
+            _JSON_TEMPLATE: template,
+            _JSON_MUTABLE: mutable,
+            _JSON_CACHE: cache,
+            _JSON_SLOTS: slots,
+            _JSON_CODEGEN: codegen,
+            _JSON_BACKEND: backend,
+        }
+        if _own_slots(cls_):
+            return _recreate_slotted(cls_, ns)
         return type(cls_.__name__, (cls_, JsonClass), ns)
     
     return _func if cls is None else _func(cls)
 
+
+def _own_slots(cls: type) -> tuple[str, ...]:
+    """Slots defined by the class itself, except for __dict__ and __weakref__."""
+    slots = cls.__dict__.get("__slots__", ())
+    if isinstance(slots, str):
+        slots = (slots,)
+    return tuple(s for s in slots if s not in ("__dict__", "__weakref__"))
+
+
+def _recreate_slotted(cls: type, ns: dict[str, Any]) -> type[JsonClass]:
+    """
+    Re-create a class with non-empty __slots__ as a subclass of JsonClass.
+
+    A class with slots cannot be combined with JsonClass, which also has slots, so
+    the class body is copied into a new class in the same way as
+    ``dataclass(slots=True)``. The new class does not inherit the input class.
+    """
+    slots = _own_slots(cls)
+    body = {
+        k: v for k, v in cls.__dict__.items()
+        if k not in slots and k not in ("__dict__", "__weakref__")
+    }
+    if not ns[_JSON_SLOTS]:
+        slots += ("__dict__", "__weakref__")
+    body.update(ns, __slots__=slots)
+    bases = tuple(b for b in cls.__bases__ if b is not object) + (JsonClass,)
+    new = type(cls.__name__, bases, body)
+    # zero-argument super() refers to the class through the __class__ cell
+    for v in body.values():
+        if isinstance(v, (classmethod, staticmethod)):
+            funcs = [v.__func__]
+        elif isinstance(v, property):
+            funcs = [v.fget, v.fset, v.fdel]
+        else:
+            funcs = [v]
+        for func in funcs:
+            for cell in getattr(func, "__closure__", None) or ():
+                if cell.cell_contents is cls:
+                    cell.cell_contents = new
+    return new
+
 class _dummy:
     """Dummy class for json class creation."""
 
+class _slotted_dummy:
+    """Dummy class for slotted json class creation."""
+    __slots__ = ()
+
 def create_constructor(
     template: dict[str, Any | None],
     mutable: bool = False,
-    name: str | None = None
+    name: str | None = None,
+    cache: bool = False,
+    slots: bool = False,
+    codegen: bool = False,
+    backend: str | None = None,
 ) -> type[_dummy | JsonClass]:
     """
     Create a JsonClass in a simple way.
@@ -92,29 +186,159 @@ def create_constructor(
         Default mutability of properties.
     name : str, optional
         Name of the class. Automatically determined by default.
+    cache : bool, default is False
+        Default cache mode of properties.
+    slots : bool, default is False
+        If true, instances will not have ``__dict__`` to reduce memory usage.
+    codegen : bool, default is False
+        If true, property getters and setters are compiled from generated code
+        specialized for each key path.
+    backend : str, optional
+        Name of the JSON backend. The default backend is used if not given.
     
     Returns
     -------
     JsonClass subclass
         A class implemented with properties extracted from the template dictionary.
+        Classes are cached by the structure of the template and the arguments, so
+        that the same class may be returned for equal templates.
     
     See also
     --------
     :func:`create_loader`
     """
-    cls = jsonclass(_dummy, template=template, mutable=mutable)
+    try:
+        key = (
+            _template_key(template),
+            bool(mutable),
+            name,
+            bool(cache),
+            bool(slots),
+            bool(codegen),
+            backend,
+        )
+    except TypeError:
+        # template contains unhashable values
+        key = None
+    else:
+        cls = _CLASS_CACHE.get(key)
+        if cls is not None:
+            _CLASS_CACHE.move_to_end(key)
+            return cls
+    
+    base = _slotted_dummy if slots else _dummy
+    cls = jsonclass(
+        base,
+        template=template,
+        mutable=mutable,
+        cache=cache,
+        slots=slots,
+        codegen=codegen,
+        backend=backend,
+    )
     if name is None:
         cls.__name__ = f"JsonClass{hex(id(cls))}"
     else:
         cls.__name__ = str(name)
     cls.__qualname__ = f"elegant_json.{cls.__name__}"
     cls.__module__ = "elegant_json"
+    _register_constructor(cls, f"{cls.__name__}-{id(cls):x}")
+    if key is not None:
+        _CLASS_CACHE[key] = cls
+        if len(_CLASS_CACHE) > _CLASS_CACHE_SIZE:
+            _CLASS_CACHE.popitem(last=False)
     return cls
 
+# LRU cache of the classes created by `create_constructor`, keyed by the structure
+# of the template and the flags.
+_CLASS_CACHE_SIZE = 128
+_CLASS_CACHE: OrderedDict[Any, type] = OrderedDict()
+
+def _template_key(x: Any, parent_key: Any = None) -> Any:
+    """
+    Hashable key that is equal for structurally equal templates.
+    
+    Types are included so that such as 1, 1.0 and True are distinguished. Raises
+    TypeError if the template has unhashable values.
+    """
+    if isinstance(x, dict):
+        return (dict, tuple((k, _template_key(v, k)) for k, v in x.items()))
+    elif isinstance(x, (list, tuple)):
+        return (type(x), tuple(_template_key(v) for v in x))
+    elif isinstance(x, Attr):
+        return (
+            Attr,
+            # Attr without name is named after the key when a class is created
+            None if x.name == parent_key else x.name,
+            x.annotation,
+            _template_key(x.default),
+            x.mutable if x.mutability_given else None,
+            x.cache if x.cache_given else None,
+            x.array,
+        )
+    hash(x)
+    return (type(x), x)
+
+# Classes created by `create_constructor` cannot be found by their names, so they
+# are pickled with their templates and rebuilt on unpickling. The key is used to
+# return the same class if it already exists in the process.
+_CONSTRUCTOR_KEYS: weakref.WeakKeyDictionary[type, str] = weakref.WeakKeyDictionary()
+_CONSTRUCTORS: weakref.WeakValueDictionary[str, type] = weakref.WeakValueDictionary()
+
+def _register_constructor(cls: type, key: str) -> None:
+    _CONSTRUCTOR_KEYS[cls] = key
+    _CONSTRUCTORS[key] = cls
+    return None
+
+def _rebuild_constructor(
+    key: str,
+    template: dict[str, Any | None],
+    mutable: bool,
+    name: str,
+    cache: bool,
+    slots: bool,
+    codegen: bool,
+    backend: str | None = None,
+) -> type[_dummy | JsonClass]:
+    cls = _CONSTRUCTORS.get(key)
+    if cls is None:
+        cls = create_constructor(
+            template,
+            mutable=mutable,
+            name=name,
+            cache=cache,
+            slots=slots,
+            codegen=codegen,
+            backend=backend,
+        )
+        _register_constructor(cls, key)
+    return cls
+
+def _reduce_json_class(cls: JsonClassMeta):
+    key = _CONSTRUCTOR_KEYS.get(cls)
+    if key is None:
+        # pickle by reference as usual
+        return cls.__qualname__
+    args = (
+        key,
+        cls.__json_template__,
+        cls.__json_mutable__,
+        cls.__name__,
+        cls.__json_cache__,
+        cls.__json_slots__,
+        cls.__json_codegen__,
+        cls.__json_backend__,
+    )
+    return _rebuild_constructor, args
+
+copyreg.pickle(JsonClassMeta, _reduce_json_class)
+
 def create_loader(
     template: dict[str, Any | None],
     mutable: bool = False,
-    name: str | None = None
+    name: str | None = None,
+    cache: bool = False,
+    backend: str | None = None,
 ):
     """
     Create a loader function in a simple way.
@@ -130,26 +354,91 @@ def create_loader(
         Default mutability of properties.
     name : str, optional
         Name of the class. Automatically determined by default.
+    cache : bool, default is False
+        Default cache mode of properties.
+    backend : str, optional
+        Name of the JSON backend. The default backend is used if not given.
     
     Returns
     -------
     Callable
-        A loader function.
+        A loader function. It accepts the ``selective`` and ``memory_map``
+        arguments in the same way as :meth:`JsonClass.load`.
     
     See also
     --------
     :func:`create_constructor`
+    :func:`create_iter_loader`
     """
-    cls = create_constructor(template=template, mutable=mutable, name=name)
+    cls = create_constructor(
+        template=template, mutable=mutable, name=name, cache=cache, backend=backend
+    )
     # NOTE: simply this function can return `cls.load` but will not work if
     # new class has `load` property by chance.
-    def load(path: str | Path | bytes, encoding: str | None = None):
-        with open(path, mode="r", encoding=encoding) as f:
-            js = json.load(f)
-        return cls(js)  # type: ignore
+    def load(
+        path: str | Path | bytes,
+        encoding: str | None = None,
+        *,
+        selective: bool = False,
+        memory_map: bool = False,
+    ):
+        tree = cls._json_key_tree if selective else None
+        _backend = get_backend(backend)
+        return cls(_load_json(path, encoding, tree, memory_map, _backend))  # type: ignore
     return load
 
 
+def create_iter_loader(
+    template: dict[str, Any | None],
+    mutable: bool = False,
+    name: str | None = None,
+    cache: bool = False,
+    backend: str | None = None,
+):
+    """
+    Create a record-stream loader function in a simple way.
+    
+    Similar to :func:`create_loader`, but the returned function takes a path to a
+    JSON Lines file or a JSON array of records, and lazily yields a JsonClass
+    object for each record.
+    
+    Parameters
+    ----------
+    template : dict
+        JSON record template dictionary.
+    mutable : bool, default is False
+        Default mutability of properties.
+    name : str, optional
+        Name of the class. Automatically determined by default.
+    cache : bool, default is False
+        Default cache mode of properties.
+    backend : str, optional
+        Name of the JSON backend. The default backend is used if not given.
+    
+    Returns
+    -------
+    Callable
+        A loader function that returns an iterator.
+    
+    See also
+    --------
+    :func:`create_loader`
+    """
+    cls = create_constructor(
+        template=template, mutable=mutable, name=name, cache=cache, backend=backend
+    )
+    def iter_load(
+        path: str | Path | bytes,
+        encoding: str | None = None,
+        *,
+        format: RecordFormat = "auto",
+    ) -> Iterator[Any]:
+        loads = get_backend(backend).loads
+        for js in iter_records(path, encoding, format, loads):
+            yield cls(js)  # type: ignore
+    return iter_load
+
+
 def isformatted(obj, json_class: type[JsonClass]) -> bool:
     """
     Check if the input object is in ``json_class`` format.
@@ -161,12 +450,128 @@ def isformatted(obj, json_class: type[JsonClass]) -> bool:
         raise TypeError("The second argument of `isformatted` must be a JsonClass.")
     if not isinstance(obj, dict):
         return False
-    for name in json_class._json_properties:
-        prop: JsonProperty = getattr(json_class, name)
-        try:
-            out: Any = obj
-            for k in prop.keys():
-                out = out[k]
-        except (KeyError, IndexError):
-            return False
-    return True
\ No newline at end of file
+    return json_class._json_key_tree.contained_in(obj)
+
+
+@overload
+def isformatted_many(
+    objs: Iterable[Any],
+    json_class: type[JsonClass],
+    return_paths: Literal[False] = False,
+) -> list[bool]:
+    ...
+
+@overload
+def isformatted_many(
+    objs: Iterable[Any],
+    json_class: type[JsonClass],
+    return_paths: Literal[True],
+) -> list[list[tuple[str | int, ...]]]:
+    ...
+
+def isformatted_many(objs, json_class, return_paths=False):
+    """
+    Check if each of the input objects is in ``json_class`` format.
+    
+    Parameters
+    ----------
+    objs : iterable
+        Objects to check.
+    json_class : JsonClass subclass
+        The json class that defines the format.
+    return_paths : bool, default is False
+        If true, return the missing key paths of each object instead of booleans.
+        An object that is not a dict is reported by an empty key path.
+    
+    Returns
+    -------
+    list of bool, or list of list of tuple
+        Check results in the order of ``objs``.
+    """
+    if not issubclass(json_class, JsonClass):
+        raise TypeError("The second argument of `isformatted_many` must be a JsonClass.")
+    tree = json_class._json_key_tree
+    if return_paths:
+        return [
+            list(tree.iter_missing(obj)) if isinstance(obj, dict) else [()]
+            for obj in objs
+        ]
+    return [isinstance(obj, dict) and tree.contained_in(obj) for obj in objs]
+
+
+def validate(
+    obj: Any,
+    json_class: type[JsonClass],
+    fail_fast: bool = False,
+) -> list[Violation]:
+    """
+    Validate the input object against the format of ``json_class``.
+    
+    Unlike :func:`isformatted`, the values are also checked against the type
+    annotations of the properties. JSON types are checked strictly: ``int`` only
+    accepts integers, ``float`` accepts integers and floats, ``tuple[...]`` accepts
+    arrays of the same length, and nested JsonClass types are validated
+    recursively. Other annotations accept any value. The checks are compiled on the
+    first call for each class.
+    
+    Parameters
+    ----------
+    obj : Any
+        Object to validate.
+    json_class : JsonClass subclass
+        The json class that defines the format.
+    fail_fast : bool, default is False
+        If true, stop at the first violation.
+    
+    Returns
+    -------
+    list of Violation
+        Violations with their key paths. Empty if the object is valid.
+    
+    Examples
+    --------
+    >>> validate({"values": "oops"}, C)
+    [Violation(keys=('values',), message='expected list, got str')]
+    """
+    if not issubclass(json_class, JsonClass):
+        raise TypeError("The second argument of `validate` must be a JsonClass.")
+    return _validate(obj, json_class, fail_fast)
+
+
+def diff(a: JsonClass, b: JsonClass) -> list[dict[str, Any]]:
+    """
+    Compare two json class objects and return the differences as a JSON Patch.
+    
+    Only the values at the key paths of the template are compared. Other parts of
+    the json dictionaries are ignored, so that the comparison is much cheaper than
+    comparing the whole dictionaries. The returned operations (RFC 6902) update
+    the template values of ``a`` to those of ``b``.
+    
+    Parameters
+    ----------
+    a, b : JsonClass
+        Objects of the same json class.
+    
+    Returns
+    -------
+    list of dict
+        JSON Patch operations in the template order. Values of the same types are
+        compared by equality, and values of different types, such as 1 and 1.0,
+        are always considered to be different.
+    
+    Examples
+    --------
+    >>> diff(C({"data": {"value": 1}}), C({"data": {"value": 2}}))
+    [{'op': 'replace', 'path': '/data/value', 'value': 2}]
+    """
+    # objects read from shared memory are compared as the original class
+    cls = original_class(type(a))
+    if not isinstance(a, JsonClass) or original_class(type(b)) is not cls:
+        raise TypeError(
+            f"Arguments of `diff` must be objects of the same json class, got "
+            f"{type(a).__name__} and {type(b).__name__}."
+        )
+    extract = get_extractor(cls, cls._json_attr_names)
+    return diff_values(
+        a.json, b.json, cls._json_attr_paths, extract(a.json), extract(b.json)
+    )
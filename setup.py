@@ -17,8 +17,9 @@ setup(
     author_email="liuhanjin-sc@g.ecc.u-tokyo.ac.jp",
     license="BSD 3-Clause",
     download_url="https://github.com/hanjinliu/elegant-json",
-    packages=find_packages(exclude=["docs", "examples", "rst", "tests", "tests.*"]),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*", "docs", "examples", "rst", "tests", "tests.*"]),
     package_data={"elegant_json": ["**/*.pyi", "*.pyi"]},
     install_requires=[],
+    extras_require={"msgpack": ["msgpack"]},
     python_requires=">=3.8",
 )
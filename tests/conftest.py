@@ -0,0 +1,31 @@
+import copy
+import pytest
+
+_CODEGEN_CLASSES: dict[type, type] = {}
+
+
+def _with_codegen(cls: type) -> type:
+    """Create a subclass of a json class whose properties are generated code."""
+    out = _CODEGEN_CLASSES.get(cls)
+    if out is None:
+        # the metaclass reads the options and the annotations from the namespace
+        ns = {
+            k: v for k, v in cls.__dict__.items()
+            if k in ("__json_mutable__", "__json_cache__", "__annotations__")
+        }
+        ns["__json_template__"] = copy.deepcopy(cls.__json_template__)
+        ns["__json_codegen__"] = True
+        out = _CODEGEN_CLASSES[cls] = type(cls)(f"{cls.__name__}Codegen", (cls,), ns)
+    return out
+
+
+@pytest.fixture(params=[False, True], ids=["closure", "codegen"])
+def cls(request):
+    """
+    The json class ``C`` of the test module, and its variant with generated
+    properties. A module can define the variant as ``CCodegen``.
+    """
+    base = request.module.C
+    if not request.param:
+        return base
+    return getattr(request.module, "CCodegen", None) or _with_codegen(base)
@@ -0,0 +1,69 @@
+import pytest
+from elegant_json import JsonClass, Attr, create_constructor
+
+np = pytest.importorskip("numpy")
+npt = pytest.importorskip("numpy.typing")
+
+def _template():
+    return {
+        "a": Attr(array=True),
+        "b": Attr(annotation=float, array=True),
+        "c": Attr(annotation=np.int32),
+        "d": Attr(annotation=np.dtype("float32")),
+        "e": Attr(),
+        "f": Attr(annotation=npt.NDArray[np.uint8]),
+        "g": Attr(annotation="int16", array=True),
+    }
+
+JSON = {
+    "a": [1, 2, 3],
+    "b": [[1, 2], [3, 4]],
+    "c": [1, 2],
+    "d": [0.5],
+    "e": [[1.0], [2.0]],
+    "f": [255, 0],
+    "g": [1],
+}
+
+class C(JsonClass):
+    __json_template__ = _template()
+    __json_mutable__ = True
+    e: list[list[float]]
+
+class CCodegen(JsonClass):
+    __json_template__ = {**_template(), "e": Attr(annotation=list[list[float]], array=True)}
+    __json_mutable__ = True
+    __json_codegen__ = True
+
+def test_get_array(cls):
+    c = cls(JSON)
+    assert c.a.dtype == np.asarray([1]).dtype and c.a.tolist() == [1, 2, 3]
+    assert c.b.dtype == np.float64 and c.b.shape == (2, 2)
+    assert c.c.dtype == np.int32
+    assert c.d.dtype == np.float32
+    assert c.f.dtype == np.uint8
+    assert c.g.dtype == np.int16
+    if cls.__json_codegen__:
+        assert c.e.dtype == np.float64 and c.e.shape == (2, 1)
+    else:
+        assert c.e == [[1.0], [2.0]]
+
+def test_set_array(cls):
+    c = cls(dict(JSON))
+    c.b = np.zeros((2, 3), dtype=np.float32)
+    assert c.json["b"] == [[0.0] * 3] * 2
+    assert type(c.json["b"][0][0]) is float
+    c.c = np.int32(4)
+    assert c.json["c"] == 4 and type(c.json["c"]) is int
+    c.a = [5]
+    assert c.json["a"] == [5]
+    assert c.json_patch()[0] == {"op": "replace", "path": "/b", "value": [[0.0] * 3] * 2}
+
+def test_array_default(cls):
+    assert cls({}).a is None
+
+def test_array_cache():
+    D = create_constructor({"x": Attr(array=True, annotation=float)}, cache=True)
+    d = D({"x": [1, 2]})
+    assert d.x is d.x
+    assert create_constructor({"x": Attr(annotation=float)}, cache=True) is not D
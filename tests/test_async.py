@@ -0,0 +1,119 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+import elegant_json as ej
+from elegant_json import JsonClass, Attr
+
+class C(JsonClass):
+    __json_template__ = {"id": Attr(), "data": {"name": Attr()}}
+    __json_mutable__ = True
+    id: int
+    name: str
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    yield
+    ej.configure_async()
+
+def _write_files(tmp_path, n):
+    paths = []
+    for i in range(n):
+        path = tmp_path / f"{i}.json"
+        path.write_text(json.dumps({"id": i, "data": {"name": f"n{i}", "x": [1]}}))
+        paths.append(path)
+    return paths
+
+@pytest.mark.parametrize("selective", [False, True])
+def test_aload(tmp_path, selective):
+    paths = _write_files(tmp_path, 10)
+    
+    async def main():
+        return await asyncio.gather(*(C.aload(p, selective=selective) for p in paths))
+    
+    out = asyncio.run(main())
+    assert [c.id for c in out] == list(range(10))
+    assert all(type(c) is C for c in out)
+    assert ("x" in out[0].json["data"]) is not selective
+
+def test_adump(tmp_path):
+    path = tmp_path / "out.json"
+    c = C({"id": 0, "data": {"name": "a"}})
+    c.name = "b"
+    asyncio.run(c.adump(path))
+    assert json.loads(path.read_text()) == c.json
+    assert c.json_patch() == []
+
+@pytest.mark.parametrize("batch_size", [1, 3, 256])
+def test_aiter_load(tmp_path, batch_size):
+    path = tmp_path / "records.jsonl"
+    objs = [C({"id": i, "data": {"name": str(i)}}) for i in range(10)]
+    C.iter_dump(path, objs)
+    
+    async def main():
+        return [c async for c in C.aiter_load(path, batch_size=batch_size)]
+    
+    out = asyncio.run(main())
+    assert [c.json for c in out] == [c.json for c in objs]
+
+def test_aiter_load_break(tmp_path):
+    path = tmp_path / "records.json"
+    C.iter_dump(path, [C({"id": i}) for i in range(10)], format="array")
+    
+    async def main():
+        it = C.aiter_load(path, batch_size=2)
+        async for c in it:
+            if c.id == 2:
+                break
+        await it.aclose()
+        return c
+    
+    assert asyncio.run(main()).id == 2
+
+def test_concurrency_bound(tmp_path):
+    paths = _write_files(tmp_path, 8)
+    lock = threading.Lock()
+    active = [0, 0]  # current, max
+    
+    def loads(s):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return json.loads(s)
+    
+    ej.register_backend("slow", loads, json.dumps)
+    
+    class D(C):
+        __json_backend__ = "slow"
+    
+    async def main():
+        return await asyncio.gather(*(D.aload(p) for p in paths))
+    
+    with ThreadPoolExecutor(8) as pool:
+        ej.configure_async(pool, max_concurrency=2)
+        out = asyncio.run(main())
+    assert [c.id for c in out] == list(range(8))
+    assert active[1] == 2
+
+def test_process_executor(tmp_path):
+    paths = _write_files(tmp_path, 3)
+    
+    async def main():
+        out = await asyncio.gather(*(C.aload(p) for p in paths))
+        await out[0].adump(paths[0])
+        return out, [c async for c in C.aiter_load(paths[1])]
+    
+    with ProcessPoolExecutor(2) as pool:
+        ej.configure_async(pool)
+        out, records = asyncio.run(main())
+    assert [c.id for c in out] == [0, 1, 2]
+    assert records[0].json == out[1].json
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        ej.configure_async(max_concurrency=0)
@@ -0,0 +1,179 @@
+import json
+import pickle
+from pathlib import Path
+import pytest
+import elegant_json as ej
+from elegant_json import JsonClass, Attr, create_constructor
+from elegant_json._json_backend import get_backend
+
+BACKENDS = ej.available_backends()
+JSON_DIR = Path(__file__).parent / "jsons"
+
+FIXTURES = [
+    '{"a": 1, "b": [1, 2.5, -3e-10, true, false, null], "c": {"d": "e"}}',
+    '{"unicode": "\\u3042\\u00e9 café \U0001f600", "esc": "a\\"b\\\\c\\n/"}',
+    '{"big": 123456789012345678901234567890, "neg": -98765432109876543210}',
+    '{"float": 0.1, "exp": 1.7976931348623157e308, "tiny": 5e-324, "int": 9007199254740993}',
+    '{"nan": NaN, "inf": Infinity}',
+    '{"empty": {}, "list": [], "str": ""}',
+    '{"deep": [[[[[[{"x": [1, [2, [3]]]}]]]]]]}',
+    '  {"ws" :\t1 }\n',
+] + [p.read_text() for p in sorted(JSON_DIR.glob("*.json"))]
+
+class C(JsonClass):
+    __json_template__ = {"a": Attr(), "c": {"d": Attr()}}
+    a: int
+    d: str
+
+@pytest.fixture
+def default_backend():
+    from elegant_json import _json_backend
+    old = _json_backend._default
+    yield
+    _json_backend._default = old
+
+def _equal(x, y):
+    # NaN != NaN
+    return json.dumps(x, sort_keys=True) == json.dumps(y, sort_keys=True)
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("text", FIXTURES)
+def test_loads_conformance(backend, text):
+    loads = get_backend(backend).loads
+    expected = json.loads(text)
+    assert _equal(loads(text), expected)
+    assert _equal(loads(text.encode("utf-8")), expected)
+    assert _equal(loads(text.encode("utf-16")), expected)
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("text", FIXTURES)
+def test_dumps_round_trip(backend, text):
+    obj = json.loads(text)
+    out = get_backend(backend).dumps(obj)
+    assert isinstance(out, str)
+    assert _equal(json.loads(out), obj)
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("text", FIXTURES)
+def test_dumps_format(backend, text):
+    obj = json.loads(text)
+    assert get_backend(backend).dumps(obj) == json.dumps(obj)
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"a,b": "c:d", "e": [", ", ": "], "f": "x\n  y"},
+        [1e16, 1e-5, 1e-7, 0.0001, -2.5e300, 123.0, -0.0],
+        {"\x7f": "\x00\x1f", "é": "\ud800"},
+        1e22,
+        [[], {}, [{}], {"a": [[]]}],
+    ],
+)
+def test_dumps_format_edge_cases(backend, obj):
+    assert get_backend(backend).dumps(obj) == json.dumps(obj)
+
+def test_default_backend():
+    assert get_backend().name == get_backend("auto").name
+    assert get_backend().dumps({"a": float("nan")}) == '{"a": NaN}'
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_big_int_in_string(backend):
+    loads = get_backend(backend).loads
+    text = '{"id": "12345678901234567890", "n": [1, -123456789012345678901]}'
+    assert loads(text) == json.loads(text)
+    assert loads('{"id": "12345678901234567890"}') == {"id": "12345678901234567890"}
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_fallback(backend):
+    dumps = get_backend(backend).dumps
+    assert json.loads(dumps({1: "a", "b": (1, 2)})) == {"1": "a", "b": [1, 2]}
+    assert json.loads(dumps({"x": 2 ** 70})) == {"x": 2 ** 70}
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_invalid_json(backend):
+    with pytest.raises(ValueError):
+        get_backend(backend).loads('{"a": ')
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("selective", [False, True])
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_class_backend_load(tmp_path, backend, selective, memory_map):
+    class D(C):
+        __json_backend__ = backend
+    
+    path = tmp_path / "x.json"
+    path.write_text(FIXTURES[0], encoding="utf-8")
+    d = D.load(path, "utf-8", selective=selective, memory_map=memory_map)
+    assert d.a == 1 and d.d == "e"
+    assert D.loads(FIXTURES[0].encode(), selective=selective).json == d.json
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_class_backend_dump(tmp_path, backend):
+    @ej.jsonclass(backend=backend)
+    class D:
+        __json_template__ = {"a": Attr()}
+    
+    js = {"a": "café \U0001f600", "b": [1, None]}
+    path = tmp_path / "x.json"
+    D(js).dump(path, encoding="ascii")
+    assert D.load(path, encoding="ascii").json == js
+    D.iter_dump(path, [D(js), D(js)], encoding="ascii")
+    assert [d.json for d in D.iter_load(path, encoding="ascii")] == [js, js]
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_loader_backend(tmp_path, backend):
+    path = tmp_path / "x.json"
+    path.write_text(FIXTURES[0])
+    load = ej.create_loader(C.__json_template__, backend=backend)
+    assert load(path).json == json.loads(FIXTURES[0])
+
+def test_set_backend(default_backend):
+    calls = []
+    
+    def loads(s):
+        calls.append(s)
+        return json.loads(s)
+    
+    ej.register_backend("counting", loads, json.dumps)
+    assert "counting" in ej.available_backends()
+    ej.set_backend("counting")
+    C.loads('{"a": 1}')
+    assert calls == ['{"a": 1}']
+    
+    class D(C):
+        __json_backend__ = "json"
+    
+    D.loads('{"a": 1}')
+    assert len(calls) == 1
+
+@pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+def test_mmap_buffer_backend(tmp_path, default_backend, encoding):
+    types = []
+
+    def loads(s):
+        types.append(type(s))
+        return json.loads(bytes(s) if isinstance(s, memoryview) else s)
+
+    ej.register_backend("buffer", loads, json.dumps, buffer=True)
+    ej.set_backend("buffer")
+    path = tmp_path / "x.json"
+    path.write_text(FIXTURES[0], encoding=encoding)
+    assert C.load(path, encoding, memory_map=True).json == json.loads(FIXTURES[0])
+    assert types == [memoryview if encoding == "utf-8" else str]
+
+def test_unknown_backend(default_backend):
+    with pytest.raises(ValueError):
+        ej.set_backend("not-a-backend")
+    with pytest.raises(ValueError):
+        ej.register_backend("auto", json.loads, json.dumps)
+
+def test_auto_backend():
+    expected = "orjson" if "orjson" in BACKENDS else "ujson" if "ujson" in BACKENDS else "json"
+    assert get_backend("auto").name == expected
+
+def test_pickle_backend():
+    backend = get_backend("json")
+    assert pickle.loads(pickle.dumps(backend)) is backend
+    cls = create_constructor({"a": Attr()}, backend="json")
+    assert pickle.loads(pickle.dumps(cls)).__json_backend__ == "json"
@@ -0,0 +1,74 @@
+import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+import elegant_json as ej
+from elegant_json import JsonClass, Attr, LoadManyError
+
+class C(JsonClass):
+    __json_template__ = {"id": Attr(), "data": {"name": Attr()}}
+    id: int
+    name: str
+
+def _write_files(tmp_path, n):
+    paths = []
+    for i in range(n):
+        path = tmp_path / f"{i}.json"
+        path.write_text(json.dumps({"id": i, "data": {"name": f"n{i}", "x": [1]}}))
+        paths.append(path)
+    return paths
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+@pytest.mark.parametrize("selective", [False, True])
+def test_load_many(tmp_path, executor, selective):
+    paths = _write_files(tmp_path, 20)
+    out = C.load_many(paths, workers=2, executor=executor, selective=selective)
+    assert all(type(c) is C for c in out)
+    assert [c.id for c in out] == list(range(20))
+    assert [c.name for c in out] == [f"n{i}" for i in range(20)]
+
+def test_load_many_with_executor(tmp_path):
+    paths = _write_files(tmp_path, 5)
+    with ThreadPoolExecutor(2) as pool:
+        out = C.load_many(paths, executor=pool)
+    assert [c.id for c in out] == list(range(5))
+
+def test_errors_are_collected(tmp_path):
+    paths = _write_files(tmp_path, 4)
+    paths[1].write_text("{")
+    paths[3].write_text("[1, 2]")
+    missing = tmp_path / "missing.json"
+    paths.append(missing)
+    with pytest.raises(LoadManyError) as e:
+        C.load_many(paths, workers=2, executor="thread")
+    err = e.value
+    assert [c and c.id for c in err.results] == [0, None, 2, None, None]
+    assert set(err.errors) == {paths[1], paths[3], missing}
+    assert isinstance(err.errors[paths[1]], json.JSONDecodeError)
+    assert isinstance(err.errors[paths[3]], TypeError)
+    assert isinstance(err.errors[missing], FileNotFoundError)
+
+def test_wrong_executor(tmp_path):
+    with pytest.raises(ValueError):
+        C.load_many([], executor="xxx")  # type: ignore
+
+def test_pickle_constructor():
+    cls = ej.create_constructor({"a": Attr(), "b": {"c": Attr()}}, mutable=True)
+    assert pickle.loads(pickle.dumps(cls)) is cls
+    obj = cls({"a": 1, "b": {"c": 2}})
+    obj2 = pickle.loads(pickle.dumps(obj))
+    assert type(obj2) is cls
+    assert obj2.json == obj.json
+
+def _use_constructor(cls):
+    obj = cls({"a": 10, "b": {"c": 20}})
+    obj.a = 11
+    return obj, cls.__name__
+
+def test_constructor_in_worker_process():
+    cls = ej.create_constructor({"a": Attr(), "b": {"c": Attr()}}, mutable=True)
+    with ProcessPoolExecutor(1) as pool:
+        obj, name = pool.submit(_use_constructor, cls).result()
+    assert name == cls.__name__
+    assert type(obj) is cls
+    assert (obj.a, obj.c) == (11, 20)
@@ -0,0 +1,166 @@
+import json
+import random
+import pytest
+from elegant_json import JsonClass, Attr
+from elegant_json._json_binary import _packb_py, _unpackb_py
+
+
+class C(JsonClass):
+    __json_template__ = {
+        "a": Attr(),
+        "b": {"c": Attr(), "d": [Attr("e"), Attr("f")]},
+        "version": 1,
+    }
+    a: int
+
+
+class Other(JsonClass):
+    __json_template__ = {"a": Attr(), "b": {"c": Attr(), "d": [Attr("e"), Attr("f")]}}
+
+
+JSONS = [
+    {"a": 1, "b": {"c": "x", "d": [1.5, None]}, "version": 1},
+    {"a": 1, "b": {"c": "x", "d": [1.5, None]}, "version": 2, "extra": [1, {"z": 0}]},
+    {"b": {"c": "x", "d": [1.5, None]}, "version": 1},
+    {"a": 1, "b": {"d": [1.5]}},
+    {"a": [1, 2, {"q": -3}], "b": 5},
+    {},
+]
+
+
+@pytest.mark.parametrize("js", JSONS)
+def test_roundtrip(js):
+    data = C(js).dumps_binary()
+    assert isinstance(data, bytes)
+    assert C.loads_binary(data).json == js
+
+
+@pytest.mark.parametrize("version", [1.0, True])
+def test_constant_type_kept(version):
+    js = {"b": {"c": "x", "d": [1.5, None]}, "version": version}
+    out = C.loads_binary(C(js).dumps_binary()).json
+    assert json.dumps(out, sort_keys=True) == json.dumps(js, sort_keys=True)
+
+
+class Seq(JsonClass):
+    __json_template__ = {"s": [Attr("x")], "n": Attr()}
+
+
+def _random_value(rng: random.Random, depth: int = 0):
+    kind = rng.randrange(8 if depth < 3 else 6)
+    if kind == 0:
+        return rng.choice([0, 1, -1, 2**70])
+    elif kind == 1:
+        return rng.choice([0.0, 1.0, -2.5])
+    elif kind == 2:
+        return rng.choice([True, False, None])
+    elif kind == 3:
+        return rng.choice(["", "abc", "x"])
+    elif kind == 4:
+        return rng.choice(["c", "d", "e", 1, "version"])
+    elif kind == 5:
+        return []
+    elif kind == 6:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    keys = rng.sample(["a", "b", "c", "d", "s", "n", "x", "version"], rng.randrange(5))
+    return {k: _random_value(rng, depth + 1) for k in keys}
+
+
+def _like_template(rng: random.Random, template):
+    """Make a document similar to the template, with missing keys and wrong types."""
+    if rng.random() < 0.2:
+        return _random_value(rng, 1)
+    if isinstance(template, dict):
+        keys = [k for k in template if rng.random() < 0.8]
+        if rng.random() < 0.3:
+            rng.shuffle(keys)
+        if rng.random() < 0.2:
+            keys.append("extra")
+        return {k: _like_template(rng, template.get(k)) for k in keys}
+    if isinstance(template, list):
+        n = rng.randrange(len(template) + 2)
+        return [_like_template(rng, template[i] if i < len(template) else None)
+                for i in range(n)]
+    return template if rng.random() < 0.5 else _random_value(rng, 1)
+
+
+# union of the templates of C and Seq
+_FUZZ_TEMPLATE = {"a": 0, "b": {"c": 0, "d": [0, 0]}, "version": 1, "s": [0], "n": 0}
+
+
+@pytest.mark.parametrize("cls", [C, Seq])
+def test_fuzz_roundtrip(cls):
+    rng = random.Random(0)
+    for _ in range(2000):
+        js = _like_template(rng, _FUZZ_TEMPLATE)
+        if not isinstance(js, dict):
+            continue
+        out = cls.loads_binary(cls(js).dumps_binary()).json
+        assert json.dumps(out) == json.dumps(js), js
+
+
+def test_type_mismatch():
+    js = {"s": "abc"}
+    assert Seq.loads_binary(Seq(js).dumps_binary()).json == js
+    js = {"n": 1, "s": ["y", 2]}
+    assert list(Seq.loads_binary(Seq(js).dumps_binary()).json) == ["n", "s"]
+
+
+def test_smaller_than_json():
+    c = C({"a": 10, "b": {"c": "name", "d": [0.5, 1]}, "version": 1})
+    assert len(c.dumps_binary()) < len(json.dumps(c.json))
+
+
+def test_key_order_of_template():
+    js = {"a": 1, "b": {"c": "x", "d": [1.5, None]}, "version": 1}
+    out = C.loads_binary(C(js).dumps_binary()).json
+    assert list(out) == ["a", "b", "version"]
+    assert list(out["b"]) == ["c", "d"]
+
+
+def test_file(tmp_path):
+    path = tmp_path / "x.bin"
+    C(JSONS[1]).dump_binary(path)
+    assert C.load_binary(path).json == JSONS[1]
+
+
+def test_many():
+    data = C.dumps_binary_many([C(js) for js in JSONS])
+    out = C.loads_binary_many(data)
+    assert all(isinstance(c, C) for c in out)
+    assert [c.json for c in out] == JSONS
+    assert C.loads_binary_many(C.dumps_binary_many([])) == []
+
+
+def test_errors():
+    data = C(JSONS[0]).dumps_binary()
+    with pytest.raises(ValueError):
+        Other.loads_binary(data)
+    with pytest.raises(ValueError):
+        C.loads_binary_many(data)
+    with pytest.raises(ValueError):
+        C.loads_binary(b"xxx")
+    with pytest.raises(TypeError):
+        C({"a": object()}).dumps_binary()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        0, 127, 128, 255, 256, 65535, 65536, 2**32 - 1, 2**32, 2**64 - 1, 2**64,
+        -1, -32, -33, -128, -129, -32768, -32769, -2**31, -2**31 - 1, -2**63,
+        -2**63 - 1, 10**30, 10**300, -10**4000, 0.5, -1e300, float("inf"), True, False, None,
+        "", "a" * 31, "a" * 32, "b" * 255, "c" * 256, "d" * 65536, "日本語", "\ud800",
+        [], list(range(15)), list(range(16)), list(range(70000)),
+        {}, {str(i): i for i in range(15)}, {str(i): i for i in range(16)},
+        {str(i): i for i in range(70000)}, {"nested": [{"x": [None]}]},
+    ],
+)
+def test_pack_values(value):
+    assert _unpackb_py(_packb_py(value)) == value
+
+
+def test_msgpack_format():
+    assert _packb_py({"a": [1, -1, None, True]}) == b"\x81\xa1a\x94\x01\xff\xc0\xc3"
+    assert _packb_py(1.0) == bytes.fromhex("cb3ff0000000000000")
+    assert _packb_py(300) == bytes.fromhex("cd012c")
@@ -0,0 +1,141 @@
+import pytest
+from elegant_json import JsonClass, Attr, create_constructor
+
+
+def _make_class(cache_in_class: bool):
+    class D(JsonClass):
+        __json_template__ = {"x": Attr()}
+        __json_mutable__ = True
+        x: int
+
+    if cache_in_class:
+        class C(JsonClass):
+            __json_template__ = {
+                "data": Attr(),
+                "sub": {"values": Attr(), "d": Attr()},
+            }
+            __json_mutable__ = True
+            __json_cache__ = True
+            data: dict
+            values: list[int]
+            d: D
+    else:
+        class C(JsonClass):
+            __json_template__ = {
+                "data": Attr(cache=True),
+                "sub": {"values": Attr(cache=True), "d": Attr(cache=True)},
+            }
+            __json_mutable__ = True
+            data: dict
+            values: list[int]
+            d: D
+    return C
+
+
+@pytest.mark.parametrize("cache_in_class", [True, False])
+def test_cached_value_is_reused(cache_in_class):
+    C = _make_class(cache_in_class)
+    c = C({"data": {}, "sub": {"values": ["1", "2"], "d": {"x": 1}}})
+    assert c.values == [1, 2]
+    assert c.values is c.values
+    assert c.d is c.d
+
+
+@pytest.mark.parametrize("cache_in_class", [True, False])
+def test_invalidate_on_write(cache_in_class):
+    C = _make_class(cache_in_class)
+    c = C({"data": {}, "sub": {"values": ["1", "2"], "d": {"x": 1}}})
+    assert c.values == [1, 2]
+    c.values = [3]
+    assert c.values == [3]
+    
+    # writing to the nested object updates the shared dict
+    c.d.x = 10
+    assert c.d.x == 10
+
+
+def test_invalidate_parent_and_child():
+    class C(JsonClass):
+        __json_template__ = {
+            "a": Attr(),
+            "b": Attr(),
+        }
+        __json_mutable__ = True
+        __json_cache__ = True
+        a: dict[str, int]
+        b: list[int]
+
+    c = C({"a": {"x": "1"}, "b": [1]})
+    assert c.a == {"x": 1}
+    c.a = {"x": "2"}
+    assert c.a == {"x": 2}
+    assert c.b == [1]
+
+
+def test_invalidate_overlapping_paths():
+    from elegant_json._json_attribute import _invalidate_cache
+    cache = {("a",): 0, ("a", "b"): 1, ("a", "c"): 2, ("d",): 3}
+    _invalidate_cache(cache, ("a", "b"))
+    assert cache == {("a", "c"): 2, ("d",): 3}
+    _invalidate_cache(cache, ("a",))
+    assert cache == {("d",): 3}
+
+
+def test_clear_cache():
+    C = _make_class(True)
+    c = C({"data": {}, "sub": {"values": ["1", "2"], "d": {"x": 1}}})
+    assert c.values == [1, 2]
+    c.json["sub"]["values"] = [5]
+    assert c.values == [1, 2]
+    c.clear_cache()
+    assert c.values == [5]
+
+
+def test_attr_overrides_class_cache():
+    class C(JsonClass):
+        __json_template__ = {"a": Attr(cache=False), "b": Attr()}
+        __json_cache__ = True
+        a: list[int]
+        b: list[int]
+    
+    c = C({"a": [1], "b": [2]})
+    assert c.a is not c.a
+    assert c.b is c.b
+
+
+def test_constructor_cache():
+    cls = create_constructor({"a": Attr()}, cache=True)
+    c = cls({"a": [1]})
+    assert c.a is c.a  # type: ignore
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+@pytest.mark.parametrize("cache", [False, True])
+def test_custom_init(codegen, cache):
+    class D(JsonClass):
+        __json_template__ = {"x": Attr()}
+        __json_mutable__ = True
+
+    class C(JsonClass):
+        __json_template__ = {"a": Attr(), "sub": {"d": Attr()}}
+        __json_mutable__ = True
+        __json_cache__ = cache
+        __json_codegen__ = codegen
+        a: int
+        d: D
+
+        def __init__(self, a: int):
+            self._json = {"a": a, "sub": {"d": {"x": 0}}}
+
+    c = C(1)
+    assert c.a == 1
+    c.a = 2
+    assert c.a == 2
+    c.d.x = 3
+    assert c.json == {"a": 2, "sub": {"d": {"x": 3}}}
+    assert c.json_patch() == [
+        {"op": "replace", "path": "/a", "value": 2},
+        {"op": "replace", "path": "/sub/d/x", "value": 3},
+    ]
+    c.clear_changes()
+    assert c.json_patch() == []
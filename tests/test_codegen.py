@@ -0,0 +1,85 @@
+import pytest
+import elegant_json as ej
+from elegant_json import JsonClass, Attr
+
+class D(JsonClass):
+    __json_template__ = {"x": Attr()}
+    __json_codegen__ = True
+    x: int
+
+@pytest.mark.parametrize("codegen", [False, True])
+@pytest.mark.parametrize("cache", [False, True])
+def test_same_semantics(codegen, cache):
+    class C(JsonClass):
+        __json_template__ = {
+            "a": Attr(),
+            "b": {"c": [0, Attr("c1", default=-1)]},
+            "d": Attr(mutable=False),
+            "e": Attr(),
+            "f": Attr(default="F"),
+        }
+        __json_mutable__ = True
+        __json_codegen__ = codegen
+        __json_cache__ = cache
+        a: int
+        c1: list[str]
+        d: D
+        e: dict[str, float]
+    
+    c = C({"a": "1", "b": {"c": [0, [1, 2]]}, "d": {"x": "3"}, "e": {"k": 1}})
+    assert c.a == 1
+    assert c.c1 == ["1", "2"]
+    assert c.d.x == 3
+    assert c.d is c.d
+    assert c.e == {"k": 1.0}
+    assert c.f == "F"
+    
+    c.a = "5"
+    c.c1 = [3]
+    assert c.a == 5
+    assert c.c1 == ["3"]
+    assert c.json["b"] == {"c": [0, [3]]}
+    with pytest.raises(AttributeError):
+        c.d = {}
+    
+    c.json["b"]["c"] = []
+    c.clear_cache()
+    assert c.c1 == -1
+    c.f = "G"
+    assert c.f == "G"
+    
+    c = C({})
+    assert c.a is None
+    with pytest.raises(KeyError):
+        c.c1 = 0
+
+def test_generated_function():
+    class C(JsonClass):
+        __json_template__ = {"data": {"values": Attr()}}
+        __json_codegen__ = True
+        __json_mutable__ = True
+    
+    prop = C.__dict__["values"]
+    assert prop.fget.__name__ == "values"
+    assert prop.keys() == ["data", "values"]
+
+def test_codegen_constructor():
+    cls = ej.create_constructor({"a": {"b": Attr()}}, codegen=True, mutable=True)
+    obj = cls({"a": {"b": 1}})
+    obj.b = 2  # type: ignore
+    assert obj.json == {"a": {"b": 2}}
+
+@pytest.mark.parametrize("cache", [False, True])
+@pytest.mark.parametrize("name", ["path", "conv", "attr", "fget", "from", "class"])
+def test_any_attribute_name(cache, name):
+    cls = ej.create_constructor(
+        {"a": {name: Attr(default=0)}}, codegen=True, mutable=True, cache=cache
+    )
+    obj = cls({"a": {name: 1}})
+    assert getattr(obj, name) == 1
+    setattr(obj, name, 2)
+    assert getattr(obj, name) == 2
+    assert obj.json == {"a": {name: 2}}
+    assert getattr(cls({}), name) == 0
+    prop = cls.__dict__[name]
+    assert prop.fget.__name__ == prop.fset.__name__ == name
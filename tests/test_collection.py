@@ -0,0 +1,124 @@
+import pytest
+from elegant_json import JsonClass, JsonCollection, Attr
+
+
+class C(JsonClass):
+    __json_template__ = {
+        "title": Attr(),
+        "meta": Attr(),
+        "info": {"year": Attr(), "tags": Attr()},
+    }
+    __json_mutable__ = True
+    title: str
+    year: int
+    tags: list[str]
+
+
+def _docs(n: int = 10):
+    return [
+        C({"title": f"t{i % 3}", "meta": {}, "info": {"year": 2000 + i, "tags": []}})
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def docs():
+    return JsonCollection(C, _docs())
+
+
+@pytest.mark.parametrize("kind", ["hash", "sorted", None])
+def test_find(docs: JsonCollection, kind):
+    if kind is not None:
+        docs.create_index("title", kind)
+    found = docs.find("title", "t1")
+    assert [d.year for d in found] == [2001, 2004, 2007]
+    assert docs.find("title", "xx") == []
+
+
+def test_find_range(docs: JsonCollection):
+    docs.create_index("year", "sorted")
+    assert [d.year for d in docs.find_range("year", 2003, 2005)] == [2003, 2004, 2005]
+    out = docs.find_range("year", 2003, 2005, include_lower=False, include_upper=False)
+    assert [d.year for d in out] == [2004]
+    assert [d.year for d in docs.find_range("year", upper=2001)] == [2000, 2001]
+    assert [d.year for d in docs.find_range("year", 2008)] == [2008, 2009]
+    assert docs.find_range("year", 2100) == []
+    with pytest.raises(ValueError):
+        docs.find_range("title", "a", "b")
+
+
+def test_set_updates_indexes(docs: JsonCollection):
+    docs.create_index("title")
+    docs.create_index("year", "sorted")
+    d = docs[4]
+    docs.set(d, "title", "new")
+    docs.set(d, "year", 1990)
+    assert d.json["title"] == "new"
+    assert docs.find("title", "new") == [d]
+    assert d not in docs.find("title", "t1")
+    assert docs.find_range("year", upper=2000) == [d, docs[0]]
+    assert docs.find("year", 2004) == []
+
+
+def test_set_without_index(docs: JsonCollection):
+    docs.set(docs[0], "title", "x")
+    assert docs.find("title", "x") == [docs[0]]
+
+
+def test_set_not_in_collection(docs: JsonCollection):
+    with pytest.raises(ValueError):
+        docs.set(_docs(1)[0], "title", "x")
+
+
+def test_append(docs: JsonCollection):
+    docs.create_index("title")
+    docs.create_index("year", "sorted")
+    docs.append({"title": "t1", "meta": {}, "info": {"year": 1000, "tags": []}})
+    assert len(docs) == 11
+    new = docs[-1]
+    assert isinstance(new, C)
+    assert docs.find("title", "t1")[-1] is new
+    assert docs.find_range("year", upper=1500) == [new]
+    with pytest.raises(ValueError):
+        docs.append(new)
+    with pytest.raises(TypeError):
+        docs.append(1)
+
+
+def test_missing_values():
+    docs = JsonCollection(C, [{"title": "a"}, {"info": {"year": 1}}])
+    docs.create_index("title")
+    docs.create_index("year", "sorted")
+    assert docs.find("title", None) == [docs[1]]
+    assert docs.find_range("year") == [docs[1]]
+    assert docs.find("year", None) == [docs[0]]
+
+
+def test_none_in_sorted_index():
+    class R(JsonClass):
+        __json_template__ = {"rank": Attr()}
+        __json_mutable__ = True
+    
+    docs = JsonCollection(R, [{"rank": 1}, {"rank": None}, {}])
+    docs.create_index("rank", "sorted")
+    assert docs.find("rank", None) == [docs[1], docs[2]]
+    assert docs.find_range("rank") == [docs[0]]
+    docs.set(docs[0], "rank", None)
+    assert docs.find("rank", None) == [docs[0], docs[1], docs[2]]
+    assert docs.find_range("rank") == []
+    docs.set(docs[1], "rank", 2)
+    assert docs.find("rank", None) == [docs[0], docs[2]]
+    assert docs.find_range("rank", 2) == [docs[1]]
+
+
+def test_index_errors(docs: JsonCollection):
+    with pytest.raises(TypeError):
+        docs.create_index("tags")
+    with pytest.raises(ValueError):
+        docs.create_index("title", "btree")
+    with pytest.raises(ValueError):
+        docs.create_index("xxx")
+    docs.create_index("title")
+    assert docs.indexes == {"title": "hash"}
+    docs.drop_index("title")
+    assert docs.indexes == {}
@@ -0,0 +1,78 @@
+import pickle
+import pytest
+from elegant_json import Attr, create_constructor, create_loader
+from elegant_json import core
+from elegant_json._json_class import _iter_attrs
+
+def _template():
+    return {"a": Attr(), "b": {"c": Attr(default=[1]), "d": [Attr("e"), 1]}}
+
+def test_same_template_same_class():
+    cls = create_constructor(_template())
+    assert create_constructor(_template()) is cls
+    template = _template()
+    assert create_constructor(template) is cls
+    assert create_constructor(template) is cls  # Attr objects are named now
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"mutable": True}, {"cache": True}, {"slots": True}, {"codegen": True},
+     {"name": "X"}, {"backend": "json"}],
+)
+def test_flags_are_keys(kwargs):
+    assert create_constructor(_template(), **kwargs) is not create_constructor(_template())
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        {"a": Attr(), "b": {"c": Attr(default=[2]), "d": [Attr("e"), 1]}},
+        {"a": Attr(), "b": {"c": Attr(default=[1]), "d": [Attr("e"), True]}},
+        {"a": Attr(), "b": {"c": Attr(default=[1]), "d": (Attr("e"), 1)}},
+        {"a": Attr(mutable=False), "b": {"c": Attr(default=[1]), "d": [Attr("e"), 1]}},
+        {"a": Attr(annotation=int), "b": {"c": Attr(default=[1]), "d": [Attr("e"), 1]}},
+        {"b": {"c": Attr(default=[1]), "d": [Attr("e"), 1]}, "a": Attr()},
+    ],
+)
+def test_different_structure(other):
+    assert create_constructor(other) is not create_constructor(_template())
+
+def test_unhashable_template_not_cached():
+    cls0 = create_constructor({"a": Attr(), "s": bytearray(b"x")})
+    cls1 = create_constructor({"a": Attr(), "s": bytearray(b"x")})
+    assert cls0 is not cls1
+
+def test_lru_eviction(monkeypatch):
+    monkeypatch.setattr(core, "_CLASS_CACHE_SIZE", 2)
+    core._CLASS_CACHE.clear()
+    c0 = create_constructor({"x0": Attr()})
+    c1 = create_constructor({"x1": Attr()})
+    assert create_constructor({"x0": Attr()}) is c0  # x0 is the most recent now
+    create_constructor({"x2": Attr()})
+    assert len(core._CLASS_CACHE) == 2
+    assert create_constructor({"x0": Attr()}) is c0
+    assert create_constructor({"x1": Attr()}) is not c1
+
+def test_cached_class_pickle():
+    cls = create_constructor(_template())
+    obj = cls({"a": 1})
+    assert pickle.loads(pickle.dumps(obj)).a == 1
+    assert pickle.loads(pickle.dumps(cls)) is cls
+
+def test_loader_reuses_class(tmp_path):
+    path = tmp_path / "x.json"
+    path.write_text('{"a": 1}')
+    assert type(create_loader(_template())(path)) is type(create_loader(_template())(path))
+
+def test_iter_attrs_order():
+    template = {
+        "a": Attr(),
+        "b": {"c": [0, {"d": Attr()}, [Attr("e")]], "f": {}},
+        "g": [],
+        "h": Attr(),
+    }
+    assert [(attr.name, keys) for attr, keys in _iter_attrs(template)] == [
+        (None, ["a"]),
+        (None, ["b", "c", 1, "d"]),
+        ("e", ["b", "c", 2, 0]),
+        (None, ["h"]),
+    ]
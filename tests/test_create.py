@@ -0,0 +1,57 @@
+from elegant_json import JsonClass, Attr
+
+class C(JsonClass):
+    __json_template__ = {
+        "name": Attr(default="unnamed"),
+        "data": {"values": Attr(default=[0]), "fixed": [1, 2], "none": None},
+        "pair": (Attr("first"), {"x": Attr("x", default={"a": []})}),
+        "other": ...,
+    }
+
+def test_create_value():
+    c = C.create(1)
+    assert c.json == {
+        "name": 1,
+        "data": {"values": 1, "fixed": [1, 2], "none": None},
+        "pair": (1, {"x": 1}),
+        "other": ...,
+    }
+    assert C.create().json["name"] is None
+
+def test_create_new_containers():
+    c0, c1 = C.create(), C.create()
+    assert c0.json == c1.json
+    assert c0.json["data"] is not c1.json["data"]
+    assert c0.json["data"]["fixed"] is not c1.json["data"]["fixed"]
+    assert c0.json["data"]["fixed"] is not C.__json_template__["data"]["fixed"]
+
+def test_create_use_default():
+    c = C.create(use_default=True)
+    assert c.json["name"] == "unnamed"
+    assert c.json["data"]["values"] == [0]
+    assert c.json["pair"] == (None, {"x": {"a": []}})
+    c.json["data"]["values"].append(1)
+    assert C.create(use_default=True).json["data"]["values"] == [0]
+
+def test_create_many():
+    objs = C.create_many(3, use_default=True)
+    assert len(objs) == 3 and all(type(c) is C for c in objs)
+    assert objs[0].json == C.create(use_default=True).json
+    assert objs[0].json["pair"][1]["x"] is not objs[1].json["pair"][1]["x"]
+    assert [c.name for c in C.create_many(2, "v")] == ["v", "v"]
+    assert C.create_many(0) == []
+
+def test_create_subclass():
+    class D(C):
+        pass
+    
+    d = D.create(use_default=True)
+    assert type(d) is D and d.name == "unnamed"
+
+def test_create_other_default_copied():
+    class D(JsonClass):
+        __json_template__ = {"a": Attr(default=bytearray(b"x")), "b": Attr(default=1.5)}
+    
+    d0, d1 = D.create_many(2, use_default=True)
+    assert d0.json == {"a": bytearray(b"x"), "b": 1.5}
+    assert d0.json["a"] is not d1.json["a"]
@@ -0,0 +1,125 @@
+import copy
+import pytest
+from elegant_json import JsonClass, Attr, diff
+
+class C(JsonClass):
+    __json_template__ = {
+        "name": Attr(),
+        "data": {"value": Attr(), "nested": {"deep": Attr()}},
+        "items": [Attr("first"), Attr("second")],
+    }
+    __json_mutable__ = True
+
+def _apply(doc, patch):
+    doc = copy.deepcopy(doc)
+    for op in patch:
+        *parents, last = [
+            p.replace("~1", "/").replace("~0", "~") for p in op["path"].split("/")[1:]
+        ]
+        target = doc
+        for k in parents:
+            target = target[int(k) if isinstance(target, list) else k]
+        if isinstance(target, list):
+            last = int(last)
+        if op["op"] == "remove":
+            del target[last]
+        elif op["op"] == "add" and isinstance(target, list):
+            if last > len(target):
+                raise IndexError(op["path"])
+            target.insert(last, op["value"])
+        else:
+            target[last] = op["value"]
+    return doc
+
+def test_recorded_add_and_replace(cls):
+    c = cls({"name": "a", "data": {"nested": {}}, "items": [0, 1]})
+    c.value = 1
+    c.name = "b"
+    c.deep = 2
+    c.second = 3
+    c.value = 4
+    assert c.json_patch() == [
+        {"op": "replace", "path": "/name", "value": "b"},
+        {"op": "add", "path": "/data/nested/deep", "value": 2},
+        {"op": "replace", "path": "/items/1", "value": 3},
+        {"op": "add", "path": "/data/value", "value": 4},
+    ]
+    c.clear_changes()
+    assert c.json_patch() == []
+    c.value = 5
+    assert c.json_patch() == [{"op": "replace", "path": "/data/value", "value": 5}]
+
+def test_recorded_patch_applies(cls):
+    original = {"name": "a", "data": {"nested": {"deep": 0}}, "items": [0, 1]}
+    c = cls(copy.deepcopy(original))
+    c.value = [1, 2]
+    c.deep = None
+    c.first = "x"
+    assert _apply(original, c.json_patch()) == c.json
+
+def test_diff_equal(cls):
+    js = {"name": "a", "data": {"value": 1, "nested": {"deep": 2}}, "items": [0, 1]}
+    assert diff(cls(js), cls(copy.deepcopy(js))) == []
+
+def test_diff_ignores_other_keys(cls):
+    a = cls({"name": "a", "other": [1, 2, 3]})
+    b = cls({"name": "a", "other": {"x": 0}, "data": {"other": 1}})
+    assert diff(a, b) == []
+
+def test_diff_operations(cls):
+    a = cls({"name": "a", "data": {"value": 1}, "items": [0, 1]})
+    b = cls({"name": "b", "data": {"value": 1.0, "nested": {"deep": 3}}, "items": [0]})
+    assert diff(a, b) == [
+        {"op": "replace", "path": "/name", "value": "b"},
+        {"op": "replace", "path": "/data/value", "value": 1.0},
+        {"op": "add", "path": "/data/nested", "value": {}},
+        {"op": "add", "path": "/data/nested/deep", "value": 3},
+        {"op": "remove", "path": "/items/1"},
+    ]
+
+@pytest.mark.parametrize(
+    "ja, jb",
+    [
+        ({}, {"name": 1, "data": {"value": 2, "nested": {"deep": 3}}}),
+        ({"data": 0}, {"data": {"nested": {"deep": True}}}),
+        ({"name": True, "data": {"value": [1]}}, {"name": 1, "data": {"value": [2]}}),
+        ({"items": [0, 1]}, {"items": []}),
+        ({}, {"items": [0, 1]}),
+        ({"items": [0]}, {"items": [0, {"x": 1}]}),
+        ({"items": [0, 1]}, {"items": [{"a": 1}, 1]}),
+    ],
+)
+def test_diff_applies(cls, ja, jb):
+    a, b = cls(ja), cls(jb)
+    patched = cls(_apply(a.json, diff(a, b)))
+    assert diff(patched, b) == []
+    assert patched.attr_asdict() == b.attr_asdict()
+
+class Gap(JsonClass):
+    __json_template__ = {"d": [0, Attr("d1")], "e": [{"f": Attr("f")}]}
+
+@pytest.mark.parametrize(
+    "ja, jb",
+    [
+        ({"d": []}, {"d": [0, 5]}),
+        ({}, {"d": [0, 5], "e": [{"f": 1}]}),
+        ({"e": []}, {"e": [{"f": 1}]}),
+        ({"d": [0, 1], "e": [{"f": 1}]}, {"d": [0], "e": []}),
+    ],
+)
+def test_diff_missing_list_items(ja, jb):
+    a, b = Gap(ja), Gap(jb)
+    patched = Gap(_apply(a.json, diff(a, b)))
+    assert diff(patched, b) == []
+    assert patched.attr_asdict() == b.attr_asdict()
+
+def test_diff_whole_list():
+    assert diff(Gap({"d": []}), Gap({"d": [0, 5]})) == [
+        {"op": "replace", "path": "/d", "value": [0, 5]}
+    ]
+
+def test_diff_type_error():
+    with pytest.raises(TypeError):
+        diff(C({}), Gap({}))
+    with pytest.raises(TypeError):
+        diff({}, C({}))
@@ -0,0 +1,69 @@
+import pytest
+from elegant_json import JsonClass, Attr
+
+class C(JsonClass):
+    __json_template__ = {
+        "title": Attr(),
+        "data": {"id": Attr(), "score": Attr(), "ok": Attr(), "values": Attr()},
+        "rest": [Attr("first", default=-1)],
+    }
+    title: str
+    id: int
+    score: float
+    ok: bool
+    values: list[int]
+    first: int
+
+DATA = [
+    {
+        "title": f"t{i}",
+        "data": {"id": str(i), "score": i / 2, "ok": i % 2 == 0, "values": [i, "1"]},
+        "rest": [i * 10],
+    }
+    for i in range(5)
+]
+
+def test_extract_lists():
+    cols = C.extract(DATA, asarray=False)
+    assert list(cols) == ["title", "id", "score", "ok", "values", "first"]
+    assert cols["title"] == ["t0", "t1", "t2", "t3", "t4"]
+    assert cols["id"] == [0, 1, 2, 3, 4]
+    assert cols["values"] == [[i, 1] for i in range(5)]
+    assert cols["first"] == [0, 10, 20, 30, 40]
+
+def test_extract_fields_and_instances():
+    objs = [C(d) for d in DATA]
+    cols = C.extract(objs[:2] + DATA[2:], fields=["values", "title"], asarray=False)
+    assert list(cols) == ["values", "title"]
+    assert cols["title"] == [c.title for c in objs]
+    assert cols["values"] == [c.values for c in objs]
+
+def test_extract_missing_values():
+    cols = C.extract([{"title": "x"}, {"rest": []}], fields=["title", "first"], asarray=False)
+    assert cols == {"title": ["x", None], "first": [-1, -1]}
+
+def test_extract_empty():
+    assert C.extract([], fields=["title", "id"], asarray=False) == {"title": [], "id": []}
+
+def test_unknown_field():
+    with pytest.raises(ValueError):
+        C.extract(DATA, fields=["title", "xxx"])
+    with pytest.raises(ValueError):
+        C.extract(DATA, fields=["title", "title"])
+
+def test_extract_arrays():
+    np = pytest.importorskip("numpy")
+    cols = C.extract(DATA)
+    assert cols["id"].dtype == np.int64
+    assert cols["score"].dtype == np.float64
+    assert cols["ok"].dtype == np.bool_
+    np.testing.assert_array_equal(cols["id"], [0, 1, 2, 3, 4])
+    np.testing.assert_array_equal(cols["score"], [0, 0.5, 1, 1.5, 2])
+    np.testing.assert_array_equal(cols["ok"], [True, False, True, False, True])
+    assert isinstance(cols["title"], list)
+    
+    cols = C.extract(DATA + [{"rest": []}], fields=["id", "first"])
+    assert cols["id"].dtype == object
+    assert cols["id"].tolist() == [0, 1, 2, 3, 4, None]
+    assert cols["first"].tolist() == [0, 10, 20, 30, 40, -1]
+    assert C.extract([], fields=["id"])["id"].shape == (0,)
@@ -1,3 +1,4 @@
+import pytest
 import elegant_json as ej
 
 def test_isformatted():
@@ -41,4 +42,50 @@ def test_isformatted():
             "x": 0,
             "z": 0,
         }
-    }, C)
\ No newline at end of file
+    }, C)
+
+class D(ej.JsonClass):
+    __json_template__ = {
+        "a": ej.Attr(),
+        "b": {
+            "x": ej.Attr(),
+            "y": {"p": ej.Attr(), "q": ej.Attr()},
+        },
+        "c": [0, ej.Attr("c1")],
+    }
+
+
+def test_isformatted_wrong_nested_type():
+    assert not ej.isformatted({"a": 0, "b": 1, "c": [0, 1]}, D)
+    assert not ej.isformatted({"a": 0, "b": {"x": 0, "y": []}, "c": [0, 1]}, D)
+    assert not ej.isformatted({"a": 0, "b": {"x": 0, "y": {"p": 0, "q": 0}}, "c": [0]}, D)
+    assert ej.isformatted({"a": 0, "b": {"x": 0, "y": {"p": 0, "q": 0}}, "c": [0, 1]}, D)
+
+
+def test_isformatted_many():
+    objs = [
+        {"a": 0, "b": {"x": 0, "y": {"p": 0, "q": 0}}, "c": [0, 1]},
+        {"b": {"x": 0, "y": {"p": 0}}, "c": [0, 1]},
+        {"a": 0, "b": {"x": 0, "y": 1}, "c": {}},
+        [],
+    ]
+    assert ej.isformatted_many(objs, D) == [True, False, False, False]
+    assert ej.isformatted_many(iter(objs), D, return_paths=True) == [
+        [],
+        [("a",), ("b", "y", "q")],
+        [("b", "y", "p"), ("b", "y", "q"), ("c", 1)],
+        [()],
+    ]
+
+
+def test_isformatted_many_edge_cases():
+    class E(ej.JsonClass):
+        __json_template__ = {
+            "a": ej.Attr(),
+            "b": ej.Attr(),
+        }
+    
+    assert ej.isformatted_many([{"a": 0, "b": 0}, {"a": 0}], E) == [True, False]
+    assert ej.isformatted_many([{}], ej.JsonClass) == [True]
+    with pytest.raises(TypeError):
+        ej.isformatted_many([{}], dict)  # type: ignore
@@ -0,0 +1,168 @@
+import json
+import os
+import pytest
+from elegant_json import JsonClass, Attr
+
+class Sub(JsonClass):
+    __json_template__ = {"x": Attr()}
+    __json_mutable__ = True
+    x: int
+
+class C(JsonClass):
+    __json_template__ = {
+        "title": Attr(),
+        "data": {"value": Attr(), "sub": Attr()},
+        "items": [Attr("first"), Attr("second")],
+        "a/b~c": Attr("escaped"),
+    }
+    __json_mutable__ = True
+    title: str
+    value: int
+    sub: Sub
+    first: int
+    second: int
+
+TEXT = """{
+    "title": "Title",
+    "data": {"value": 10, "sub": {"x": 1}, "other": [1, 2, {"value": 0}]},
+    "items": [100, 200],
+    "a/b~c": null,
+    "extra": "keep   this"
+}
+"""
+
+@pytest.fixture
+def path(tmp_path):
+    p = tmp_path / "config.json"
+    p.write_text(TEXT, encoding="utf-8")
+    return p
+
+def test_json_patch(cls, path):
+    c = cls.load(path, "utf-8")
+    assert c.json_patch() == []
+    c.value = 20
+    c.title = "New"
+    c.value = 30
+    c.escaped = 1
+    assert c.json_patch() == [
+        {"op": "replace", "path": "/title", "value": "New"},
+        {"op": "replace", "path": "/data/value", "value": 30},
+        {"op": "replace", "path": "/a~1b~0c", "value": 1},
+    ]
+
+def test_json_patch_nested(cls, path):
+    c = cls.load(path, "utf-8")
+    c.sub.x = 5
+    assert c.json_patch() == [{"op": "replace", "path": "/data/sub/x", "value": 5}]
+    c.sub = {"x": 6}
+    assert c.json_patch() == [{"op": "replace", "path": "/data/sub", "value": {"x": 6}}]
+
+def test_dump_incremental_in_place(cls, path):
+    c = cls.load(path, "utf-8")
+    inode = os.stat(path).st_ino
+    c.value = 99
+    c.second = 201
+    c.dump_incremental(path, "utf-8")
+    assert path.read_text("utf-8") == (
+        TEXT.replace('"value": 10', '"value": 99').replace("200", "201")
+    )
+    assert os.stat(path).st_ino == inode
+    assert c.json_patch() == []
+
+def test_dump_incremental_resize(cls, path):
+    c = cls.load(path, "utf-8")
+    c.title = "A much longer title あ"
+    c.sub.x = 12345
+    c.first = 0
+    c.dump_incremental(path, "utf-8")
+    text = path.read_text("utf-8")
+    assert "keep   this" in text
+    assert json.loads(text) == c.json
+    assert not [p for p in os.listdir(path.parent) if p.endswith(".tmp")]
+
+def test_dump_incremental_ascii(cls, path):
+    c = cls.load(path, "ascii")
+    c.title = "café"
+    c.dump_incremental(path, "ascii")
+    assert json.loads(path.read_text("ascii")) == c.json
+
+def test_dump_incremental_fallback(cls, tmp_path):
+    path = tmp_path / "x.json"
+    path.write_text('{"title": "t", "data": {}}')
+    c = cls.load(path)
+    c.value = 1  # not in the file
+    c.dump_incremental(path)
+    assert json.loads(path.read_text()) == c.json
+    
+    new_path = tmp_path / "new.json"
+    c.dump_incremental(new_path)
+    assert json.loads(new_path.read_text()) == c.json
+
+def test_dump_clears_changes(cls, path, tmp_path):
+    c = cls.load(path, "utf-8")
+    c.value = 1
+    c.dump(tmp_path / "y.json")
+    assert c.json_patch() == []
+
+def test_nested_changes_in_write_order(cls, path):
+    c = cls.load(path, "utf-8")
+    c.title = "New"
+    c.sub.x = 5
+    c.value = 1
+    assert [op["path"] for op in c.json_patch()] == ["/title", "/data/sub/x", "/data/value"]
+
+@pytest.mark.parametrize("codegen", [False, True])
+@pytest.mark.parametrize("cache", [False, True])
+def test_nested_changes_tracked(tmp_path, codegen, cache):
+    class L(JsonClass):
+        __json_template__ = {"sub": Attr(), "subs": Attr()}
+        __json_mutable__ = True
+        __json_codegen__ = codegen
+        __json_cache__ = cache
+        sub: Sub
+        subs: list[Sub]
+    
+    path = tmp_path / "l.json"
+    path.write_text('{"sub": {"x": 1}, "subs": [{"x": 2}, {"x": 3}]}')
+    c = L.load(path)
+    sub = c.sub
+    c.subs[1].x = 30
+    c.clear_cache()
+    sub.x = 10  # held across clear_cache
+    c.clear_cache()
+    assert c.json_patch() == [
+        {"op": "replace", "path": "/subs/1/x", "value": 30},
+        {"op": "replace", "path": "/sub/x", "value": 10},
+    ]
+    c.dump_incremental(path)
+    assert json.loads(path.read_text()) == c.json
+    assert c.json_patch() == []
+    
+    # the old wrapper does not report after the dict is replaced
+    c.sub = {"x": 0}
+    c.clear_changes()
+    sub.x = 11
+    assert c.json_patch() == []
+
+def test_dump_incremental_other_file(cls, path, tmp_path):
+    dst = tmp_path / "dst.json"
+    dst.write_text('{"title": "t", "data": {"value": 9}, "other": "stale"}')
+    c = cls.load(path, "utf-8")
+    c.dump_incremental(dst, "utf-8")
+    assert json.loads(dst.read_text("utf-8")) == c.json
+    
+    dst.write_text('{"title": "t", "data": {"value": 9}, "other": "stale"}')
+    c.value = 5
+    c.dump_incremental(dst, "utf-8")
+    assert json.loads(dst.read_text("utf-8")) == c.json
+    # the file was dumped to, so it can be updated incrementally now
+    c.first = 7
+    c.dump_incremental(dst, "utf-8")
+    assert json.loads(dst.read_text("utf-8")) == c.json
+
+def test_dump_incremental_changed_file(cls, path):
+    c = cls.load(path, "utf-8")
+    path.write_text(TEXT.replace("keep   this", "changed"), encoding="utf-8")
+    c.value = 5
+    c.dump_incremental(path, "utf-8")
+    assert json.loads(path.read_text("utf-8")) == c.json
@@ -0,0 +1,129 @@
+import pytest
+from elegant_json import (
+    JsonClass, Attr, AccessEvent, AccessStats, instrument, uninstrument
+)
+
+
+class D(JsonClass):
+    __json_template__ = {"x": Attr()}
+    x: int
+
+
+class C(JsonClass):
+    __json_template__ = {
+        "a": Attr(),
+        "b": {"c": Attr(default=-1)},
+        "d": Attr(),
+        "e": Attr(cache=True),
+    }
+    __json_mutable__ = True
+    d: D
+    e: list[int]
+
+
+@pytest.fixture
+def cls(cls):
+    yield cls
+    uninstrument(cls)
+
+
+def _json():
+    return {"a": 1, "b": {}, "d": {"x": 0}, "e": [1, 2]}
+
+
+def test_events(cls):
+    events: list[AccessEvent] = []
+    instrument(cls, events.append)
+    c = cls(_json())
+    assert c.a == 1
+    assert c.c == -1
+    c.a = 2
+    assert [e[:3] for e in events] == [
+        (cls, "a", "get"), (cls, "c", "default"), (cls, "a", "set"),
+    ]
+    assert c.json["a"] == 2
+
+
+def test_stats(cls):
+    stats = AccessStats()
+    instrument(cls, stats)
+    c = cls(_json())
+    for _ in range(3):
+        c.a
+    c.c
+    c.a = 0
+    assert stats.get(cls, "a") == (3, 1, 0, stats.get(cls, "a").convert_time)
+    assert stats.get(cls, "c")[:3] == (1, 0, 1)
+    assert stats.get(cls, "e")[:3] == (0, 0, 0)
+    assert list(stats.report()) == [f"{cls.__qualname__}.a", f"{cls.__qualname__}.c"]
+    stats.clear()
+    assert stats.report() == {}
+
+
+def test_convert_time(cls):
+    events: list[AccessEvent] = []
+    instrument(cls, events.append)
+    c = cls(_json())
+    c.e
+    c.a
+    assert events[0].elapsed > 0
+    assert events[1].elapsed == 0
+
+
+def test_cache_semantics(cls):
+    events: list[AccessEvent] = []
+    instrument(cls, events.append)
+    c = cls(_json())
+    e = c.e
+    assert c.e is e
+    d = c.d
+    assert c.d is d
+    assert [ev.kind for ev in events] == ["get"] * 4
+    c.e = [3]
+    assert c.e == [3]
+
+
+def test_uninstrument(cls):
+    originals = {name: cls.__dict__[name] for name in cls._json_attr_names}
+    sink = AccessStats()
+    instrument(cls, sink)
+    instrument(cls, sink)  # re-instrument
+    assert all(cls.__dict__[name] is not prop for name, prop in originals.items())
+    uninstrument(cls)
+    assert {name: cls.__dict__[name] for name in cls._json_attr_names} == originals
+    c = cls(_json())
+    c.a
+    assert sink.report() == {}
+    uninstrument(cls)  # no error
+
+
+def test_inherited_properties():
+    class Sub(C):
+        pass
+
+    events: list[AccessEvent] = []
+    instrument(Sub, events.append)
+    Sub(_json()).a
+    C(_json()).a
+    assert [e.cls for e in events] == [Sub]
+    uninstrument(Sub)
+    assert "a" not in Sub.__dict__
+
+
+def test_instrumented_base():
+    class Sub(C):
+        pass
+
+    base_events: list[AccessEvent] = []
+    sub_events: list[AccessEvent] = []
+    instrument(C, base_events.append)
+    instrument(Sub, sub_events.append)
+    Sub(_json()).a = 3
+    assert len(base_events) == 0 and len(sub_events) == 1
+    uninstrument(C)
+    uninstrument(Sub)
+
+
+def test_not_json_class():
+    with pytest.raises(TypeError):
+        instrument(int, print)
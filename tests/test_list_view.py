@@ -0,0 +1,132 @@
+import pytest
+from elegant_json import JsonClass, JsonCollection, Attr, ListView, create_constructor, validate
+
+
+class D(JsonClass):
+    __json_template__ = {"name": Attr(), "value": Attr()}
+    __json_mutable__ = True
+    name: str
+    value: int
+
+
+class C(JsonClass):
+    __json_template__ = {"items": Attr(), "ids": Attr(annotation=ListView[int])}
+    __json_mutable__ = True
+    items: ListView[D]
+
+
+def _json(n: int = 10):
+    return {
+        "items": [{"name": f"n{i}", "value": i} for i in range(n)],
+        "ids": list(range(n)),
+    }
+
+
+def test_indexing(cls):
+    c = cls(_json())
+    assert isinstance(c.items, ListView)
+    assert len(c.items) == 10
+    assert isinstance(c.items[3], D)
+    assert c.items[3].name == "n3"
+    assert c.items[-1].value == 9
+    assert c.ids[2] == 2
+    with pytest.raises(IndexError):
+        c.items[10]
+
+
+def test_iteration(cls):
+    c = cls(_json())
+    assert [d.value for d in c.items] == list(range(10))
+    assert list(c.ids) == list(range(10))
+    assert 5 in c.ids
+    assert c.ids.index(4) == 4
+    assert [d.value for d in reversed(c.items)] == list(range(9, -1, -1))
+
+
+def test_slicing(cls):
+    js = _json()
+    c = cls(js)
+    view = c.items[2:8:2]
+    assert isinstance(view, ListView)
+    assert len(view) == 3
+    assert [d.value for d in view] == [2, 4, 6]
+    assert view[-1].value == 6
+    assert [d.value for d in view[::-1]] == [6, 4, 2]
+    assert view[1:][0].value == 4
+    assert c.ids[::-3].tolist() == [9, 6, 3, 0]
+    assert c.items[20:].tolist() == []
+    # no copy
+    assert view._data is js["items"]
+
+
+def test_write_through(cls):
+    js = _json()
+    c = cls(js)
+    c.items[5].name = "x"
+    assert js["items"][5]["name"] == "x"
+    c.ids[0] = 100
+    assert js["ids"][0] == 100
+    view = c.items[1::2]
+    view[0] = D({"name": "y", "value": -1})
+    assert js["items"][1] == {"name": "y", "value": -1}
+    view[1] = {"name": "z", "value": -2}
+    assert js["items"][3] == {"name": "z", "value": -2}
+    with pytest.raises(TypeError):
+        view[0:1] = []
+
+
+def test_set_attribute(cls):
+    js = _json()
+    c = cls(js)
+    c.ids = c.ids[:3]
+    assert js["ids"] == [0, 1, 2]
+    c.items = [{"name": "a", "value": 0}]
+    assert c.items[0].name == "a"
+
+
+def test_copy_on_tolist(cls):
+    js = _json()
+    c = cls(js)
+    out = c.ids.tolist()
+    out.append(10)
+    assert len(js["ids"]) == 10
+
+
+def test_not_a_list(cls):
+    c = cls({"items": {"a": 1}, "ids": []})
+    with pytest.raises(TypeError):
+        c.items
+
+
+def test_validation():
+    constructor = create_constructor({"items": Attr(annotation=ListView[int])})
+    assert validate({"items": [1, 2]}, constructor) == []
+    assert len(validate({"items": [1, "a"]}, constructor)) == 1
+
+
+def test_changes_tracked(cls, tmp_path):
+    path = tmp_path / "c.json"
+    c = cls(_json(3))
+    c.dump(path)
+    c = cls.load(path)
+    c.ids[-1] = 20
+    c.items[1:][0] = {"name": "x", "value": 10}
+    c.items[0].value = 30
+    assert c.json_patch() == [
+        {"op": "replace", "path": "/ids/2", "value": 20},
+        {"op": "replace", "path": "/items/1", "value": {"name": "x", "value": 10}},
+        {"op": "replace", "path": "/items/0/value", "value": 30},
+    ]
+    c.dump_incremental(path)
+    assert cls.load(path).json == c.json
+
+
+def test_equality(cls):
+    c = cls(_json(3))
+    assert c.ids == [0, 1, 2]
+    assert c.ids == c.ids
+    assert c.ids[1:] == [1, 2]
+    assert c.ids != [0, 1]
+    assert c.ids != (0, 1, 2)
+    docs = JsonCollection(cls, [_json(3), _json(2)])
+    assert docs.find("ids", [0, 1]) == [docs[1]]
@@ -0,0 +1,51 @@
+import json
+from pathlib import Path
+import pytest
+import elegant_json as ej
+from elegant_json import JsonClass, Attr
+
+root = Path(__file__).parent / "jsons"
+
+class C(JsonClass):
+    __json_template__ = {
+        "key1": {
+            "key1": Attr("arg1"),
+            "key2": {"key1": Attr("arg2"), "key2": ...},
+        }
+    }
+    arg1: int
+    arg2: str
+
+@pytest.mark.parametrize("selective", [False, True])
+def test_memory_map(selective):
+    c = C.load(root / "test3.json", memory_map=True, selective=selective)
+    assert type(c) is C
+    assert c.arg1 == 1
+    assert c.arg2 == "a"
+    if not selective:
+        assert c.json == C.load(root / "test3.json").json
+
+@pytest.mark.parametrize(
+    ["encoding", "text"],
+    [("utf-8", "ソ表ü"), ("utf-16", "ソ表ü"), ("shift_jis", "ソ表"), ("latin-1", "ü")],
+)
+@pytest.mark.parametrize("selective", [False, True])
+def test_encoding(tmp_path, encoding, text, selective):
+    doc = {"key1": {"key1": 0, "key0": text, "key2": {"key1": text}}}
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps(doc, ensure_ascii=False), encoding=encoding)
+    c0 = C.load(path, encoding=encoding, selective=selective)
+    c1 = C.load(path, encoding=encoding, selective=selective, memory_map=True)
+    assert c0.json == c1.json
+    assert c1.arg2 == doc["key1"]["key2"]["key1"]
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text("")
+    with pytest.raises(json.JSONDecodeError):
+        C.load(path, memory_map=True)
+
+def test_loader():
+    loader = ej.create_loader({"key1": [{"a": Attr("arg1")}, ...]})
+    c = loader(root / "test2.json", memory_map=True, selective=True)
+    assert c.arg1 == 1
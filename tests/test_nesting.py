@@ -78,3 +78,45 @@ def test_nested_json_class():
     
     assert c.arg.a == 0
     assert c.arg.b == []
+
+
+def test_nested_forwardref():
+    class C(JsonClass):
+        __json_template__ = {
+            "a": Attr(annotation=list["tuple[int, str]"]),
+            "b": Attr(annotation=dict[str, "list[float]"]),
+            "c": Attr(annotation=tuple[int, ...]),
+        }
+    
+    c = C({"a": [["1", "a"]], "b": {"x": ["1.5"]}, "c": ["1", "2", "3"]})
+    assert c.a == [(1, "a")]
+    assert c.b == {"x": [1.5]}
+    assert c.c == (1, 2, 3)
+
+
+def test_list_of_nested_json_class():
+    class D(JsonClass):
+        __json_template__ = {"id": Attr()}
+        id: int
+
+    class C(JsonClass):
+        __json_template__ = {"a": Attr()}
+        a: list[tuple[D, str]]
+
+    c = C({"a": [[{"id": "1"}, "x"], [{"id": "2"}, "y"]]})
+    assert [(d.id, s) for d, s in c.a] == [(1, "x"), (2, "y")]
+
+
+def test_converter_compiled_once(monkeypatch):
+    from elegant_json import _json_attribute
+
+    class C(JsonClass):
+        __json_template__ = {"a": Attr()}
+        a: list[list[tuple[int, str]]]
+
+    def _fail(annotation):
+        raise AssertionError("converter must not be rebuilt on access")
+    
+    monkeypatch.setattr(_json_attribute, "_define_converter", _fail)
+    c = C({"a": [[["1", "a"], ["2", "b"]]]})
+    assert c.a == [[(1, "a"), (2, "b")]]
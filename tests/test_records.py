@@ -0,0 +1,94 @@
+import pytest
+from elegant_json import JsonClass, Attr
+
+class Sub(JsonClass):
+    __json_template__ = {"x": Attr()}
+    x: int
+
+class C(JsonClass):
+    __json_template__ = {
+        "name": Attr(),
+        "data": {"b": Attr(), "a": Attr(default=-1), "fixed": "const"},
+        "sub": Attr(),
+        "pair": [Attr("first"), 0],
+    }
+    name: str
+    b: int
+    a: int
+    sub: Sub
+    first: float
+
+JSON = {
+    "name": "c",
+    "data": {"b": "1", "a": 2, "fixed": "const"},
+    "sub": {"x": 3},
+    "pair": [4, 0],
+}
+
+def test_attr_asdict_order_and_conversion():
+    d = C(JSON).attr_asdict()
+    assert list(d) == ["name", "b", "a", "sub", "first"]
+    assert d["b"] == 1
+    assert isinstance(d["sub"], Sub) and d["sub"].x == 3
+    assert d["first"] == 4.0
+
+def test_attr_astuple_matches_getattr():
+    c = C(JSON)
+    tup = c.attr_astuple()
+    assert tup[:3] == (c.name, c.b, c.a)
+    assert tup[3].json == c.sub.json
+    assert tup[4] == c.first
+
+def test_attr_asdict_default():
+    c = C({"name": "c", "data": {"b": 1}, "sub": {"x": 0}, "pair": [1]})
+    assert c.attr_asdict()["a"] == -1
+
+def test_record_round_trip():
+    c = C(JSON)
+    record = c.to_record()
+    assert record == ("c", "1", 2, {"x": 3}, 4)
+    [c2] = C.from_records([record])
+    assert c2.json == JSON
+    assert c2.json is not c.json
+
+def test_records_missing_values():
+    c = C({"name": "c"})
+    assert c.to_record() == ("c", None, None, None, None)
+    assert C.to_records([c, C(JSON)])[1] == C(JSON).to_record()
+
+def test_from_records_containers_are_new():
+    c1, c2 = C.from_records([C(JSON).to_record()] * 2)
+    assert c1.json["data"] is not c2.json["data"]
+    assert c1.json["pair"] is not c2.json["pair"]
+
+def test_from_records_wrong_length():
+    with pytest.raises(ValueError):
+        C.from_records([("c", 1)])
+
+def test_records_inherited():
+    class D(C):
+        pass
+    
+    [d] = D.from_records([C(JSON).to_record()])
+    assert isinstance(d, D)
+    assert d.attr_astuple()[0] == "c"
+
+class Overridden(C):
+    @property
+    def b(self) -> int:
+        return 100
+
+def test_plain_property_override():
+    c = Overridden(JSON)
+    assert c.attr_asdict()["b"] == 100
+    assert c.attr_astuple()[1] == 100
+    assert C.extract([C(JSON)], fields=["b"])["b"].tolist() == [1]
+    assert Overridden.extract([c, JSON], fields=["name", "b"]) == {
+        "name": ["c", "c"], "b": [100, 100]
+    }
+
+def test_extract_dict_subclass():
+    from collections import OrderedDict
+
+    out = C.extract([OrderedDict(JSON)], fields=["name", "b"])
+    assert out["name"] == ["c"] and out["b"].tolist() == [1]
@@ -0,0 +1,92 @@
+import json
+import pytest
+import elegant_json as ej
+from elegant_json import JsonClass, Attr
+from elegant_json._json_scan import scan_json
+
+class C(JsonClass):
+    __json_template__ = {
+        "title": Attr(),
+        "data": {
+            "values": Attr(),
+            "meta": {"id": Attr()},
+        },
+        "items": [0, Attr("second")],
+        "irrelevant": ...,
+    }
+    title: str
+    values: list[int]
+    id: int
+    second: str
+
+DOC = {
+    "title": "T\\u00e9あ\"",
+    "skip0": {"a": [1, {"b": "}]{["}], "c": '\\"', 'sk\\"ip4': 1, "d": None},
+    "data": {
+        "values": [1, 2, 3],
+        "skip1": [[], {}, "x", 1.5e3, True, False, None],
+        "meta": {"id": 4, "skip2": "aaa"},
+    },
+    "items": ["a", "b", "c"],
+    "irrelevant": {"x": list(range(10))},
+    "skip3": -1,
+}
+
+EXPECTED = {
+    "title": DOC["title"],
+    "data": {"values": [1, 2, 3], "meta": {"id": 4}},
+    "items": ["a", "b", "c"],
+}
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("as_bytes", [False, True])
+def test_scan(indent, as_bytes):
+    s = json.dumps(DOC, indent=indent, ensure_ascii=False)
+    if as_bytes:
+        s = s.encode("utf-8")
+    assert scan_json(s, C._json_key_tree) == EXPECTED
+
+def test_scan_utf16():
+    s = json.dumps(DOC).encode("utf-16")
+    assert scan_json(s, C._json_key_tree) == EXPECTED
+
+def test_loads_selective():
+    c = C.loads(json.dumps(DOC), selective=True)
+    assert c.json == EXPECTED
+    assert (c.title, c.values, c.id, c.second) == (DOC["title"], [1, 2, 3], 4, "b")
+
+def test_load_selective(tmp_path):
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps(DOC, indent=4), encoding="utf-8")
+    c = C.load(path, encoding="utf-8", selective=True)
+    assert c.json == EXPECTED
+    loader = ej.create_loader(
+        {"data": {"values": Attr(), "meta": ...}, "skip3": Attr()}
+    )
+    c = loader(path, encoding="utf-8", selective=True)
+    assert c.json == {"data": {"values": [1, 2, 3]}, "skip3": -1}
+
+def test_missing_keys():
+    c = C.loads('{"data": {"meta": {"x": 1}}, "other": [1, 2]}', selective=True)
+    assert c.json == {"data": {"meta": {}}}
+    assert c.values is None
+    assert not ej.isformatted(c.json, C)
+
+@pytest.mark.parametrize(
+    "s",
+    ['{"title": 1', '{"a": [1, 2}', '[1, 2]', '{"title": 1} 0', '{"a" 1}', '{"a": "x}'],
+)
+def test_invalid(s):
+    with pytest.raises(json.JSONDecodeError):
+        C.loads(s, selective=True)
+
+def test_subclass_inherits_key_tree():
+    class B(C):
+        pass
+    
+    assert B._json_properties == C._json_properties
+    assert B.loads(json.dumps(DOC), selective=True).json == EXPECTED
+
+def test_escaped_key():
+    c = C.loads('{"\\u0074itle": "x", "t\\u0069tle2": 0}', selective=True)
+    assert c.json == {"title": "x"}
@@ -0,0 +1,109 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from elegant_json import JsonClass, Attr, SharedDocuments, diff
+
+
+class C(JsonClass):
+    __json_template__ = {"id": Attr(), "info": {"name": Attr(), "tags": Attr()}}
+    __json_mutable__ = True
+    id: int
+    name: str
+
+
+def _objs(n: int = 20):
+    objs = [C({"id": i, "info": {"name": f"n{i}", "tags": [i]}}) for i in range(n)]
+    objs.append(C({"id": -1, "extra": True}))
+    return objs
+
+
+def _sum_ids(shared: SharedDocuments) -> int:
+    try:
+        return sum(c.id for c in shared)
+    finally:
+        shared.close()
+
+
+def _name_at(args) -> str:
+    shared, i = args
+    try:
+        return shared[i].name
+    finally:
+        shared.close()
+
+
+def test_access():
+    objs = _objs()
+    with C.to_shared(objs) as shared:
+        assert len(shared) == len(objs)
+        assert isinstance(shared[3], C)
+        assert shared[3].name == "n3"
+        assert shared[-1].json == {"id": -1, "extra": True}
+        assert [c.json for c in shared] == [c.json for c in objs]
+        assert [c.id for c in shared[2:5]] == [2, 3, 4]
+        with pytest.raises(IndexError):
+            shared[len(objs)]
+
+
+def test_read_only():
+    with C.to_shared(_objs()) as shared:
+        c = shared[0]
+        with pytest.raises(AttributeError):
+            c.id = 10
+        assert shared[0].id == 0
+
+
+def test_pickle_attach():
+    with C.to_shared(_objs()) as shared:
+        data = pickle.dumps(shared)
+        assert len(data) < 200
+        other = pickle.loads(data)
+        assert other.name == shared.name
+        assert other[5].name == "n5"
+        other.close()
+        with pytest.raises(ValueError):
+            other[0]
+        assert shared[5].name == "n5"
+
+
+def _first(shared: SharedDocuments) -> C:
+    try:
+        return shared[0]
+    finally:
+        shared.close()
+
+
+def test_pickle_object():
+    with C.to_shared(_objs()) as shared:
+        c = pickle.loads(pickle.dumps(shared[1]))
+        assert type(c) is C
+        assert c.json == shared[1].json
+        c.id = 10  # writable again
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            out = executor.submit(_first, shared).result()
+        assert type(out) is C and out.id == 0
+
+
+def test_diff_with_shared():
+    with C.to_shared(_objs()) as shared:
+        assert diff(shared[0], C(shared[0].json)) == []
+        assert diff(shared[0], C({"id": 5, "info": {"name": "n0", "tags": [0]}})) == [
+            {"op": "replace", "path": "/id", "value": 5}
+        ]
+        assert diff(C({}), shared[1]) != []
+
+
+def test_workers():
+    objs = _objs()
+    with C.to_shared(objs) as shared:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            sums = list(executor.map(_sum_ids, [shared] * 3))
+            names = list(executor.map(_name_at, [(shared, i) for i in range(3)]))
+    assert sums == [sum(c.id for c in objs)] * 3
+    assert names == ["n0", "n1", "n2"]
+
+
+def test_empty():
+    with C.to_shared([]) as shared:
+        assert len(shared) == 0
+        assert list(shared) == []
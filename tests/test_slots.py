@@ -0,0 +1,96 @@
+import pickle
+import pytest
+import elegant_json as ej
+from elegant_json import JsonClass, Attr
+
+class D(JsonClass):
+    __json_template__ = {"x": Attr()}
+    __json_slots__ = True
+    __json_mutable__ = True
+    x: int
+
+class C(JsonClass):
+    __json_template__ = {"d": Attr(), "ds": Attr()}
+    __json_slots__ = True
+    __json_mutable__ = True
+    d: D
+    ds: list[D]
+
+def test_slotted_instance():
+    c = C({"d": {"x": 1}, "ds": []})
+    assert not hasattr(c, "__dict__")
+    with pytest.raises(AttributeError):
+        c.other = 0  # type: ignore
+    assert c.d.x == 1
+    assert pickle.loads(pickle.dumps(c)).json == c.json
+
+def test_not_slotted_by_default():
+    class E(JsonClass):
+        __json_template__ = {"x": Attr()}
+    
+    e = E({"x": 0})
+    e.other = 1  # type: ignore
+    assert e.__dict__ == {"other": 1}
+
+def test_slotted_constructor():
+    cls = ej.create_constructor({"a": Attr()}, slots=True)
+    obj = cls({"a": 1})
+    assert not hasattr(obj, "__dict__")
+    assert obj.a == 1  # type: ignore
+    assert pickle.loads(pickle.dumps(cls)) is cls
+
+def test_nested_wrapper_reused():
+    c = C({"d": {"x": 1}, "ds": []})
+    d = c.d
+    assert c.d is d
+    c.d.x = 2
+    assert d.x == 2
+    
+    # a new wrapper is created after the dict is replaced
+    c.d = {"x": 3}
+    assert c.d is not d
+    assert c.d.x == 3
+    c.json["d"] = {"x": 4}
+    assert c.d.x == 4
+    del c.json["d"]
+    assert c.d is None
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_jsonclass_with_slotted_class(slots):
+    @ej.jsonclass({"x": Attr()}, mutable=True, slots=slots)
+    class S:
+        __slots__ = ("extra",)
+        x: int
+
+        def total(self):
+            return self.x + self.extra
+
+        def __repr__(self):
+            return f"S({super().__repr__()})"
+
+    s = S({"x": 1})
+    s.extra = 2
+    s.x = 3
+    assert s.json == {"x": 3} and s.total() == 5
+    assert hasattr(s, "__dict__") is not slots
+    assert isinstance(s, JsonClass)
+    assert repr(s) == "S(<S object>)"
+
+def test_base_class_instance():
+    obj = JsonClass({"a": 1})
+    assert obj.json == {"a": 1}
+    assert obj.json_patch() == []
+
+def test_multiple_inheritance():
+    class E(JsonClass):
+        __json_template__ = {"x": Attr()}
+        x: int
+    
+    class F(JsonClass):
+        __json_template__ = {"y": Attr()}
+        y: int
+    
+    class G(E, F):
+        pass
+    
+    assert G({"x": 1}).x == 1
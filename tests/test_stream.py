@@ -0,0 +1,78 @@
+import io
+import json
+import pytest
+import elegant_json as ej
+from elegant_json import JsonClass, Attr
+from elegant_json._json_backend import get_backend
+from elegant_json._json_stream import _iter_array
+
+class C(JsonClass):
+    __json_template__ = {"id": Attr(), "data": {"value": Attr()}}
+    id: int
+    value: float
+
+RECORDS = [{"id": i, "data": {"value": i * 1.5, "tags": ["x", "y"]}} for i in range(50)]
+
+def _check(objs):
+    objs = list(objs)
+    assert all(type(c) is C for c in objs)
+    assert [c.json for c in objs] == RECORDS
+    assert objs[3].value == 4.5
+
+@pytest.mark.parametrize("format", ["lines", "array"])
+@pytest.mark.parametrize("auto", [False, True])
+def test_round_trip(tmp_path, format, auto):
+    path = tmp_path / "records.json"
+    C.iter_dump(path, (C(r) for r in RECORDS), format=format)
+    it = C.iter_load(path, format="auto" if auto else format)
+    assert iter(it) is it
+    _check(it)
+
+def test_iter_load_lines_with_blank(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in RECORDS) + "\n\n")
+    _check(C.iter_load(path))
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_array_chunks(chunk_size, indent):
+    records = RECORDS + [{"id": 123456789, "data": {"value": -1.25e-10}}]
+    f = io.StringIO("  " + json.dumps(records, indent=indent) + "\n")
+    assert list(_iter_array(f, chunk_size)) == records
+
+def _loads(s):
+    # not json.loads, to find the end of each value before decoding it
+    return json.loads(s)
+
+@pytest.mark.parametrize("loads", [_loads] + [
+    get_backend(name).loads for name in ej.available_backends()
+])
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_array_backend(loads, chunk_size, indent):
+    records = RECORDS + [
+        {"id": 123456789, "data": {"value": -1.25e-10}},
+        '"]}[{,\\', 12345678901234567890, -0.5, None, [], {}, [[{"a": "]"}]],
+    ]
+    f = io.StringIO("  " + json.dumps(records, indent=indent) + "\n")
+    assert list(_iter_array(f, chunk_size, loads)) == records
+
+def test_iter_array_of_numbers():
+    f = io.StringIO("[1234, 5678]")
+    assert list(_iter_array(f, 2)) == [1234, 5678]
+
+@pytest.mark.parametrize("s", ["[]", " [ ] "])
+def test_empty_array(s):
+    assert list(_iter_array(io.StringIO(s), 1)) == []
+
+@pytest.mark.parametrize("s", ['[{"a": 1} {"a": 2}]', '[{"a": 1}, {"a": ]', '{"a": 1}', '[{"a": 1},'])
+@pytest.mark.parametrize("loads", [json.loads, _loads])
+def test_invalid_array(s, loads):
+    with pytest.raises(json.JSONDecodeError):
+        list(_iter_array(io.StringIO(s), 4, loads))
+
+def test_iter_loader(tmp_path):
+    path = tmp_path / "records.jsonl"
+    C.iter_dump(path, [C(r) for r in RECORDS])
+    loader = ej.create_iter_loader({"id": Attr(), "data": ...})
+    assert [c.id for c in loader(path)] == list(range(50))  # type: ignore
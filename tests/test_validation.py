@@ -0,0 +1,124 @@
+import pytest
+import elegant_json as ej
+from elegant_json import JsonClass, Attr, Violation
+
+class D(JsonClass):
+    __json_template__ = {"id": Attr(), "name": Attr()}
+    id: int
+    name: str
+
+class C(JsonClass):
+    __json_template__ = {
+        "title": Attr(),
+        "data": {
+            "values": Attr(),
+            "pairs": Attr(),
+            "table": Attr(),
+            "d": Attr(),
+            "ds": Attr(),
+        },
+        "any": Attr(),
+        "rest": [Attr("first"), Attr("second")],
+    }
+    title: str
+    values: list[int]
+    pairs: "list[tuple[float, str]]"
+    table: dict[str, bool]
+    d: D
+    ds: list[D]
+    second: float
+
+VALID = {
+    "title": "t",
+    "data": {
+        "values": [1, 2],
+        "pairs": [[1, "a"], [1.5, "b"]],
+        "table": {"x": True},
+        "d": {"id": 1, "name": "n"},
+        "ds": [{"id": 2, "name": "m"}],
+    },
+    "any": None,
+    "rest": [{}, 0.5],
+}
+
+def test_valid():
+    assert ej.validate(VALID, C) == []
+    assert ej.validate(VALID, C, fail_fast=True) == []
+
+def test_type_violations():
+    obj = {
+        "title": 1,
+        "data": {
+            "values": "oops",
+            "pairs": [[1, "a", 2], ["x", "b"]],
+            "table": {"x": 1},
+            "d": {"id": True},
+            "ds": [{"id": 2, "name": "m"}, 0],
+        },
+        "any": {},
+        "rest": [0, "1"],
+    }
+    assert ej.isformatted(obj, C) is True
+    assert ej.validate(obj, C) == [
+        Violation(("title",), "expected str, got int"),
+        Violation(("data", "values"), "expected list, got str"),
+        Violation(("data", "pairs", 0), "expected 2 items, got 3"),
+        Violation(("data", "pairs", 1, 0), "expected int or float, got str"),
+        Violation(("data", "table", "x"), "expected bool, got int"),
+        Violation(("data", "d", "id"), "expected int, got bool"),
+        Violation(("data", "d", "name"), "missing"),
+        Violation(("data", "ds", 1), "expected dict, got int"),
+        Violation(("rest", 1), "expected int or float, got str"),
+    ]
+
+def test_missing():
+    obj = {"data": {"values": [], "d": 1}, "rest": [1]}
+    assert ej.validate(obj, C) == [
+        Violation(("title",), "missing"),
+        Violation(("data", "pairs"), "missing"),
+        Violation(("data", "table"), "missing"),
+        Violation(("data", "d"), "expected dict, got int"),
+        Violation(("data", "ds"), "missing"),
+        Violation(("any",), "missing"),
+        Violation(("rest", 1), "missing"),
+    ]
+
+def test_fail_fast():
+    obj = {"title": 1, "data": {}}
+    assert ej.validate(obj, C, fail_fast=True) == [
+        Violation(("title",), "expected str, got int"),
+    ]
+
+def test_not_a_dict():
+    assert ej.validate([], C) == [Violation((), "expected dict, got list")]
+    with pytest.raises(TypeError):
+        ej.validate({}, dict)  # type: ignore
+
+def test_validator_is_compiled_once():
+    from elegant_json._json_validation import get_validator
+    assert get_validator(C) is get_validator(C)
+
+def test_item_violation_in_list():
+    obj = dict(VALID, data=dict(VALID["data"], values=[1, "2", 3.0]))
+    assert ej.validate(obj, C) == [
+        Violation(("data", "values", 1), "expected int, got str"),
+        Violation(("data", "values", 2), "expected int, got float"),
+    ]
+
+def test_array_attribute():
+    np = pytest.importorskip("numpy")
+
+    class A(JsonClass):
+        __json_template__ = {
+            "x": Attr(annotation=float, array=True),
+            "y": Attr(),
+            "z": Attr(annotation=list[list[int]], array=True),
+        }
+        y: np.ndarray
+    
+    assert ej.validate({"x": [1.0, 2], "y": ["a", 1], "z": [[1, 2], [3, 4]]}, A) == []
+    assert ej.validate({"x": 1.0, "y": [], "z": [[1, "2"], 3, [True]]}, A) == [
+        Violation(("x",), "expected list, got float"),
+        Violation(("z", 0, 1), "expected int or float, got str"),
+        Violation(("z", 2, 0), "expected int or float, got bool"),
+    ]